@@ -8,7 +8,7 @@ import os
 import json
 import asyncio
 from datetime import datetime, timedelta
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session, Response, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import func
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
@@ -1036,6 +1036,49 @@ def chat():
             }
         })
 
+@app.route('/api/chat/stream', methods=['POST'])
+def chat_stream():
+    """Stream chat replies as server-sent events; skill answers stream while the LLM generates them."""
+    try:
+        data = request.get_json()
+        message = data.get('message', '')
+        user_id = data.get('user_id', 'anonymous')
+        
+        def generate():
+            # Drive the async generator from this worker thread on a dedicated loop
+            loop = asyncio.new_event_loop()
+            chunks = None
+            try:
+                chunks = devcareer_components['chatbot'].chat_stream(user_id, message)
+                while True:
+                    try:
+                        chunk = loop.run_until_complete(chunks.__anext__())
+                    except StopAsyncIteration:
+                        break
+                    yield f"data: {json.dumps({'chunk': chunk})}\n\n"
+            except Exception as e:
+                logger.error(f"Error in chat stream: {e}")
+                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            finally:
+                if chunks is not None:
+                    loop.run_until_complete(chunks.aclose())
+                loop.close()
+            yield "data: [DONE]\n\n"
+        
+        return Response(stream_with_context(generate()), mimetype='text/event-stream')
+        
+    except Exception as e:
+        logger.error(f"Error in chat stream API: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'response': {
+                'message': "Sorry, I encountered an error. Please try again.",
+                'confidence': 0.0,
+                'intent': 'error'
+            }
+        })
+
 @app.route('/api/graph_rag', methods=['POST'])
 def graph_rag_query():
     """Graph RAG query endpoint."""
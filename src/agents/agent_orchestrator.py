@@ -75,14 +75,12 @@ class AgentOrchestrator:
             # Step 1: Skill Analysis
             skill_analysis = await self._analyze_skills(developer_data)
             
-            # Step 2: Career Path Analysis
-            career_analysis = await self._analyze_career_paths(developer_data, skill_analysis)
-            
-            # Step 3: Learning Path Generation
-            learning_path = await self._generate_learning_path(developer_data, skill_analysis, career_analysis)
-            
-            # Step 4: Market Analysis
-            market_analysis = await self._analyze_market_demand(developer_data, skill_analysis)
+            # Steps 2-4: Career Path Analysis -> Learning Path Generation, alongside Market
+            # Analysis, which only depends on the skill analysis
+            (career_analysis, learning_path), market_analysis = await asyncio.gather(
+                self._analyze_career_and_learning_path(developer_data, skill_analysis),
+                self._analyze_market_demand(developer_data, skill_analysis)
+            )
             
             # Step 5: Generate Final Recommendations
             final_recommendations = await self._generate_final_recommendations(
@@ -138,13 +136,15 @@ class AgentOrchestrator:
                 'topics': developer_data.get('topics', [])
             }
             
-            # Process skill analysis
-            skill_results = await skill_analyzer.process_task(task_data)
-            
-            # Additional LLM-based skill extraction
+            # Process skill analysis, with additional LLM-based skill extraction from the bio
             if developer_data.get('bio'):
-                bio_skills = await skill_analyzer.analyze_with_llm(developer_data['bio'], 'skills')
+                skill_results, bio_skills = await asyncio.gather(
+                    skill_analyzer.process_task(task_data),
+                    skill_analyzer.analyze_with_llm(developer_data['bio'], 'skills')
+                )
                 skill_results['bio_analysis'] = bio_skills
+            else:
+                skill_results = await skill_analyzer.process_task(task_data)
             
             return skill_results
             
@@ -152,6 +152,13 @@ class AgentOrchestrator:
             logger.error(f"Error in skill analysis: {e}")
             return {"error": str(e)}
     
+    async def _analyze_career_and_learning_path(self, developer_data: Dict[str, Any],
+                                                skill_analysis: Dict[str, Any]) -> tuple:
+        """Analyze career paths, then generate the learning path that builds on them."""
+        career_analysis = await self._analyze_career_paths(developer_data, skill_analysis)
+        learning_path = await self._generate_learning_path(developer_data, skill_analysis, career_analysis)
+        return career_analysis, learning_path
+    
     async def _analyze_career_paths(self, developer_data: Dict[str, Any], skill_analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze career paths using the career advisor agent."""
         try:
@@ -194,7 +201,7 @@ class AgentOrchestrator:
                     target_skills.extend(missing_skills[:3])  # Top 3 missing skills per path
             
             # Remove duplicates
-            target_skills = list(set(target_skills))
+            target_skills = list(dict.fromkeys(target_skills))
             
             if not target_skills:
                 target_skills = ['Python', 'JavaScript', 'React']  # Default skills
@@ -4,7 +4,9 @@ Provides the foundation for all specialized AI agents.
 """
 
 import asyncio
+import hashlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import json
@@ -14,6 +16,32 @@ from src.utils.logger import get_application_logger
 
 logger = get_application_logger(__name__)
 
+# Analyses are cached per agent by (text digest, analysis type), evicting least recently used
+ANALYSIS_CACHE_SIZE = 1024
+
+# Result structure for each analysis type, used to batch several analyses into one prompt
+_ANALYSIS_SCHEMAS = {
+    'skills': (
+        "programming skills, technologies, and tools mentioned",
+        '{"skills": ["skill1", ...], "technologies": ["tech1", ...], "tools": ["tool1", ...], "confidence": 0.95}'
+    ),
+    'career_level': (
+        "the career level and experience of the developer",
+        '{"career_level": "junior|mid|senior|expert", "years_experience": 5, "confidence": 0.9, "reasoning": "explanation"}'
+    ),
+    'interests': (
+        "the developer's interests and focus areas",
+        '{"interests": ["interest1", ...], "focus_areas": ["area1", ...], "passion_topics": ["topic1", ...]}'
+    )
+}
+
+_BATCH_ANALYSIS_PROMPT = (
+    "Analyze the following text and return a single JSON object with one key per analysis below.\n"
+    "The value for each key must be a JSON object with the structure shown.\n\n"
+    "{sections}\n\n"
+    "Text: {text}\n"
+).format
+
 
 class BaseAgent(ABC):
     """Abstract base class for all AI agents."""
@@ -32,6 +60,7 @@ class BaseAgent(ABC):
         self.config = kwargs
         self.conversation_history = []
         self.task_results = {}
+        self._analysis_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
         
         logger.info(f"Initialized agent: {name}")
     
@@ -95,17 +124,21 @@ class BaseAgent(ABC):
             analysis_type: Type of analysis
             
         Returns:
-            Analysis results
+            Analysis results (empty for blank text)
         """
+        # Nothing to analyze (e.g. an unfilled profile); skip the LLM round-trip
+        if not text or not text.strip():
+            return {}
+        
+        cached = self._get_cached_analysis(text, analysis_type)
+        if cached is not None:
+            return cached
+        
         try:
             results = await self.llm_client.analyze_text(text, analysis_type)
             
             # Store results
-            self.task_results[analysis_type] = {
-                'timestamp': datetime.now().isoformat(),
-                'text': text,
-                'results': results
-            }
+            self._record_analysis(text, analysis_type, results)
             
             return results
             
@@ -113,6 +146,86 @@ class BaseAgent(ABC):
             logger.error(f"Error analyzing text for agent {self.name}: {e}")
             return {"error": str(e)}
     
+    async def analyze_with_llm_multi(self, text: str, analysis_types: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run several analyses of the same text in a single LLM call.
+        
+        Blank text yields empty results without an LLM call, and analyses already
+        cached for this text are not requested again. Falls back to
+        one analyze_with_llm call per type (run concurrently) if the batched response
+        is not a JSON object containing every requested analysis.
+        
+        Args:
+            text: Text to analyze
+            analysis_types: Types of analysis, e.g. ['skills', 'interests']
+            
+        Returns:
+            Analysis results keyed by analysis type
+        """
+        if not text or not text.strip():
+            return {analysis_type: {} for analysis_type in analysis_types}
+        
+        results = {}
+        for analysis_type in analysis_types:
+            cached = self._get_cached_analysis(text, analysis_type)
+            if cached is not None:
+                results[analysis_type] = cached
+        analysis_types = [analysis_type for analysis_type in analysis_types if analysis_type not in results]
+        
+        if len(analysis_types) > 1 and all(analysis_type in _ANALYSIS_SCHEMAS for analysis_type in analysis_types):
+            sections = "\n".join(
+                f'"{analysis_type}": {_ANALYSIS_SCHEMAS[analysis_type][0]}\n{_ANALYSIS_SCHEMAS[analysis_type][1]}'
+                for analysis_type in analysis_types
+            )
+            
+            try:
+                response = await self.llm_client.generate_text(
+                    _BATCH_ANALYSIS_PROMPT(sections=sections, text=text),
+                    temperature=0.3,
+                    max_tokens=500 * len(analysis_types)
+                )
+                batched = json.loads(response)
+                
+                if isinstance(batched, dict) and all(
+                    isinstance(batched.get(analysis_type), dict) for analysis_type in analysis_types
+                ):
+                    for analysis_type in analysis_types:
+                        self._record_analysis(text, analysis_type, batched[analysis_type])
+                        results[analysis_type] = batched[analysis_type]
+                    return results
+                
+            except (json.JSONDecodeError, TypeError):
+                logger.warning(f"Batched analysis for agent {self.name} was not valid JSON; analyzing individually")
+            except Exception as e:
+                logger.error(f"Error in batched analysis for agent {self.name}: {e}")
+        
+        individual = await asyncio.gather(
+            *(self.analyze_with_llm(text, analysis_type) for analysis_type in analysis_types)
+        )
+        results.update(zip(analysis_types, individual))
+        return results
+    
+    def _get_cached_analysis(self, text: str, analysis_type: str) -> Optional[Dict[str, Any]]:
+        """Return a previously computed analysis of the same text, if still cached."""
+        key = (hashlib.sha1(text.encode()).digest(), analysis_type)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(key)
+        return cached
+    
+    def _record_analysis(self, text: str, analysis_type: str, results: Dict[str, Any]):
+        """Store analysis results in task_results and, unless they are an error, the cache."""
+        self.task_results[analysis_type] = {
+            'timestamp': datetime.now().isoformat(),
+            'text': text,
+            'results': results
+        }
+        
+        if isinstance(results, dict) and 'error' not in results:
+            self._analysis_cache[(hashlib.sha1(text.encode()).digest(), analysis_type)] = results
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+    
     def get_conversation_history(self) -> List[Dict[str, Any]]:
         """
         Get the agent's conversation history.
@@ -135,6 +248,7 @@ class BaseAgent(ABC):
         """Clear conversation history and task results."""
         self.conversation_history.clear()
         self.task_results.clear()
+        self._analysis_cache.clear()
         logger.info(f"Cleared history for agent: {self.name}")
     
     def get_agent_info(self) -> Dict[str, Any]:
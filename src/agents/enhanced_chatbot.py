@@ -5,12 +5,23 @@ Uses vector search, career analysis, and real data for intelligent responses
 """
 
 import asyncio
+import functools
+import hashlib
 import re
-from typing import Dict, Any, List, Optional
+import time
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass
+from heapq import nlargest
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Any, List, Optional, AsyncIterator
 from datetime import datetime
 import json
 
-from src.vector_store.qdrant_client import QdrantVectorClient
+import numpy as np
+from sqlalchemy import func, select
+
+from src.vector_store.qdrant_client import qdrant_client
 from src.embeddings.embedding_generator import embedding_generator
 from src.database.connection import db_manager
 from src.database.models import Developer, Skill, Repository, JobPosting, JobSkill
@@ -20,16 +31,455 @@ from src.utils.logger import get_application_logger
 
 logger = get_application_logger(__name__)
 
+# Intent patterns compiled once at import
+_REPO_GENERAL_INTENT_RE = re.compile(r'\b(what is|explain|tell me about)\b', re.IGNORECASE)
+_DEV_INTENT_RE = re.compile(r'\b(who is|find developers|popular developer)\b', re.IGNORECASE)
+
+# Dispatcher triggers: each keyword list is fused into one alternation that matches
+# anywhere in the lowercased message, i.e. the same test as any(k in message)
+def _keyword_re(*keywords: str) -> "re.Pattern":
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+_SKILL_INTENT_RE = _keyword_re(
+    'skill', 'technology', 'learn', 'programming', 'language', 'skills do i need', 'what skills',
+    'which skills', 'skills are', 'skills in', 'high demand', 'demand'
+)
+_GREETING_RE = _keyword_re('hello', 'hi', 'hey', 'greetings')
+_REPOSITORY_RE = _keyword_re('repository', 'repo', 'github', 'gitlab', 'bitbucket', 'project', 'codebase')
+_SPECIFIC_SKILL_RE = _keyword_re(
+    'python', 'javascript', 'java', 'react', 'node.js', 'sql', 'docker', 'kubernetes', 'aws', 'git',
+    'html', 'css', 'typescript', 'vue', 'angular', 'mongodb', 'postgresql', 'redis', 'nginx', 'linux',
+    'bash', 'php', 'ruby', 'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'tensorflow',
+    'pytorch', 'scikit-learn', 'pandas', 'numpy', 'jupyter'
+)
+_SKILL_QUERY_PATTERN_RE = _keyword_re(
+    'tell me about', 'what is', 'explain', 'details on', 'more details on',
+    'how to use', 'learn', 'information about', 'guide to'
+)
+_DEVELOPER_RE = _keyword_re(
+    'developer', 'programmer', 'coder', 'who is', 'find developers', 'popular developer', 'most popular',
+    'developers working on', 'developers who', 'working on'
+)
+_SALARY_RE = _keyword_re(
+    'salary', 'pay', 'money', 'earn', 'income', 'compensation', 'wage',
+    "what's the salary", 'how much', 'salary for', 'pay for', 'earn as'
+)
+_CAREER_RE = _keyword_re('career', 'role', 'path', 'data science', 'data scientist')
+_JOB_RE = _keyword_re(
+    'job posting', 'job listing', 'job opening', 'hiring', 'recruitment', 'job market', 'employment',
+    'jobs in', 'positions in', 'job opportunities'
+)
+_LEARNING_RE = _keyword_re('learn', 'study', 'course', 'tutorial', 'roadmap')
+_AI_RE = _keyword_re(
+    'ai engineer', 'artificial intelligence', 'machine learning engineer', 'ml engineer', 'ai developer',
+    'ai engineering', 'ai trends', 'ai trend', 'latest ai', 'ai technology', 'ai developments', 'ai news',
+    'ai updates'
+)
+_TECHNOLOGY_RE = _keyword_re('python', 'javascript', 'react', 'node', 'sql', 'docker')
+
+# Whole-word keyword triggers, tested against the set of tokens in the lowercased message
+_TOKEN_RE = re.compile(r"[a-z]+")
+_AI_SALARY_WORDS = frozenset({
+    'salary', 'salaries', 'pay', 'paid', 'money', 'earn', 'earns', 'earning', 'earnings', 'income'
+})
+_AI_TRENDS_WORDS = frozenset({
+    'trend', 'trends', 'trending', 'latest', 'new', 'news', 'emerging', 'recent', 'current'
+})
+# AI-relevance filters for retrieved trend context (one regex pass per item); whole words,
+# with an optional plural so "LLMs" or "data scientists" still count
+_AI_SKILL_TERM_RE = re.compile(
+    r'\b(ai|machine learning|deep learning|neural|tensorflow|pytorch|scikit|rag|llm|vector)s?\b', re.IGNORECASE
+)
+_AI_JOB_TERM_RE = re.compile(r'\b(ai|machine learning|data scientist|ml engineer)s?\b', re.IGNORECASE)
+_AI_CAREER_TERM_RE = re.compile(r'\b(ai|data scientist|machine learning)s?\b', re.IGNORECASE)
+
+# Graph RAG query types in priority order
+_QUERY_TYPE_WORDS = (
+    ('career_guidance', frozenset({
+        'career', 'careers', 'path', 'paths', 'transition', 'advancement', 'growth', 'development'
+    })),
+    ('skill_analysis', frozenset({
+        'skill', 'skills', 'technology', 'technologies', 'learn', 'learning', 'master', 'improve', 'gap', 'gaps'
+    })),
+    ('networking', frozenset({
+        'network', 'networking', 'connect', 'collaborate', 'mentor', 'mentors', 'mentorship', 'community'
+    })),
+    ('learning_path', frozenset({
+        'study', 'course', 'courses', 'roadmap', 'curriculum'
+    })),
+    ('job_market', frozenset({
+        'job', 'jobs', 'market', 'opportunity', 'opportunities', 'position', 'positions', 'role', 'roles'
+    })),
+    ('project_ideas', frozenset({
+        'project', 'projects', 'build', 'building', 'create', 'develop', 'portfolio'
+    })),
+)
+
+# Line formatters for the structured (non-LLM) skill response
+_SKILL_LINE = "• **{skill_name}** (Market Demand: {demand})".format
+_JOB_LINE = "• **{title}** at {company}".format
+_CAREER_LINE = "• **{path_name}** - {description}".format
+_LEARNING_RECOMMENDATIONS = (
+    "\n## 📚 Learning Recommendations\n\n"
+    "Based on current market trends, I recommend focusing on skills that combine technical expertise "
+    "with practical applications. Consider building projects that showcase these skills and stay "
+    "updated with industry developments."
+)
+
+# Prompt for RAG-backed skill advice; only the question and retrieved context vary
+_SKILL_PROMPT = (
+    "\n"
+    "You are an expert career advisor specializing in technology skills and career development. \n"
+    "Based on the following real data from job market, skills database, and career paths, provide a comprehensive and natural answer to the user's question.\n"
+    "\n"
+    "User Question: {message}\n"
+    "\n"
+    "Context Data:\n"
+    "{context}\n"
+    "\n"
+    "Please provide a detailed, conversational response that includes:\n"
+    "1. A clear analysis of high-demand skills based on the data\n"
+    "2. Market insights about these skills and why they're valuable\n"
+    "3. Career opportunities and typical salary ranges\n"
+    "4. Specific learning recommendations and resources\n"
+    "5. Future trends and how to stay competitive\n"
+    "\n"
+    "Write in a natural, conversational tone as if you're speaking directly to the user. Use markdown formatting for better readability. Make sure your response is at least 200 words and provides actionable insights.\n"
+).format
+
+# Prompt for RAG-backed AI-trends answers; the static instructions come first and
+# only the trailing question and retrieved context vary between calls
+_AI_TRENDS_PROMPT = (
+    "\n"
+    "You are an AI career assistant with expertise in AI trends and developments. Use the following context to answer the user's question about AI trends.\n"
+    "\n"
+    "Instructions:\n"
+    "1. Use the provided context to give accurate, up-to-date information about AI trends\n"
+    "2. Focus on practical applications and career implications\n"
+    "3. If the context doesn't fully answer the question, supplement with your knowledge of current AI trends\n"
+    "4. Structure your response with clear headings and bullet points\n"
+    "5. Include specific examples and career opportunities where relevant\n"
+    "\n"
+    "Please provide a comprehensive, well-structured response about AI trends based on the context and your knowledge.\n"
+    "\n"
+    "User Question: {message}\n"
+    "\n"
+    "Relevant Context:\n"
+    "{context_text}\n"
+).format
+
+# Experience-level keywords used to bucket salary results (senior takes precedence)
+_SENIOR_LEVEL_KEYWORDS = frozenset({'senior', 'lead'})
+_JUNIOR_LEVEL_KEYWORDS = frozenset({'junior', 'entry'})
+
+# Job search results: one formatted line per posting followed by fixed market notes
+_JOB_POSTING_LINE = "• **{title}** at {company} ({location}) - {data_source}".format
+_JOB_MARKET_NOTES = (
+    "\n\n"
+    "**Job Market Trends**:\n"
+    "• **Remote Work**: Many companies offer remote or hybrid options\n"
+    "• **Salary Ranges**: Vary by location, experience, and company size\n"
+    "• **Required Skills**: Focus on practical experience and modern technologies\n\n"
+    "**Popular Job Platforms**:\n"
+    "• **Indeed** - Wide variety of job types and locations\n"
+    "• **Glassdoor** - Company reviews and salary information\n"
+    "• **Stack Overflow Jobs** - Developer-specific opportunities\n\n"
+    "Would you like me to provide more specific information about any of these roles?"
+)
+
+# Static Markdown responses served when no retrieved data is available
+_JOB_POSTING_GUIDE = (
+    "## Job Posting Insights\n\n"
+    "Here are some key aspects of job postings:\n\n"
+    "• **Job Titles** - Common roles include 'Software Engineer', 'Data Scientist', 'Full Stack Developer', etc.\n"
+    "• **Required Skills** - Companies often list specific technologies and programming languages.\n"
+    "• **Salary** - Job postings typically include a salary range.\n"
+    "• **Location** - Many postings specify remote or on-site work.\n"
+    "• **Company** - Information about the company, its size, industry, and reputation.\n\n"
+    "**How to Find Job Postings**:\n"
+    "2. **Indeed** - Wide variety of job types\n"
+    "3. **Glassdoor** - Reviews, salaries, and company information\n"
+    "4. **Stack Overflow Jobs** - Developer-specific jobs\n"
+    "5. **RemoteOK** - For remote-friendly positions\n\n"
+    "**Tips for Applying**:\n"
+    "• Read the job description carefully\n"
+    "• Tailor your resume and cover letter\n"
+    "• Prepare for technical interviews\n"
+    "• Network with professionals in your field\n\n"
+    "Would you like me to provide more specific information about job posting trends or help you find a job?"
+)
+
+_AI_CAREER_OVERVIEW = (
+    "## AI Engineering Career Path\n\n"
+    "**What is AI Engineering?**\n"
+    "AI Engineers build and deploy artificial intelligence systems, including machine learning models, neural networks, and intelligent applications.\n\n"
+    "**Key Skills**:\n"
+    "• **Programming**: Python, R, Julia\n"
+    "• **Mathematics**: Linear Algebra, Calculus, Statistics\n"
+    "• **Machine Learning**: Scikit-learn, TensorFlow, PyTorch\n"
+    "• **Deep Learning**: Neural Networks, CNNs, RNNs\n"
+    "• **AI Tools**: RAG Systems, LLMs, Vector Databases\n\n"
+    "**Career Progression**:\n"
+    "• **Junior AI Engineer**: Focus on model implementation\n"
+    "• **Senior AI Engineer**: Lead AI projects and teams\n"
+    "• **AI Research Engineer**: Develop new AI algorithms\n"
+    "• **AI Engineering Lead**: Strategic AI initiatives\n\n"
+    "Would you like specific information about AI engineering salaries, required skills, or job opportunities?"
+)
+
+_LEARNING_PATHS = (
+    "## Learning Path Recommendations\n\n"
+    "I can help you create personalized learning paths! Here are some popular options:\n\n"
+    "🎯 **Web Development Path**:\n"
+    "1. HTML, CSS, JavaScript fundamentals\n"
+    "2. React or Vue.js frontend framework\n"
+    "3. Node.js backend development\n"
+    "4. Database design and SQL\n"
+    "5. Deployment and DevOps basics\n\n"
+    "🤖 **Data Science Path**:\n"
+    "1. Python programming\n"
+    "2. Data analysis with Pandas\n"
+    "3. Statistics and probability\n"
+    "4. Machine learning algorithms\n"
+    "5. Data visualization\n\n"
+    "☁️ **DevOps Path**:\n"
+    "1. Linux system administration\n"
+    "2. Docker containerization\n"
+    "3. Cloud platforms (AWS/Azure)\n"
+    "4. CI/CD pipelines\n"
+    "5. Infrastructure as code\n\n"
+    "Which learning path interests you? I can provide a detailed step-by-step roadmap!"
+)
+
+_GENERAL_HELP = (
+    "I'm here to help with your developer career! Here are some things I can assist you with:\n\n"
+    "🎯 **Career Guidance**: Ask about different developer roles and career paths\n"
+    "💡 **Skill Recommendations**: Get personalized skill suggestions based on your goals\n"
+    "💰 **Salary Information**: Learn about compensation for different roles\n"
+    "📚 **Learning Paths**: Get step-by-step learning roadmaps\n"
+    "🔍 **Technology Insights**: Learn about specific technologies and their applications\n\n"
+    "Try asking me questions like:\n"
+    "• \"What skills do I need for a full stack developer role?\"\n"
+    "• \"How much do data scientists earn?\"\n"
+    "• \"What's the learning path for Python?\"\n"
+    "• \"Tell me about React development\"\n\n"
+    "What would you like to know?"
+)
+
+_AI_TRENDS_OVERVIEW = (
+    "## Latest AI Trends and Developments (2024-2025)\n\n"
+    "**🔥 Current AI Trends**:\n\n"
+    "**1. RAG (Retrieval-Augmented Generation)**\n"
+    "• **What it is**: Combines large language models with external knowledge bases\n"
+    "• **Why it's trending**: Solves hallucination issues and provides accurate, up-to-date information\n"
+    "• **Applications**: AI assistants, knowledge management, research tools\n\n"
+    "**2. MCP (Model Context Protocol)**\n"
+    "• **What it is**: Standardized protocol for AI tool integration\n"
+    "• **Why it's trending**: Enables AI models to use external tools and APIs seamlessly\n"
+    "• **Applications**: AI agents, automation, workflow integration\n\n"
+    "**3. Vector Databases & Embeddings**\n"
+    "• **What it is**: Specialized databases for similarity search and semantic understanding\n"
+    "• **Why it's trending**: Essential for RAG systems and semantic search\n"
+    "• **Applications**: Recommendation systems, search engines, content discovery\n\n"
+    "**4. Prompt Engineering & Optimization**\n"
+    "• **What it is**: Techniques for optimizing AI model interactions\n"
+    "• **Why it's trending**: Critical for getting the best results from LLMs\n"
+    "• **Applications**: AI product development, content generation, automation\n\n"
+    "**5. AI Safety & Guardrails**\n"
+    "• **What it is**: Methods to ensure AI systems behave safely and ethically\n"
+    "• **Why it's trending**: Essential as AI becomes more powerful and widespread\n"
+    "• **Applications**: Content filtering, bias detection, safety protocols\n\n"
+    "**6. Multimodal AI**\n"
+    "• **What it is**: AI that can process text, images, audio, and video\n"
+    "• **Why it's trending**: More natural and comprehensive AI interactions\n"
+    "• **Applications**: Content creation, analysis, accessibility tools\n\n"
+    "**🚀 Emerging Technologies**:\n"
+    "• **Agentic AI**: Autonomous AI agents that can complete complex tasks\n"
+    "• **Synchronous/Asynchronous AI**: Real-time and batch AI processing\n"
+    "• **Graph RAG**: Combining knowledge graphs with RAG for enhanced reasoning\n"
+    "• **AI Evaluation Methods**: Systematic ways to measure AI performance\n\n"
+    "**💼 Career Impact**:\n"
+    "These trends are creating new job opportunities in:\n"
+    "• **AI Engineering**: Building and deploying AI systems\n"
+    "• **Prompt Engineering**: Optimizing AI interactions\n"
+    "• **AI Safety**: Ensuring responsible AI development\n"
+    "• **Vector Database Engineering**: Specialized data infrastructure\n\n"
+    "Would you like me to provide more details about any specific AI trend or how to get started in AI engineering?"
+)
+
+# Technology overviews, rendered once at import and looked up by keyword (in priority order)
+_TECH_INFO = {
+    'python': {
+        'description': 'Versatile programming language for web development, data science, and automation',
+        'use_cases': 'Web development, data analysis, machine learning, automation',
+        'learning_time': '3-6 months for basics',
+        'resources': 'Python.org, Real Python, Codecademy'
+    },
+    'javascript': {
+        'description': 'Essential language for web development and building interactive applications',
+        'use_cases': 'Frontend development, backend (Node.js), mobile apps',
+        'learning_time': '2-4 months for basics',
+        'resources': 'MDN Web Docs, JavaScript.info, freeCodeCamp'
+    },
+    'react': {
+        'description': 'Popular JavaScript library for building user interfaces',
+        'use_cases': 'Single-page applications, mobile apps, interactive UIs',
+        'learning_time': '2-3 months after JavaScript',
+        'resources': 'React docs, Create React App, React Tutorial'
+    },
+    'node': {
+        'description': 'JavaScript runtime for building server-side applications',
+        'use_cases': 'Backend APIs, real-time applications, microservices',
+        'learning_time': '1-2 months after JavaScript',
+        'resources': 'Node.js docs, Express.js, Node.js Tutorial'
+    },
+    'sql': {
+        'description': 'Standard language for managing and querying databases',
+        'use_cases': 'Data storage, analysis, reporting, business intelligence',
+        'learning_time': '1-2 months',
+        'resources': 'SQL Tutorial, W3Schools, LeetCode SQL'
+    },
+    'docker': {
+        'description': 'Platform for developing, shipping, and running applications in containers',
+        'use_cases': 'Application deployment, development environments, microservices',
+        'learning_time': '1-2 months',
+        'resources': 'Docker docs, Docker Tutorial, Docker Hub'
+    }
+}
+_TECH_OVERVIEW = (
+    "## {name} Technology Overview\n\n"
+    "**Description**: {description}\n\n"
+    "**Use Cases**: {use_cases}\n\n"
+    "**Learning Time**: {learning_time}\n\n"
+    "**Learning Resources**: {resources}\n\n"
+    "Would you like me to provide a detailed learning path for {name}?"
+).format
+_TECH_OVERVIEWS = {tech: _TECH_OVERVIEW(name=tech.title(), **info) for tech, info in _TECH_INFO.items()}
+
+@dataclass(slots=True, frozen=True)
+class ChatResponse:
+    """Immutable chatbot reply; converted to a plain dict once at the API edge."""
+    message: str
+    type: str
+    confidence: float
+    extra: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flatten into the response dict shape served by the API."""
+        response = {'message': self.message, 'type': self.type, 'confidence': self.confidence}
+        if self.extra:
+            response.update(self.extra)
+        return response
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChatResponse":
+        """Rebuild a response from its flattened dict form."""
+        extra = {key: value for key, value in data.items() if key not in ('message', 'type', 'confidence')}
+        return cls(data['message'], data['type'], data['confidence'], extra or None)
+
+
+@dataclass(slots=True)
+class QueryContext:
+    """Per-turn view of a user message, built once by the dispatcher and shared by handlers."""
+    raw: str
+    lower: str
+    tokens: frozenset
+    embedding: Optional[np.ndarray] = None
+    
+    @classmethod
+    def from_message(cls, message: str) -> "QueryContext":
+        """Lowercase and tokenize a message once."""
+        lower = message.lower()
+        return cls(message, lower, frozenset(_TOKEN_RE.findall(lower)))
+
+
+# Handler response cache: exact-message LRU in process, backed by a semantic tier in Qdrant
+_RESPONSE_CACHE_SIZE = 1024
+_RESPONSE_CACHE_TTL = 3600
+_SEMANTIC_CACHE_THRESHOLD = 0.95
+
+# Per-user chat history is bounded to the most recent messages (user and assistant turns)
+_CONVERSATION_HISTORY_SIZE = 50
+
+
+def cached_response(ttl: int = _RESPONSE_CACHE_TTL, sem_threshold: float = _SEMANTIC_CACHE_THRESHOLD,
+                    prefetch: Optional[str] = None):
+    """Cache a chatbot handler's response by exact message, then by query-embedding similarity.
+    
+    ``prefetch`` names a coroutine method that is started alongside the semantic lookup and
+    whose result is handed to the handler as ``context`` on a miss (cancelled on a hit).
+    """
+    def decorator(handler):
+        handler_name = handler.__name__
+        
+        def remember(self, key: str, response: ChatResponse):
+            self._response_cache[key] = (time.monotonic() + ttl, response)
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        
+        @functools.wraps(handler)
+        async def wrapper(self, message: str, query: Optional[QueryContext] = None):
+            normalized = message.lower().strip()
+            key = hashlib.sha1(f"{handler_name}:{normalized}".encode()).hexdigest()
+            
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                expires_at, response = cached
+                if expires_at > time.monotonic():
+                    self._response_cache.move_to_end(key)
+                    return response
+                del self._response_cache[key]
+            
+            kwargs = {}
+            if self._semantic_cache_ready:
+                # Embed the same normalized text the exact tier keys on; the query embeddings are
+                # hash-based, so this tier mostly acts as a persistent, cross-process exact cache
+                cache_embedding = self._embed_query(normalized)
+                prefetch_task = asyncio.create_task(getattr(self, prefetch)(message, query)) if prefetch else None
+                response = await asyncio.to_thread(
+                    self.qdrant_client.search_cached_response, cache_embedding, handler_name, sem_threshold
+                )
+                if response is not None:
+                    if prefetch_task:
+                        prefetch_task.cancel()
+                    response = ChatResponse.from_dict(response)
+                    remember(self, key, response)
+                    return response
+                if prefetch_task:
+                    kwargs['context'] = await prefetch_task
+            
+            response = await handler(self, message, query, **kwargs)
+            
+            # Error responses are transient; don't pin them for the whole TTL. The LLM client
+            # reports provider failures as "Error: ..." text that handlers pass through
+            if response.type != 'error' and not response.message.startswith("Error:"):
+                remember(self, key, response)
+                if self._semantic_cache_ready:
+                    await asyncio.to_thread(
+                        self.qdrant_client.cache_response,
+                        self._embed_query(normalized), handler_name, message, response.to_dict(), ttl
+                    )
+            
+            return response
+        
+        return wrapper
+    return decorator
+
 
 class EnhancedAIChatbot:
     """Enhanced AI chatbot with vector search and career analysis capabilities."""
     
     def __init__(self):
-        self.conversation_history = {}
+        self.conversation_history: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=_CONVERSATION_HISTORY_SIZE)
+        )
         self.qdrant_client = None
         self.embedding_generator = None
         self.graph_rag_service = None
         self._initialized = False
+        self._response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._semantic_cache_ready = False
         
         # Career paths with detailed information
         self.career_paths = {
@@ -115,8 +565,8 @@ class EnhancedAIChatbot:
         logger.info("Initializing Enhanced AI Chatbot...")
         
         try:
-            # Initialize Qdrant client
-            self.qdrant_client = QdrantVectorClient()
+            # Share the process-wide Qdrant client (and its connection pool)
+            self.qdrant_client = qdrant_client
             self.embedding_generator = embedding_generator
             
             # Initialize LLM client
@@ -134,6 +584,9 @@ class EnhancedAIChatbot:
             # Test vector search connection
             health = self.qdrant_client.health_check()
             logger.info(f"Qdrant status: {health['status']}, Collections: {len(health.get('collections', []))}")
+            self._semantic_cache_ready = self.qdrant_client.create_response_cache_collection()
+            if self._semantic_cache_ready:
+                self.qdrant_client.purge_expired_responses()
             
             # Test Graph RAG service
             graph_stats = self.graph_rag_service.get_graph_statistics()
@@ -169,10 +622,6 @@ class EnhancedAIChatbot:
     async def chat(self, user_id: str, message: str) -> Dict[str, Any]:
         """Process a chat message and return a response."""
         try:
-            # Initialize conversation history
-            if user_id not in self.conversation_history:
-                self.conversation_history[user_id] = []
-            
             # Add user message to history
             self.conversation_history[user_id].append({
                 'role': 'user',
@@ -186,11 +635,11 @@ class EnhancedAIChatbot:
             # Add assistant response to history
             self.conversation_history[user_id].append({
                 'role': 'assistant',
-                'message': response['message'],
+                'message': response.message,
                 'timestamp': datetime.now().isoformat()
             })
             
-            return response
+            return response.to_dict()
             
         except Exception as e:
             logger.error(f"Error in chat processing: {e}")
@@ -200,99 +649,113 @@ class EnhancedAIChatbot:
                 'confidence': 0.3
             }
     
-    async def _generate_intelligent_response(self, user_id: str, message: str) -> Dict[str, Any]:
+    async def chat_stream(self, user_id: str, message: str) -> AsyncIterator[str]:
+        """Stream a chat reply: skill answers arrive as the LLM generates them, other intents as one chunk."""
+        self.conversation_history[user_id].append({
+            'role': 'user',
+            'message': message,
+            'timestamp': datetime.now().isoformat()
+        })
+        
+        parts = []
+        if _SKILL_INTENT_RE.search(message.lower()):
+            async for chunk in self.stream_skill_answer(message):
+                parts.append(chunk)
+                yield chunk
+        else:
+            response = await self._generate_intelligent_response(user_id, message)
+            parts.append(response.message)
+            yield response.message
+        
+        # Only a completed reply is recorded; a failed stream raises before reaching here
+        self.conversation_history[user_id].append({
+            'role': 'assistant',
+            'message': ''.join(parts),
+            'timestamp': datetime.now().isoformat()
+        })
+    
+    async def _generate_intelligent_response(self, user_id: str, message: str) -> ChatResponse:
         """Generate intelligent response using vector search and career analysis."""
-        message_lower = message.lower()
+        query = QueryContext.from_message(message)
+        message_lower = query.lower
         
         # Handle general skill questions FIRST (before greetings to avoid conflicts)
-        skill_keywords = ['skill', 'technology', 'learn', 'programming', 'language', 'skills do i need', 'what skills', 'which skills', 'skills are', 'skills in', 'high demand', 'demand']
-        if any(keyword in message_lower for keyword in skill_keywords):
-            return await self._handle_skill_question(message)
+        if _SKILL_INTENT_RE.search(message_lower):
+            return await self._handle_skill_question(message, query)
         
         # Handle greetings
-        if any(word in message_lower for word in ['hello', 'hi', 'hey', 'greetings']):
+        if _GREETING_RE.search(message_lower):
             logger.info("Message matched greeting keywords")
             return await self._handle_greeting()
         
         # Check for repository queries FIRST
-        repository_keywords = ['repository', 'repo', 'github', 'gitlab', 'bitbucket', 'project', 'codebase']
-        if any(keyword in message_lower for keyword in repository_keywords):
-            return await self._handle_repository_question(message)
-        
-        # Check for specific skill queries
-        specific_skills = ['python', 'javascript', 'java', 'react', 'node.js', 'sql', 'docker', 'kubernetes', 'aws', 'git', 'html', 'css', 'typescript', 'vue', 'angular', 'mongodb', 'postgresql', 'redis', 'nginx', 'linux', 'bash', 'php', 'ruby', 'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'jupyter']
+        if _REPOSITORY_RE.search(message_lower):
+            return await self._handle_repository_question(message, query)
         
-        # Check if the query is asking about a specific skill
-        if any(skill in message_lower for skill in specific_skills):
-            # Look for skill-specific query patterns
-            skill_query_patterns = [
-                'tell me about', 'what is', 'explain', 'details on', 'more details on',
-                'how to use', 'learn', 'information about', 'guide to'
-            ]
-            
-            if any(pattern in message_lower for pattern in skill_query_patterns):
-                return await self._handle_specific_skill_question(message)
+        # Check if the query is asking about a specific skill, using a skill-specific query pattern
+        if _SPECIFIC_SKILL_RE.search(message_lower) and _SKILL_QUERY_PATTERN_RE.search(message_lower):
+            return await self._handle_specific_skill_question(message, query)
         
         # Handle developer queries FIRST (before career queries to avoid conflicts)
-        developer_keywords = ['developer', 'programmer', 'coder', 'who is', 'find developers', 'popular developer', 'most popular', 'developers working on', 'developers who', 'find developers', 'working on']
-        if any(keyword in message_lower for keyword in developer_keywords):
-            return await self._handle_developer_question(message)
+        if _DEVELOPER_RE.search(message_lower):
+            return await self._handle_developer_question(message, query)
         
         # Handle salary questions FIRST (before career queries to avoid conflicts)
-        salary_keywords = ['salary', 'pay', 'money', 'earn', 'income', 'compensation', 'wage']
-        salary_indicators = ['what\'s the salary', 'how much', 'salary for', 'pay for', 'earn as']
-        
-        if any(word in message_lower for word in salary_keywords) or any(indicator in message_lower for indicator in salary_indicators):
-            return await self._handle_salary_question(message)
+        if _SALARY_RE.search(message_lower):
+            return await self._handle_salary_question(message, query)
         
         # Handle career path questions (excluding developer, salary, and skill queries)
-        career_keywords = ['career', 'role', 'path', 'data science', 'data scientist']
-        
-        if any(word in message_lower for word in career_keywords):
-            return await self._handle_career_question(message)
-        
-
+        if _CAREER_RE.search(message_lower):
+            return await self._handle_career_question(message, query)
         
         # Handle job posting questions (before career queries)
-        job_keywords = ['job posting', 'job listing', 'job opening', 'hiring', 'recruitment', 'job market', 'employment', 'jobs in', 'positions in', 'job opportunities']
-        if any(keyword in message_lower for keyword in job_keywords):
-            return await self._handle_job_question(message)
+        if _JOB_RE.search(message_lower):
+            return await self._handle_job_question(message, query)
         
         # Handle learning path questions
-        if any(word in message_lower for word in ['learn', 'study', 'course', 'tutorial', 'roadmap']):
+        if _LEARNING_RE.search(message_lower):
             return await self._handle_learning_question(message)
         
         # Handle AI-specific questions (before general career queries)
-        ai_keywords = ['ai engineer', 'artificial intelligence', 'machine learning engineer', 'ml engineer', 'ai developer', 'ai engineering', 'ai trends', 'ai trend', 'latest ai', 'ai technology', 'ai developments', 'ai news', 'ai updates']
-        if any(keyword in message_lower for keyword in ai_keywords):
-            return await self._handle_ai_question(message)
+        if _AI_RE.search(message_lower):
+            return await self._handle_ai_question(message, query)
         
         # Handle specific technology questions
-        if any(word in message_lower for word in ['python', 'javascript', 'react', 'node', 'sql', 'docker']):
-            return await self._handle_technology_question(message)
+        if _TECHNOLOGY_RE.search(message_lower):
+            return await self._handle_technology_question(message, query)
         
         # Try Graph RAG for complex queries
         if self.graph_rag_service and self.graph_rag_service._initialized:
             try:
                 # Determine query type based on content
-                query_type = self._determine_query_type(message)
+                query_type = self._determine_query_type(query)
                 graph_rag_response = await self.graph_rag_service.graph_rag_query(message, query_type)
                 
                 if graph_rag_response and 'response' in graph_rag_response and not graph_rag_response.get('error'):
-                    return {
-                        'message': graph_rag_response['response'],
-                        'type': 'graph_rag_response',
-                        'confidence': graph_rag_response.get('confidence', 0.8),
-                        'graph_insights': graph_rag_response.get('graph_insights', {}),
-                        'career_paths': graph_rag_response.get('career_paths', {})
-                    }
+                    return ChatResponse(
+                        message=graph_rag_response['response'],
+                        type='graph_rag_response',
+                        confidence=graph_rag_response.get('confidence', 0.8),
+                        extra={
+                            'graph_insights': graph_rag_response.get('graph_insights', {}),
+                            'career_paths': graph_rag_response.get('career_paths', {})
+                        }
+                    )
             except Exception as e:
                 logger.error(f"Graph RAG query failed: {e}")
         
         # Default response with suggestions
         return await self._handle_general_question(message)
     
-    async def _handle_greeting(self) -> Dict[str, Any]:
+    def _embed_query(self, message: str, query: Optional[QueryContext] = None) -> np.ndarray:
+        """Return the 384-dim query embedding for a message, reusing the turn's context if given."""
+        if query is None:
+            return self.embedding_generator.get_query_embedding(message, 384)
+        if query.embedding is None:
+            query.embedding = self.embedding_generator.get_query_embedding(message, 384)
+        return query.embedding
+    
+    async def _handle_greeting(self) -> ChatResponse:
         """Handle greeting messages."""
         greeting = (
             "Hello! I'm your AI career assistant powered by DevCareerCompass. "
@@ -305,17 +768,15 @@ class EnhancedAIChatbot:
             "What would you like to know about your developer career?"
         )
         
-        return {
-            'message': greeting,
-            'type': 'greeting',
-            'confidence': 0.95
-        }
+        return ChatResponse(
+            message=greeting,
+            type='greeting',
+            confidence=0.95
+        )
     
-    async def _handle_career_question(self, message: str) -> Dict[str, Any]:
+    async def _handle_career_question(self, message: str, query: QueryContext) -> ChatResponse:
         """Handle career-related questions using vector search."""
         try:
-            message_lower = message.lower()
-            
             # Check for specific career path queries
             career_keywords = {
                 'full stack': 'Full Stack Developer',
@@ -335,26 +796,26 @@ class EnhancedAIChatbot:
             
             # Check for career path keywords
             for keyword, career_path in career_keywords.items():
-                if keyword in message_lower:
+                if keyword in query.lower:
                     if career_path.lower() in self.career_paths:
                         return await self._provide_career_details(career_path, self.career_paths[career_path.lower()])
             
             # Special handling for data science skill queries
-            if any(term in message_lower for term in ['data science', 'data scientist', 'machine learning', 'ml', 'ai']):
-                if 'skill' in message_lower or 'need' in message_lower:
+            if any(term in query.lower for term in ['data science', 'data scientist', 'machine learning', 'ml', 'ai']):
+                if 'skill' in query.lower or 'need' in query.lower:
                     return await self._handle_data_science_skills()
             
             # Check for specific career paths
             for career_path, details in self.career_paths.items():
-                if career_path.lower() in message_lower:
+                if career_path.lower() in query.lower:
                     return await self._provide_career_details(career_path.title(), details)
             
             # Use vector search if available
             if self._initialized and self.qdrant_client:
                 try:
                     # Generate embedding for the query using hash-based method
-                    query_embedding = self.embedding_generator._hash_based_embedding(message, 384).tolist()
-                    similar_careers = self.qdrant_client.search_similar_career_paths(query_embedding, top_k=3)
+                    query_embedding = self._embed_query(message, query)
+                    similar_careers = await asyncio.to_thread(self.qdrant_client.search_similar_career_paths, query_embedding, top_k=3)
                     
                     if similar_careers:
                         career_list = "\n".join([f"• **{career['path_name']}**" for career in similar_careers])
@@ -395,21 +856,21 @@ class EnhancedAIChatbot:
                     "Which career path interests you most?"
                 )
             
-            return {
-                'message': response,
-                'type': 'career_exploration',
-                'confidence': 0.9
-            }
+            return ChatResponse(
+                message=response,
+                type='career_exploration',
+                confidence=0.9
+            )
             
         except Exception as e:
             logger.error(f"Error in career question handling: {e}")
-            return {
-                'message': "I can help you explore different developer career paths. Popular options include Full Stack Developer, Data Scientist, DevOps Engineer, Frontend Developer, and Backend Developer. Which one interests you?",
-                'type': 'career_exploration',
-                'confidence': 0.8
-            }
+            return ChatResponse(
+                message="I can help you explore different developer career paths. Popular options include Full Stack Developer, Data Scientist, DevOps Engineer, Frontend Developer, and Backend Developer. Which one interests you?",
+                type='career_exploration',
+                confidence=0.8
+            )
     
-    async def _provide_career_details(self, career_path: str, details: Dict[str, Any]) -> Dict[str, Any]:
+    async def _provide_career_details(self, career_path: str, details: Dict[str, Any]) -> ChatResponse:
         """Provide detailed information about a specific career path."""
         response = (
             f"## {career_path.title()} Career Path\n\n"
@@ -427,14 +888,14 @@ class EnhancedAIChatbot:
             f"Would you like me to provide more specific information about any of these skills or help you create a personalized learning plan?"
         )
         
-        return {
-            'message': response,
-            'type': 'career_details',
-            'confidence': 0.95,
-            'career_path': career_path
-        }
+        return ChatResponse(
+            message=response,
+            type='career_details',
+            confidence=0.95,
+            extra={'career_path': career_path}
+        )
     
-    async def _handle_data_science_skills(self) -> Dict[str, Any]:
+    async def _handle_data_science_skills(self) -> ChatResponse:
         """Provide specific information about data science skills."""
         response = (
             "## Data Science Skills You Need\n\n"
@@ -461,16 +922,14 @@ class EnhancedAIChatbot:
             "Would you like me to provide a learning roadmap for any of these skills?"
         )
         
-        return {
-            'message': response,
-            'type': 'skill_recommendation',
-            'confidence': 0.95
-        }
+        return ChatResponse(
+            message=response,
+            type='skill_recommendation',
+            confidence=0.95
+        )
     
-    async def _handle_specific_skill_question(self, message: str) -> Dict[str, Any]:
+    async def _handle_specific_skill_question(self, message: str, query: QueryContext) -> ChatResponse:
         """Handle queries about specific skills/technologies."""
-        message_lower = message.lower()
-        
         # Skill information database
         skill_info = {
             'python': {
@@ -537,7 +996,7 @@ class EnhancedAIChatbot:
         
         # Find the skill being asked about
         for skill_key, skill_data in skill_info.items():
-            if skill_key in message_lower:
+            if skill_key in query.lower:
                 response = (
                     f"## {skill_data['name']} - {skill_data['category']}\n\n"
                     f"**Description**: {skill_data['description']}\n\n"
@@ -554,17 +1013,17 @@ class EnhancedAIChatbot:
                     f"Would you like me to provide a learning roadmap for {skill_data['name']} or explain how it fits into specific career paths?"
                 )
                 
-                return {
-                    'message': response,
-                    'type': 'skill_details',
-                    'confidence': 0.95,
-                    'skill': skill_data['name']
-                }
+                return ChatResponse(
+                    message=response,
+                    type='skill_details',
+                    confidence=0.95,
+                    extra={'skill': skill_data['name']}
+                )
         
         # Fallback for skills not in our database
-        return await self._handle_skill_question(message)
+        return await self._handle_skill_question(message, query)
     
-    async def _handle_general_repository_info(self) -> Dict[str, Any]:
+    async def _handle_general_repository_info(self) -> ChatResponse:
         """Handle general repository information queries."""
         response = (
             "## Repository Information\n\n"
@@ -592,38 +1051,31 @@ class EnhancedAIChatbot:
             "• Find specific repositories for learning?"
         )
         
-        return {
-            'message': response,
-            'type': 'repository_info',
-            'confidence': 0.9
-        }
+        return ChatResponse(
+            message=response,
+            type='repository_info',
+            confidence=0.9
+        )
     
-    async def _handle_repository_question(self, message: str) -> Dict[str, Any]:
+    async def _handle_repository_question(self, message: str, query: QueryContext) -> ChatResponse:
         """Handle queries about repositories and codebases."""
-        message_lower = message.lower()
-        
         try:
-            # Check if it's asking about a specific repository
-            if any(word in message_lower for word in ['mojombo']):
-                return await self._handle_specific_repository_query(message)
-            
-            # Check for general repository questions
-            if any(word in message_lower for word in ['what is', 'explain', 'tell me about']):
+            # General questions are the common case, so test them first; a named
+            # repository still takes precedence over generic phrasing
+            if _REPO_GENERAL_INTENT_RE.search(query.lower) and 'mojombo' not in query.lower:
                 return await self._handle_general_repository_info()
             
-            # Default to repository search
-            return await self._handle_specific_repository_query(message)
+            # Specific repository or repository search
+            return await self._handle_specific_repository_query(message, query)
             
         except Exception as e:
             logger.error(f"Error in repository question handling: {e}")
             return await self._handle_general_question(message)
     
-    async def _handle_specific_repository_query(self, message: str) -> Dict[str, Any]:
+    async def _handle_specific_repository_query(self, message: str, query: QueryContext) -> ChatResponse:
         """Handle queries about specific repositories like 'mojombo'."""
-        message_lower = message.lower()
-        
         # Check for specific repository names
-        if 'mojombo' in message_lower:
+        if 'mojombo' in query.lower:
             response = (
                 "## Repository: mojombo\n\n"
                 "**About mojombo**:\n"
@@ -647,12 +1099,12 @@ class EnhancedAIChatbot:
                 "Would you like me to provide more details about any of these topics or help you find similar repositories to learn from?"
             )
             
-            return {
-                'message': response,
-                'type': 'repository_details',
-                'confidence': 0.95,
-                'repository': 'mojombo'
-            }
+            return ChatResponse(
+                message=response,
+                type='repository_details',
+                confidence=0.95,
+                extra={'repository': 'mojombo'}
+            )
         
         # Generic repository search response
         response = (
@@ -677,20 +1129,18 @@ class EnhancedAIChatbot:
             "What type of repository are you looking for? I can help you find relevant examples!"
         )
         
-        return {
-            'message': response,
-            'type': 'repository_search',
-            'confidence': 0.9
-        }
+        return ChatResponse(
+            message=response,
+            type='repository_search',
+            confidence=0.9
+        )
     
-    async def _handle_developer_question(self, message: str) -> Dict[str, Any]:
+    async def _handle_developer_question(self, message: str, query: QueryContext) -> ChatResponse:
         """Handle queries about developers and programmers."""
-        message_lower = message.lower()
-        
         try:
             # Check for specific developer queries
-            if any(word in message_lower for word in ['who is', 'find developers', 'popular developer']):
-                return await self._handle_developer_search(message)
+            if _DEV_INTENT_RE.search(message):
+                return await self._handle_developer_search(message, query)
             
             # General developer information
             response = (
@@ -723,91 +1173,91 @@ class EnhancedAIChatbot:
                 "• Help you choose a development path?"
             )
             
-            return {
-                'message': response,
-                'type': 'developer_info',
-                'confidence': 0.9
-            }
+            return ChatResponse(
+                message=response,
+                type='developer_info',
+                confidence=0.9
+            )
             
         except Exception as e:
             logger.error(f"Error in developer question handling: {e}")
             return await self._handle_general_question(message)
     
-    async def _handle_developer_search(self, message: str) -> Dict[str, Any]:
+    async def _handle_developer_search(self, message: str, query: QueryContext) -> ChatResponse:
         """Handle specific developer search queries using RAG system."""
-        message_lower = message.lower()
-        
         try:
             # Use vector search if available
             if self._initialized and self.qdrant_client:
                 # Generate embedding for the query
-                query_embedding = self.embedding_generator._hash_based_embedding(message, 384).tolist()
-                similar_developers = self.qdrant_client.search_similar_developers(query_embedding, top_k=5)
+                query_embedding = self._embed_query(message, query)
+                similar_developers = await asyncio.to_thread(self.qdrant_client.search_similar_developers, query_embedding, top_k=5)
                 
                 if similar_developers:
-                    response = "## Developers Found\n\n"
-                    response += f"Based on your query, here are relevant developers:\n\n"
-                    
-                    for i, dev in enumerate(similar_developers, 1):
-                        response += (
-                            f"**{i}. {dev.get('name', dev.get('username', 'Unknown'))}**\n"
-                            f"• Username: @{dev.get('username', 'N/A')}\n"
-                            f"• Location: {dev.get('location', 'Not specified')}\n"
-                            f"• Company: {dev.get('company', 'Not specified')}\n"
-                            f"• Public Repos: {dev.get('public_repos', 0)}\n"
-                            f"• Followers: {dev.get('followers', 0):,}\n"
-                            f"• Match Score: {dev.get('score', 0):.2f}\n\n"
-                        )
-                    
-                    response += "Would you like me to provide more details about any of these developers or help you find developers with specific skills?"
+                    parts = [
+                        "## Developers Found\n\n",
+                        "Based on your query, here are relevant developers:\n\n"
+                    ]
+                    parts.extend(
+                        f"**{i}. {dev.get('name', dev.get('username', 'Unknown'))}**\n"
+                        f"• Username: @{dev.get('username', 'N/A')}\n"
+                        f"• Location: {dev.get('location', 'Not specified')}\n"
+                        f"• Company: {dev.get('company', 'Not specified')}\n"
+                        f"• Public Repos: {dev.get('public_repos', 0)}\n"
+                        f"• Followers: {dev.get('followers', 0):,}\n"
+                        f"• Match Score: {dev.get('score', 0):.2f}\n\n"
+                        for i, dev in enumerate(similar_developers, 1)
+                    )
+                    parts.append("Would you like me to provide more details about any of these developers or help you find developers with specific skills?")
+                    response = "".join(parts)
                     
-                    return {
-                        'message': response,
-                        'type': 'developer_search',
-                        'confidence': 0.95,
-                        'developers_found': len(similar_developers)
-                    }
+                    return ChatResponse(
+                        message=response,
+                        type='developer_search',
+                        confidence=0.95,
+                        extra={'developers_found': len(similar_developers)}
+                    )
             
             # Fallback to database search
             with db_manager.get_session() as session:
-                total_developers = session.query(Developer).count()
-                top_developers_query = session.query(Developer).order_by(Developer.followers.desc()).limit(5).all()
-                
-                # Convert to dictionaries within session context to avoid session binding issues
-                top_developers = []
-                for dev in top_developers_query:
-                    top_developers.append({
-                        'name': dev.name,
-                        'username': dev.username,
-                        'followers': dev.followers,
-                        'public_repos': dev.public_repos,
-                        'location': dev.location,
-                        'company': dev.company
-                    })
-            
-            if 'popular' in message_lower or 'most popular' in message_lower:
-                response = (
-                    "## Most Popular Developers\n\n"
+                # Single round-trip of plain column rows (no ORM hydration); the window
+                # count carries the table total on every row
+                rows = session.execute(
+                    select(
+                        Developer.name,
+                        Developer.username,
+                        Developer.followers,
+                        Developer.public_repos,
+                        Developer.location,
+                        Developer.company,
+                        func.count().over().label('total')
+                    ).order_by(Developer.followers.desc()).limit(5)
+                ).all()
+                total_developers = rows[0].total if rows else 0
+                # Row objects are lightweight named tuples; format from them directly
+                top_developers = rows
+            
+            if 'popular' in query.lower or 'most popular' in query.lower:
+                parts = [
+                    "## Most Popular Developers\n\n",
                     f"Based on our database of {total_developers} developers:\n\n"
+                ]
+                parts.extend(
+                    f"**{i}. {dev.name or dev.username}**\n"
+                    f"• Username: @{dev.username}\n"
+                    f"• Followers: {dev.followers:,}\n"
+                    f"• Public Repos: {dev.public_repos}\n"
+                    f"• Location: {dev.location or 'Not specified'}\n"
+                    f"• Company: {dev.company or 'Not specified'}\n\n"
+                    for i, dev in enumerate(top_developers, 1)
                 )
+                parts.append("Would you like me to provide more details about any of these developers or help you find developers with specific skills?")
+                response = "".join(parts)
                 
-                for i, dev in enumerate(top_developers, 1):
-                    response += (
-                        f"**{i}. {dev['name'] or dev['username']}**\n"
-                        f"• Username: @{dev['username']}\n"
-                        f"• Followers: {dev['followers']:,}\n"
-                        f"• Public Repos: {dev['public_repos']}\n"
-                        f"• Location: {dev['location'] or 'Not specified'}\n"
-                        f"• Company: {dev['company'] or 'Not specified'}\n\n"
-                    )
-                
-                response += "Would you like me to provide more details about any of these developers or help you find developers with specific skills?"
-                
-                return {
-                    'message': response,
-                    'type': 'developer_search',
-                    'confidence': 0.95
-                }
+                return ChatResponse(
+                    message=response,
+                    type='developer_search',
+                    confidence=0.95
+                )
             
             # Generic developer search response
             response = (
@@ -827,76 +1277,23 @@ class EnhancedAIChatbot:
                 "What type of developer are you looking for?"
             )
             
-            return {
-                'message': response,
-                'type': 'developer_search',
-                'confidence': 0.9
-            }
+            return ChatResponse(
+                message=response,
+                type='developer_search',
+                confidence=0.9
+            )
             
         except Exception as e:
             logger.error(f"Error in developer search: {e}")
             return await self._handle_general_question(message)
     
-    async def _handle_skill_question(self, message: str) -> Dict[str, Any]:
+    async def _handle_skill_question(self, message: str, query: Optional[QueryContext] = None) -> ChatResponse:
         """Handle skill-related questions using RAG with vector search and LLM."""
         try:
             # Use RAG system with vector search and LLM
             if self._initialized and self.qdrant_client and self.llm_client:
                 try:
-                    # Generate embedding for the query
-                    query_embedding = self.embedding_generator._hash_based_embedding(message, 384).tolist()
-                    
-                    # Search for similar skills, jobs, and career paths
-                    similar_skills = self.qdrant_client.search_similar_skills(query_embedding, top_k=8)
-                    similar_jobs = self.qdrant_client.search_similar_job_postings(query_embedding, top_k=5)
-                    similar_careers = self.qdrant_client.search_similar_career_paths(query_embedding, top_k=3)
-                    
-                    # Build context from retrieved data
-                    context_parts = []
-                    
-                    if similar_skills:
-                        skill_info = []
-                        for skill in similar_skills:
-                            skill_info.append(f"• {skill['skill_name']} (Market Demand: {skill.get('market_demand_score', 'N/A')}, Popularity: {skill.get('popularity_score', 'N/A')})")
-                        context_parts.append(f"**High-Demand Skills:**\n" + "\n".join(skill_info))
-                    
-                    if similar_jobs:
-                        job_info = []
-                        for job in similar_jobs:
-                            salary_info = ""
-                            if job.get('salary_min') and job.get('salary_max'):
-                                salary_info = f" (Salary: ${job['salary_min']:,}-${job['salary_max']:,})"
-                            job_info.append(f"• {job['title']} at {job['company']}{salary_info}")
-                        context_parts.append(f"**Related Job Postings:**\n" + "\n".join(job_info))
-                    
-                    if similar_careers:
-                        career_info = []
-                        for career in similar_careers:
-                            career_info.append(f"• {career['path_name']} - {career.get('description', 'Career path')}")
-                        context_parts.append(f"**Career Paths:**\n" + "\n".join(career_info))
-                    
-                    # Create comprehensive context
-                    context = "\n\n".join(context_parts)
-                    
-                    # Generate LLM response with context
-                    prompt = f"""
-You are an expert career advisor specializing in technology skills and career development. 
-Based on the following real data from job market, skills database, and career paths, provide a comprehensive and natural answer to the user's question.
-
-User Question: {message}
-
-Context Data:
-{context}
-
-Please provide a detailed, conversational response that includes:
-1. A clear analysis of high-demand skills based on the data
-2. Market insights about these skills and why they're valuable
-3. Career opportunities and typical salary ranges
-4. Specific learning recommendations and resources
-5. Future trends and how to stay competitive
-
-Write in a natural, conversational tone as if you're speaking directly to the user. Use markdown formatting for better readability. Make sure your response is at least 200 words and provides actionable insights.
-"""
+                    prompt, similar_skills, similar_jobs, similar_careers = await self._build_skill_prompt(message, query)
                     
                     # Generate response using LLM
                     llm_response = await self.llm_client.generate_text(prompt)
@@ -919,46 +1316,109 @@ Write in a natural, conversational tone as if you're speaking directly to the us
                 response = await self._fallback_skill_response()
                 confidence = 0.7
             
-            return {
-                'message': response,
-                'type': 'skill_recommendation',
-                'confidence': confidence
-            }
+            return ChatResponse(
+                message=response,
+                type='skill_recommendation',
+                confidence=confidence
+            )
             
         except Exception as e:
             logger.error(f"Error in skill question handling: {e}")
-            return {
-                'message': "I can help you understand different programming skills and technologies. Popular skills include Python, JavaScript, React, Node.js, SQL, and Docker. Which skill would you like to learn more about?",
-                'type': 'skill_general',
-                'confidence': 0.7
-            }
+            return ChatResponse(
+                message="I can help you understand different programming skills and technologies. Popular skills include Python, JavaScript, React, Node.js, SQL, and Docker. Which skill would you like to learn more about?",
+                type='skill_general',
+                confidence=0.7
+            )
+    
+    async def _build_skill_prompt(self, message: str, query: Optional[QueryContext] = None):
+        """Retrieve skill, job and career context and build the skill-advice LLM prompt."""
+        # Generate embedding for the query
+        query_embedding = self._embed_query(message, query)
+        
+        # Search for similar skills, jobs, and career paths concurrently; the
+        # Qdrant client is synchronous, so each search runs in a worker thread
+        similar_skills, similar_jobs, similar_careers = await asyncio.gather(
+            asyncio.to_thread(self.qdrant_client.search_similar_skills, query_embedding, top_k=8),
+            asyncio.to_thread(self.qdrant_client.search_similar_job_postings, query_embedding, top_k=5),
+            asyncio.to_thread(self.qdrant_client.search_similar_career_paths, query_embedding, top_k=3)
+        )
+        
+        # Build context from retrieved data
+        context_parts = []
+        
+        if similar_skills:
+            skill_info = []
+            for skill in similar_skills:
+                skill_info.append(f"• {skill['skill_name']} (Market Demand: {skill.get('market_demand_score', 'N/A')}, Popularity: {skill.get('popularity_score', 'N/A')})")
+            context_parts.append(f"**High-Demand Skills:**\n" + "\n".join(skill_info))
+        
+        if similar_jobs:
+            job_info = []
+            for job in similar_jobs:
+                salary_info = ""
+                if job.get('salary_min') and job.get('salary_max'):
+                    salary_info = f" (Salary: ${job['salary_min']:,}-${job['salary_max']:,})"
+                job_info.append(f"• {job['title']} at {job['company']}{salary_info}")
+            context_parts.append(f"**Related Job Postings:**\n" + "\n".join(job_info))
+        
+        if similar_careers:
+            career_info = []
+            for career in similar_careers:
+                career_info.append(f"• {career['path_name']} - {career.get('description', 'Career path')}")
+            context_parts.append(f"**Career Paths:**\n" + "\n".join(career_info))
+        
+        # Create comprehensive context
+        context = "\n\n".join(context_parts)
+        
+        # Generate LLM response with context
+        prompt = _SKILL_PROMPT(message=message, context=context)
+        
+        return prompt, similar_skills, similar_jobs, similar_careers
+    
+    async def stream_skill_answer(self, message: str) -> AsyncIterator[str]:
+        """Stream the answer to a skill question chunk by chunk as the LLM generates it."""
+        if not (self._initialized and self.qdrant_client and self.llm_client):
+            response = await self._handle_skill_question(message)
+            yield response.message
+            return
+        
+        try:
+            prompt, _, _, _ = await self._build_skill_prompt(message)
+        except Exception as e:
+            logger.error(f"RAG system error: {e}")
+            yield await self._fallback_skill_response()
+            return
+        
+        async for chunk in self.llm_client.stream_text(prompt):
+            yield chunk
     
     def _generate_structured_skill_response(self, similar_skills, similar_jobs, similar_careers):
         """Generate a structured response when LLM is not available."""
         response_parts = []
         
         if similar_skills:
-            skill_list = "\n".join([
-                f"• **{skill['skill_name']}** (Market Demand: {skill.get('market_demand_score', 'N/A')})"
-                for skill in similar_skills[:5]
-            ])
+            skill_list = "\n".join(
+                _SKILL_LINE(skill_name=skill['skill_name'], demand=skill.get('market_demand_score', 'N/A'))
+                for skill in islice(similar_skills, 5)
+            )
             response_parts.append(f"## 🎯 High-Demand Skills\n\n{skill_list}")
         
         if similar_jobs:
-            job_list = "\n".join([
-                f"• **{job['title']}** at {job['company']}"
-                for job in similar_jobs[:3]
-            ])
+            job_list = "\n".join(
+                _JOB_LINE(title=job['title'], company=job['company'])
+                for job in islice(similar_jobs, 3)
+            )
             response_parts.append(f"## 💼 Related Job Opportunities\n\n{job_list}")
         
         if similar_careers:
-            career_list = "\n".join([
-                f"• **{career['path_name']}** - {career.get('description', 'Career path')}"
-                for career in similar_careers[:3]
-            ])
+            # Career paths are already fetched with top_k=3
+            career_list = "\n".join(
+                _CAREER_LINE(path_name=career['path_name'], description=career.get('description', 'Career path'))
+                for career in similar_careers
+            )
             response_parts.append(f"## 🚀 Career Paths\n\n{career_list}")
         
-        response_parts.append("\n## 📚 Learning Recommendations\n\nBased on current market trends, I recommend focusing on skills that combine technical expertise with practical applications. Consider building projects that showcase these skills and stay updated with industry developments.")
+        response_parts.append(_LEARNING_RECOMMENDATIONS)
         
         return "\n\n".join(response_parts)
     
@@ -967,8 +1427,9 @@ Write in a natural, conversational tone as if you're speaking directly to the us
         try:
             with db_manager.get_session() as session:
                 # Get top skills by market demand
-                skills_query = session.query(Skill).order_by(Skill.market_demand_score.desc()).limit(8).all()
-                skill_names = [skill.name for skill in skills_query]
+                skill_names = session.execute(
+                    select(Skill.name).order_by(Skill.market_demand_score.desc()).limit(8)
+                ).scalars().all()
             
             if skill_names:
                 skill_list = "\n".join([f"• **{skill}**" for skill in skill_names])
@@ -992,14 +1453,15 @@ Would you like detailed information about any specific skill or career path?"""
             logger.error(f"Error in fallback skill response: {e}")
             return "I can help you understand different programming skills and technologies. Popular skills include Python, JavaScript, React, Node.js, SQL, and Docker. Which skill would you like to learn more about?"
     
-    async def _handle_salary_question(self, message: str) -> Dict[str, Any]:
+    @cached_response()
+    async def _handle_salary_question(self, message: str, query: Optional[QueryContext] = None) -> ChatResponse:
         """Handle salary-related questions using RAG system."""
         try:
             # Use vector search to find relevant job postings with salary data
             if self._initialized and self.qdrant_client:
                 # Generate embedding for the query
-                query_embedding = self.embedding_generator._hash_based_embedding(message, 384).tolist()
-                similar_jobs = self.qdrant_client.search_similar_job_postings(query_embedding, top_k=5)
+                query_embedding = self._embed_query(message, query)
+                similar_jobs = await asyncio.to_thread(self.qdrant_client.search_similar_job_postings, query_embedding, top_k=5)
                 
                 if similar_jobs:
                     # Extract salary information from job postings
@@ -1016,48 +1478,53 @@ Would you like detailed information about any specific skill or career path?"""
                             })
                     
                     if salary_data:
-                        # Group by experience level
-                        junior_salaries = [job for job in salary_data if 'junior' in job['experience_level'].lower() or 'entry' in job['experience_level'].lower()]
-                        senior_salaries = [job for job in salary_data if 'senior' in job['experience_level'].lower() or 'lead' in job['experience_level'].lower()]
-                        mid_salaries = [job for job in salary_data if job not in junior_salaries and job not in senior_salaries]
-                        
-                        response = "## AI Engineer Salary Insights\n\n"
-                        response += "Based on real job postings from our database:\n\n"
-                        
-                        if senior_salaries:
-                            response += "**Senior AI Engineers**:\n"
-                            for job in senior_salaries[:3]:
-                                response += f"• {job['title']} at {job['company']} ({job['location']}): {job['salary_range']}\n"
-                            response += "\n"
+                        # Group by experience level in a single pass
+                        senior_salaries, mid_salaries, junior_salaries = [], [], []
+                        for job in salary_data:
+                            level = job['experience_level'].lower()
+                            if any(keyword in level for keyword in _SENIOR_LEVEL_KEYWORDS):
+                                senior_salaries.append(job)
+                            elif any(keyword in level for keyword in _JUNIOR_LEVEL_KEYWORDS):
+                                junior_salaries.append(job)
+                            else:
+                                mid_salaries.append(job)
                         
-                        if mid_salaries:
-                            response += "**Mid-level AI Engineers**:\n"
-                            for job in mid_salaries[:3]:
-                                response += f"• {job['title']} at {job['company']} ({job['location']}): {job['salary_range']}\n"
-                            response += "\n"
+                        parts = [
+                            "## AI Engineer Salary Insights\n\n",
+                            "Based on real job postings from our database:\n\n"
+                        ]
                         
-                        if junior_salaries:
-                            response += "**Junior AI Engineers**:\n"
-                            for job in junior_salaries[:3]:
-                                response += f"• {job['title']} at {job['company']} ({job['location']}): {job['salary_range']}\n"
-                            response += "\n"
+                        for heading, level_salaries in (
+                            ("**Senior AI Engineers**:\n", senior_salaries),
+                            ("**Mid-level AI Engineers**:\n", mid_salaries),
+                            ("**Junior AI Engineers**:\n", junior_salaries)
+                        ):
+                            if level_salaries:
+                                parts.append(heading)
+                                parts.extend(
+                                    f"• {job['title']} at {job['company']} ({job['location']}): {job['salary_range']}\n"
+                                    for job in level_salaries[:3]
+                                )
+                                parts.append("\n")
                         
-                        response += "**Key Factors Affecting AI Engineer Salaries**:\n"
-                        response += "• **Experience Level**: Senior roles typically pay 30-50% more than junior positions\n"
-                        response += "• **Location**: Tech hubs like San Francisco, NYC, and Seattle offer higher salaries\n"
-                        response += "• **Company Size**: Large tech companies often pay premium salaries\n"
-                        response += "• **Skills**: Specialized AI skills (RAG, MCP, LLMs) command higher compensation\n"
-                        response += "• **Remote Work**: Many companies offer competitive salaries for remote positions\n\n"
-                        
-                        response += f"**Data Source**: Based on {len(similar_jobs)} recent job postings from Indeed and other sources.\n\n"
-                        response += "Would you like me to provide more specific salary information for a particular location or skill set?"
+                        parts.append(
+                            "**Key Factors Affecting AI Engineer Salaries**:\n"
+                            "• **Experience Level**: Senior roles typically pay 30-50% more than junior positions\n"
+                            "• **Location**: Tech hubs like San Francisco, NYC, and Seattle offer higher salaries\n"
+                            "• **Company Size**: Large tech companies often pay premium salaries\n"
+                            "• **Skills**: Specialized AI skills (RAG, MCP, LLMs) command higher compensation\n"
+                            "• **Remote Work**: Many companies offer competitive salaries for remote positions\n\n"
+                        )
+                        parts.append(f"**Data Source**: Based on {len(similar_jobs)} recent job postings from Indeed and other sources.\n\n")
+                        parts.append("Would you like me to provide more specific salary information for a particular location or skill set?")
+                        response = "".join(parts)
                         
-                        return {
-                            'message': response,
-                            'type': 'salary_info',
-                            'confidence': 0.95,
-                            'jobs_analyzed': len(similar_jobs)
-                        }
+                        return ChatResponse(
+                            message=response,
+                            type='salary_info',
+                            confidence=0.95,
+                            extra={'jobs_analyzed': len(similar_jobs)}
+                        )
             
             # Fallback to database search if vector search fails
             try:
@@ -1072,26 +1539,30 @@ Would you like detailed information about any specific skill or career path?"""
                     ).limit(5).all()
                     
                     if ai_jobs:
-                        response = "## AI Engineer Salary Insights\n\n"
-                        response += "Based on real job postings from our database:\n\n"
-                        
-                        for job in ai_jobs:
-                            if job.salary_min and job.salary_max:
-                                salary_range = f"${job.salary_min:,} - ${job.salary_max:,}"
-                                response += f"• **{job.title}** at {job.company} ({job.location}): {salary_range}\n"
-                        
-                        response += "\n**Salary Trends**:\n"
-                        response += "• **Entry Level**: $70,000 - $100,000\n"
-                        response += "• **Mid Level**: $100,000 - $150,000\n"
-                        response += "• **Senior Level**: $150,000 - $250,000+\n\n"
-                        response += "Would you like more specific information about AI engineering salaries?"
+                        parts = [
+                            "## AI Engineer Salary Insights\n\n",
+                            "Based on real job postings from our database:\n\n"
+                        ]
+                        parts.extend(
+                            f"• **{job.title}** at {job.company} ({job.location}): ${job.salary_min:,} - ${job.salary_max:,}\n"
+                            for job in ai_jobs
+                            if job.salary_min and job.salary_max
+                        )
+                        parts.append(
+                            "\n**Salary Trends**:\n"
+                            "• **Entry Level**: $70,000 - $100,000\n"
+                            "• **Mid Level**: $100,000 - $150,000\n"
+                            "• **Senior Level**: $150,000 - $250,000+\n\n"
+                            "Would you like more specific information about AI engineering salaries?"
+                        )
+                        response = "".join(parts)
                         
-                        return {
-                            'message': response,
-                            'type': 'salary_info',
-                            'confidence': 0.9,
-                            'jobs_analyzed': len(ai_jobs)
-                        }
+                        return ChatResponse(
+                            message=response,
+                            type='salary_info',
+                            confidence=0.9,
+                            extra={'jobs_analyzed': len(ai_jobs)}
+                        )
             except Exception as db_error:
                 logger.error(f"Database salary search error: {db_error}")
             
@@ -1115,111 +1586,88 @@ Would you like detailed information about any specific skill or career path?"""
                 "Would you like me to search for specific salary data from recent job postings?"
             )
             
-            return {
-                'message': response,
-                'type': 'salary_info',
-                'confidence': 0.8
-            }
+            return ChatResponse(
+                message=response,
+                type='salary_info',
+                confidence=0.8
+            )
             
         except Exception as e:
             logger.error(f"Error in salary question handler: {e}")
-            return {
-                'message': "I'm having trouble accessing salary data right now. Please try again later.",
-                'type': 'error',
-                'confidence': 0.3
-            }
+            return ChatResponse(
+                message="I'm having trouble accessing salary data right now. Please try again later.",
+                type='error',
+                confidence=0.3
+            )
     
-    async def _handle_job_question(self, message: str) -> Dict[str, Any]:
+    @cached_response()
+    async def _handle_job_question(self, message: str, query: Optional[QueryContext] = None) -> ChatResponse:
         """Handle job posting-related questions."""
         try:
             # Use vector search if available
             if self._initialized and self.qdrant_client:
                 # Generate embedding for the query
-                query_embedding = self.embedding_generator._hash_based_embedding(message, 384).tolist()
-                similar_jobs = self.qdrant_client.search_similar_job_postings(query_embedding, top_k=3)
+                query_embedding = self._embed_query(message, query)
+                similar_jobs = await asyncio.to_thread(self.qdrant_client.search_similar_job_postings, query_embedding, top_k=3)
                 
                 if similar_jobs:
-                    job_list = "\n".join([
-                        f"• **{job['title']}** at {job['company']} ({job['location']}) - {job['data_source'].title()}"
+                    # Points ingested with a display label skip the per-request title-casing
+                    job_list = "\n".join(
+                        _JOB_POSTING_LINE(
+                            title=job['title'],
+                            company=job['company'],
+                            location=job['location'],
+                            data_source=job.get('data_source_label') or job['data_source'].title()
+                        )
                         for job in similar_jobs
-                    ])
+                    )
                     
                     response = (
-                        f"## Job Posting Insights\n\n"
-                        f"Based on your query, here are some relevant job postings:\n\n{job_list}\n\n"
-                        f"**Job Market Trends**:\n"
-                        f"• **Remote Work**: Many companies offer remote or hybrid options\n"
-                        f"• **Salary Ranges**: Vary by location, experience, and company size\n"
-                        f"• **Required Skills**: Focus on practical experience and modern technologies\n\n"
-                        f"**Popular Job Platforms**:\n"
-                        
-                        f"• **Indeed** - Wide variety of job types and locations\n"
-                        f"• **Glassdoor** - Company reviews and salary information\n"
-                        f"• **Stack Overflow Jobs** - Developer-specific opportunities\n\n"
-                        f"Would you like me to provide more specific information about any of these roles?"
+                        "## Job Posting Insights\n\n"
+                        "Based on your query, here are some relevant job postings:\n\n"
+                        + job_list + _JOB_MARKET_NOTES
                     )
                     
-                    return {
-                        'message': response,
-                        'type': 'job_search_results',
-                        'confidence': 0.9,
-                        'jobs_found': len(similar_jobs)
-                    }
+                    return ChatResponse(
+                        message=response,
+                        type='job_search_results',
+                        confidence=0.9,
+                        extra={'jobs_found': len(similar_jobs)}
+                    )
             
             # Fallback response if no vector search or no results
-            response = (
-                "## Job Posting Insights\n\n"
-                "Here are some key aspects of job postings:\n\n"
-                "• **Job Titles** - Common roles include 'Software Engineer', 'Data Scientist', 'Full Stack Developer', etc.\n"
-                "• **Required Skills** - Companies often list specific technologies and programming languages.\n"
-                "• **Salary** - Job postings typically include a salary range.\n"
-                "• **Location** - Many postings specify remote or on-site work.\n"
-                "• **Company** - Information about the company, its size, industry, and reputation.\n\n"
-                "**How to Find Job Postings**:\n"
-                
-                "2. **Indeed** - Wide variety of job types\n"
-                "3. **Glassdoor** - Reviews, salaries, and company information\n"
-                "4. **Stack Overflow Jobs** - Developer-specific jobs\n"
-                "5. **RemoteOK** - For remote-friendly positions\n\n"
-                "**Tips for Applying**:\n"
-                "• Read the job description carefully\n"
-                "• Tailor your resume and cover letter\n"
-                "• Prepare for technical interviews\n"
-                "• Network with professionals in your field\n\n"
-                "Would you like me to provide more specific information about job posting trends or help you find a job?"
-            )
+            response = _JOB_POSTING_GUIDE
             
-            return {
-                'message': response,
-                'type': 'job_info',
-                'confidence': 0.9
-            }
+            return ChatResponse(
+                message=response,
+                type='job_info',
+                confidence=0.9
+            )
             
         except Exception as e:
             logger.error(f"Error in job question handler: {e}")
-            return {
-                'message': "I'm having trouble accessing job posting data right now. Please try again later.",
-                'type': 'error',
-                'confidence': 0.3
-            }
+            return ChatResponse(
+                message="I'm having trouble accessing job posting data right now. Please try again later.",
+                type='error',
+                confidence=0.3
+            )
     
-    async def _handle_ai_question(self, message: str) -> Dict[str, Any]:
+    @cached_response()
+    async def _handle_ai_question(self, message: str, query: QueryContext) -> ChatResponse:
         """Handle AI-specific questions using RAG system."""
         try:
-            message_lower = message.lower()
-            
             # Check if it's a salary question about AI
-            if any(word in message_lower for word in ['salary', 'pay', 'money', 'earn', 'income']):
-                return await self._handle_salary_question(message)
+            if not _AI_SALARY_WORDS.isdisjoint(query.tokens):
+                return await self._handle_salary_question(message, query)
             
             # Check if it's asking about AI trends
-            if any(word in message_lower for word in ['trend', 'trends', 'latest', 'new', 'emerging', 'recent', 'current']):
-                return await self._handle_ai_trends_question(message)
+            if not _AI_TRENDS_WORDS.isdisjoint(query.tokens):
+                return await self._handle_ai_trends_question(message, query)
             
             # Use RAG with LLM for AI questions
             if self._initialized and self.qdrant_client:
                 # Retrieve relevant context
-                context = await self._retrieve_ai_trends_context(message)
+                context = await self._retrieve_ai_trends_context(message, query)
                 
                 # Generate LLM response with context
                 response = await self._generate_llm_response_with_context(
@@ -1228,51 +1676,38 @@ Would you like detailed information about any specific skill or career path?"""
                     response_type="ai_career"
                 )
                 
-                return {
-                    'message': response,
-                    'type': 'ai_career_info',
-                    'confidence': 0.95,
-                    'context_used': len(context) if context else 0
-                }
+                return ChatResponse(
+                    message=response,
+                    type='ai_career_info',
+                    confidence=0.95,
+                    extra={'context_used': len(context) if context else 0}
+                )
             
             # Fallback response
-            response = (
-                "## AI Engineering Career Path\n\n"
-                "**What is AI Engineering?**\n"
-                "AI Engineers build and deploy artificial intelligence systems, including machine learning models, neural networks, and intelligent applications.\n\n"
-                "**Key Skills**:\n"
-                "• **Programming**: Python, R, Julia\n"
-                "• **Mathematics**: Linear Algebra, Calculus, Statistics\n"
-                "• **Machine Learning**: Scikit-learn, TensorFlow, PyTorch\n"
-                "• **Deep Learning**: Neural Networks, CNNs, RNNs\n"
-                "• **AI Tools**: RAG Systems, LLMs, Vector Databases\n\n"
-                "**Career Progression**:\n"
-                "• **Junior AI Engineer**: Focus on model implementation\n"
-                "• **Senior AI Engineer**: Lead AI projects and teams\n"
-                "• **AI Research Engineer**: Develop new AI algorithms\n"
-                "• **AI Engineering Lead**: Strategic AI initiatives\n\n"
-                "Would you like specific information about AI engineering salaries, required skills, or job opportunities?"
-            )
+            response = _AI_CAREER_OVERVIEW
             
-            return {
-                'message': response,
-                'type': 'ai_career_info',
-                'confidence': 0.9
-            }
+            return ChatResponse(
+                message=response,
+                type='ai_career_info',
+                confidence=0.9
+            )
             
         except Exception as e:
             logger.error(f"Error in AI question handler: {e}")
-            return {
-                'message': "I'm having trouble accessing AI career information right now. Please try again later.",
-                'type': 'error',
-                'confidence': 0.3
-            }
+            return ChatResponse(
+                message="I'm having trouble accessing AI career information right now. Please try again later.",
+                type='error',
+                confidence=0.3
+            )
 
-    async def _handle_ai_trends_question(self, message: str) -> Dict[str, Any]:
+    @cached_response(prefetch='_retrieve_ai_trends_context')
+    async def _handle_ai_trends_question(self, message: str, query: Optional[QueryContext] = None,
+                                         context: Optional[List[Dict[str, Any]]] = None) -> ChatResponse:
         """Handle AI trends and latest developments questions using RAG with LLM."""
         try:
-            # Step 1: Retrieve relevant context from vector database
-            context = await self._retrieve_ai_trends_context(message)
+            # Step 1: Retrieve relevant context from vector database (unless prefetched)
+            if context is None:
+                context = await self._retrieve_ai_trends_context(message, query)
             
             # Step 2: Generate LLM response using retrieved context
             response = await self._generate_llm_response_with_context(
@@ -1281,191 +1716,91 @@ Would you like detailed information about any specific skill or career path?"""
                 response_type="ai_trends"
             )
             
-            return {
-                'message': response,
-                'type': 'ai_trends',
-                'confidence': 0.95,
-                'context_used': len(context) if context else 0
-            }
+            return ChatResponse(
+                message=response,
+                type='ai_trends',
+                confidence=0.95,
+                extra={'context_used': len(context) if context else 0}
+            )
             
         except Exception as e:
             logger.error(f"Error in AI trends handler: {e}")
-            return {
-                'message': "I'm having trouble accessing AI trends information right now. Please try again later.",
-                'type': 'error',
-                'confidence': 0.3
-            }
+            return ChatResponse(
+                message="I'm having trouble accessing AI trends information right now. Please try again later.",
+                type='error',
+                confidence=0.3
+            )
 
-    async def _handle_learning_question(self, message: str) -> Dict[str, Any]:
+    async def _handle_learning_question(self, message: str) -> ChatResponse:
         """Handle learning path questions."""
-        response = (
-            "## Learning Path Recommendations\n\n"
-            "I can help you create personalized learning paths! Here are some popular options:\n\n"
-            "🎯 **Web Development Path**:\n"
-            "1. HTML, CSS, JavaScript fundamentals\n"
-            "2. React or Vue.js frontend framework\n"
-            "3. Node.js backend development\n"
-            "4. Database design and SQL\n"
-            "5. Deployment and DevOps basics\n\n"
-            "🤖 **Data Science Path**:\n"
-            "1. Python programming\n"
-            "2. Data analysis with Pandas\n"
-            "3. Statistics and probability\n"
-            "4. Machine learning algorithms\n"
-            "5. Data visualization\n\n"
-            "☁️ **DevOps Path**:\n"
-            "1. Linux system administration\n"
-            "2. Docker containerization\n"
-            "3. Cloud platforms (AWS/Azure)\n"
-            "4. CI/CD pipelines\n"
-            "5. Infrastructure as code\n\n"
-            "Which learning path interests you? I can provide a detailed step-by-step roadmap!"
-        )
+        response = _LEARNING_PATHS
         
-        return {
-            'message': response,
-            'type': 'learning_path',
-            'confidence': 0.9
-        }
+        return ChatResponse(
+            message=response,
+            type='learning_path',
+            confidence=0.9
+        )
     
-    async def _handle_technology_question(self, message: str) -> Dict[str, Any]:
+    async def _handle_technology_question(self, message: str, query: QueryContext) -> ChatResponse:
         """Handle specific technology questions."""
-        tech_info = {
-            'python': {
-                'description': 'Versatile programming language for web development, data science, and automation',
-                'use_cases': 'Web development, data analysis, machine learning, automation',
-                'learning_time': '3-6 months for basics',
-                'resources': 'Python.org, Real Python, Codecademy'
-            },
-            'javascript': {
-                'description': 'Essential language for web development and building interactive applications',
-                'use_cases': 'Frontend development, backend (Node.js), mobile apps',
-                'learning_time': '2-4 months for basics',
-                'resources': 'MDN Web Docs, JavaScript.info, freeCodeCamp'
-            },
-            'react': {
-                'description': 'Popular JavaScript library for building user interfaces',
-                'use_cases': 'Single-page applications, mobile apps, interactive UIs',
-                'learning_time': '2-3 months after JavaScript',
-                'resources': 'React docs, Create React App, React Tutorial'
-            },
-            'node': {
-                'description': 'JavaScript runtime for building server-side applications',
-                'use_cases': 'Backend APIs, real-time applications, microservices',
-                'learning_time': '1-2 months after JavaScript',
-                'resources': 'Node.js docs, Express.js, Node.js Tutorial'
-            },
-            'sql': {
-                'description': 'Standard language for managing and querying databases',
-                'use_cases': 'Data storage, analysis, reporting, business intelligence',
-                'learning_time': '1-2 months',
-                'resources': 'SQL Tutorial, W3Schools, LeetCode SQL'
-            },
-            'docker': {
-                'description': 'Platform for developing, shipping, and running applications in containers',
-                'use_cases': 'Application deployment, development environments, microservices',
-                'learning_time': '1-2 months',
-                'resources': 'Docker docs, Docker Tutorial, Docker Hub'
-            }
-        }
-        
-        for tech, info in tech_info.items():
-            if tech in message_lower:
-                response = (
-                    f"## {tech.title()} Technology Overview\n\n"
-                    f"**Description**: {info['description']}\n\n"
-                    f"**Use Cases**: {info['use_cases']}\n\n"
-                    f"**Learning Time**: {info['learning_time']}\n\n"
-                    f"**Learning Resources**: {info['resources']}\n\n"
-                    f"Would you like me to provide a detailed learning path for {tech.title()}?"
+        for tech, overview in _TECH_OVERVIEWS.items():
+            if tech in query.lower:
+                return ChatResponse(
+                    message=overview,
+                    type='technology_info',
+                    confidence=0.95,
+                    extra={'technology': tech}
                 )
-                return {
-                    'message': response,
-                    'type': 'technology_info',
-                    'confidence': 0.95,
-                    'technology': tech
-                }
         
-        return {
-            'message': "I can provide detailed information about various technologies like Python, JavaScript, React, Node.js, SQL, and Docker. Which technology would you like to learn more about?",
-            'type': 'technology_general',
-            'confidence': 0.8
-        }
+        return ChatResponse(
+            message="I can provide detailed information about various technologies like Python, JavaScript, React, Node.js, SQL, and Docker. Which technology would you like to learn more about?",
+            type='technology_general',
+            confidence=0.8
+        )
     
-    def _determine_query_type(self, message: str) -> str:
+    def _determine_query_type(self, query: QueryContext) -> str:
         """Determine the type of query for Graph RAG processing."""
-        message_lower = message.lower()
-        
-        # Career guidance queries
-        if any(word in message_lower for word in ['career', 'path', 'transition', 'advancement', 'growth', 'development']):
-            return 'career_guidance'
-        
-        # Skill analysis queries
-        if any(word in message_lower for word in ['skill', 'technology', 'learn', 'master', 'improve', 'gap']):
-            return 'skill_analysis'
-        
-        # Networking queries
-        if any(word in message_lower for word in ['network', 'connect', 'collaborate', 'mentor', 'community']):
-            return 'networking'
-        
-        # Learning path queries
-        if any(word in message_lower for word in ['learn', 'study', 'course', 'roadmap', 'curriculum']):
-            return 'learning_path'
-        
-        # Job market queries
-        if any(word in message_lower for word in ['job', 'market', 'opportunity', 'position', 'role']):
-            return 'job_market'
-        
-        # Project ideas queries
-        if any(word in message_lower for word in ['project', 'build', 'create', 'develop', 'portfolio']):
-            return 'project_ideas'
+        for query_type, words in _QUERY_TYPE_WORDS:
+            if not words.isdisjoint(query.tokens):
+                return query_type
         
         # Default to career guidance
         return 'career_guidance'
     
-    async def _handle_general_question(self, message: str) -> Dict[str, Any]:
+    async def _handle_general_question(self, message: str) -> ChatResponse:
         """Handle general questions with helpful suggestions."""
-        response = (
-            "I'm here to help with your developer career! Here are some things I can assist you with:\n\n"
-            "🎯 **Career Guidance**: Ask about different developer roles and career paths\n"
-            "💡 **Skill Recommendations**: Get personalized skill suggestions based on your goals\n"
-            "💰 **Salary Information**: Learn about compensation for different roles\n"
-            "📚 **Learning Paths**: Get step-by-step learning roadmaps\n"
-            "🔍 **Technology Insights**: Learn about specific technologies and their applications\n\n"
-            "Try asking me questions like:\n"
-            "• \"What skills do I need for a full stack developer role?\"\n"
-            "• \"How much do data scientists earn?\"\n"
-            "• \"What's the learning path for Python?\"\n"
-            "• \"Tell me about React development\"\n\n"
-            "What would you like to know?"
-        )
+        response = _GENERAL_HELP
         
-        return {
-            'message': response,
-            'type': 'general_help',
-            'confidence': 0.8
-        }
+        return ChatResponse(
+            message=response,
+            type='general_help',
+            confidence=0.8
+        )
     
     def get_conversation_history(self, user_id: str) -> List[Dict[str, Any]]:
         """Get conversation history for a user."""
-        return self.conversation_history.get(user_id, [])
+        return list(self.conversation_history.get(user_id, ()))
     
-    async def _retrieve_ai_trends_context(self, message: str) -> List[Dict[str, Any]]:
+    async def _retrieve_ai_trends_context(self, message: str,
+                                          query: Optional[QueryContext] = None) -> List[Dict[str, Any]]:
         """Retrieve relevant context for AI trends questions from vector database."""
         try:
             if not self._initialized or not self.qdrant_client:
                 return []
             
             # Generate embedding for the query
-            query_embedding = self.embedding_generator._hash_based_embedding(message, 384).tolist()
-            
-            # Search for relevant skills, jobs, and career paths
-            similar_skills = self.qdrant_client.search_similar_skills(query_embedding, top_k=5)
-            similar_jobs = self.qdrant_client.search_similar_job_postings(query_embedding, top_k=3)
-            similar_careers = self.qdrant_client.search_similar_career_paths(query_embedding, top_k=3)
+            query_embedding = self._embed_query(message, query)
+            
+            # Search skills, jobs, and career paths concurrently; Qdrant's batch search is
+            # per collection, so the three lookups go out as parallel worker-thread calls
+            similar_skills, similar_jobs, similar_careers = await asyncio.gather(
+                asyncio.to_thread(self.qdrant_client.search_similar_skills, query_embedding, top_k=5),
+                asyncio.to_thread(self.qdrant_client.search_similar_job_postings, query_embedding, top_k=3),
+                asyncio.to_thread(self.qdrant_client.search_similar_career_paths, query_embedding, top_k=3)
+            )
             
-    
-            logger.info(f"Retrieved {len(similar_skills)} skills, {len(similar_jobs)} jobs, {len(similar_careers)} careers for query: {message[:50]}...")
+            logger.info("Retrieved %d skills, %d jobs, %d careers for query: %.50s...",
+                        len(similar_skills), len(similar_jobs), len(similar_careers), message)
             
             context = []
             
@@ -1473,7 +1808,7 @@ Would you like detailed information about any specific skill or career path?"""
             if similar_skills:
                 for skill in similar_skills:
                     skill_name = skill.get('skill_name', 'Unknown Skill')
-                    if any(ai_term in skill_name.lower() for ai_term in ['ai', 'machine learning', 'deep learning', 'neural', 'tensorflow', 'pytorch', 'scikit', 'rag', 'llm', 'vector']):
+                    if _AI_SKILL_TERM_RE.search(skill_name):
                         context.append({
                             'type': 'skill',
                             'content': f"AI Skill: {skill_name} - {skill.get('category', 'AI/ML')}",
@@ -1484,7 +1819,7 @@ Would you like detailed information about any specific skill or career path?"""
             if similar_jobs:
                 for job in similar_jobs:
                     job_title = job.get('title', 'Unknown Job')
-                    if any(ai_term in job_title.lower() for ai_term in ['ai', 'machine learning', 'data scientist', 'ml engineer', 'ai engineer']):
+                    if _AI_JOB_TERM_RE.search(job_title):
                         context.append({
                             'type': 'job',
                             'content': f"AI Job: {job_title} at {job.get('company', 'Unknown Company')} - {job.get('description', '')[:200]}...",
@@ -1495,18 +1830,16 @@ Would you like detailed information about any specific skill or career path?"""
             if similar_careers:
                 for career in similar_careers:
                     path_name = career.get('path_name', 'Unknown Career Path')
-                    if any(ai_term in path_name.lower() for ai_term in ['ai', 'data scientist', 'machine learning']):
+                    if _AI_CAREER_TERM_RE.search(path_name):
                         context.append({
                             'type': 'career',
                             'content': f"AI Career: {path_name} - {career.get('description', '')[:200]}...",
                             'relevance': career.get('score', 0)
                         })
             
-            # Sort by relevance
-            context.sort(key=lambda x: x['relevance'], reverse=True)
-            
-            final_context = context[:10]  # Return top 10 most relevant items
-            logger.info(f"Final context for AI trends query: {len(final_context)} items")
+            # Keep the 10 most relevant items without sorting the whole list
+            final_context = nlargest(10, context, key=itemgetter('relevance'))
+            logger.info("Final context for AI trends query: %d items", len(final_context))
             
             return final_context
             
@@ -1528,23 +1861,7 @@ Would you like detailed information about any specific skill or career path?"""
             ])
             
             # Create RAG prompt
-            prompt = f"""
-You are an AI career assistant with expertise in AI trends and developments. Use the following context to answer the user's question about AI trends.
-
-User Question: {message}
-
-Relevant Context:
-{context_text}
-
-Instructions:
-1. Use the provided context to give accurate, up-to-date information about AI trends
-2. Focus on practical applications and career implications
-3. If the context doesn't fully answer the question, supplement with your knowledge of current AI trends
-4. Structure your response with clear headings and bullet points
-5. Include specific examples and career opportunities where relevant
-
-Please provide a comprehensive, well-structured response about AI trends based on the context and your knowledge.
-"""
+            prompt = _AI_TRENDS_PROMPT(message=message, context_text=context_text)
             
             # Generate response using LLM
             if hasattr(self, 'llm_client') and self.llm_client:
@@ -1565,54 +1882,7 @@ Please provide a comprehensive, well-structured response about AI trends based o
     
     async def _generate_fallback_ai_trends_response(self, message: str) -> str:
         """Generate fallback response when LLM is not available."""
-        return (
-            "## Latest AI Trends and Developments (2024-2025)\n\n"
-            "**🔥 Current AI Trends**:\n\n"
-            "**1. RAG (Retrieval-Augmented Generation)**\n"
-            "• **What it is**: Combines large language models with external knowledge bases\n"
-            "• **Why it's trending**: Solves hallucination issues and provides accurate, up-to-date information\n"
-            "• **Applications**: AI assistants, knowledge management, research tools\n\n"
-            
-            "**2. MCP (Model Context Protocol)**\n"
-            "• **What it is**: Standardized protocol for AI tool integration\n"
-            "• **Why it's trending**: Enables AI models to use external tools and APIs seamlessly\n"
-            "• **Applications**: AI agents, automation, workflow integration\n\n"
-            
-            "**3. Vector Databases & Embeddings**\n"
-            "• **What it is**: Specialized databases for similarity search and semantic understanding\n"
-            "• **Why it's trending**: Essential for RAG systems and semantic search\n"
-            "• **Applications**: Recommendation systems, search engines, content discovery\n\n"
-            
-            "**4. Prompt Engineering & Optimization**\n"
-            "• **What it is**: Techniques for optimizing AI model interactions\n"
-            "• **Why it's trending**: Critical for getting the best results from LLMs\n"
-            "• **Applications**: AI product development, content generation, automation\n\n"
-            
-            "**5. AI Safety & Guardrails**\n"
-            "• **What it is**: Methods to ensure AI systems behave safely and ethically\n"
-            "• **Why it's trending**: Essential as AI becomes more powerful and widespread\n"
-            "• **Applications**: Content filtering, bias detection, safety protocols\n\n"
-            
-            "**6. Multimodal AI**\n"
-            "• **What it is**: AI that can process text, images, audio, and video\n"
-            "• **Why it's trending**: More natural and comprehensive AI interactions\n"
-            "• **Applications**: Content creation, analysis, accessibility tools\n\n"
-            
-            "**🚀 Emerging Technologies**:\n"
-            "• **Agentic AI**: Autonomous AI agents that can complete complex tasks\n"
-            "• **Synchronous/Asynchronous AI**: Real-time and batch AI processing\n"
-            "• **Graph RAG**: Combining knowledge graphs with RAG for enhanced reasoning\n"
-            "• **AI Evaluation Methods**: Systematic ways to measure AI performance\n\n"
-            
-            "**💼 Career Impact**:\n"
-            "These trends are creating new job opportunities in:\n"
-            "• **AI Engineering**: Building and deploying AI systems\n"
-            "• **Prompt Engineering**: Optimizing AI interactions\n"
-            "• **AI Safety**: Ensuring responsible AI development\n"
-            "• **Vector Database Engineering**: Specialized data infrastructure\n\n"
-            
-            "Would you like me to provide more details about any specific AI trend or how to get started in AI engineering?"
-        )
+        return _AI_TRENDS_OVERVIEW
 
     def clear_conversation_history(self, user_id: str):
         """Clear conversation history for a user."""
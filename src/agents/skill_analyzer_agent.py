@@ -3,7 +3,11 @@ Skill Analyzer Agent for DevCareerCompass Phase 3.
 Specializes in extracting and analyzing skills from various sources.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple, Union
+from collections import OrderedDict
+import hashlib
+from operator import itemgetter
+from types import MappingProxyType
 import json
 import re
 
@@ -13,10 +17,87 @@ from src.utils.logger import get_application_logger
 
 logger = get_application_logger(__name__)
 
+# Repository topic categories in priority order; each keyword group is one alternation
+# matched anywhere in the lowercased topic
+_TOPIC_CATEGORY_PATTERNS = tuple(
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in (
+        ('api', ('api', 'rest', 'graphql')),
+        ('web_development', ('web', 'frontend', 'backend')),
+        ('ai_ml', ('ai', 'ml', 'machine-learning', 'deep-learning')),
+        ('mobile', ('mobile', 'ios', 'android')),
+        ('devops', ('devops', 'ci', 'cd', 'deployment')),
+        ('database', ('database', 'db', 'sql', 'nosql'))
+    )
+)
+
+# Word tokens used for exact skill hits; a skill made only of word characters is present
+# exactly when it is one of the text's maximal \w+ runs
+_WORD_RE = re.compile(r'\w+')
+
+# Skill vocabulary by category, in reporting order; shared by every agent instance
+_SKILL_CATEGORIES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('programming_languages', (
+        'python', 'javascript', 'java', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin',
+        'typescript', 'php', 'ruby', 'scala', 'r', 'matlab', 'perl', 'bash', 'shell'
+    )),
+    ('frameworks', (
+        'react', 'vue', 'angular', 'django', 'flask', 'express', 'spring', 'laravel',
+        'rails', 'asp.net', 'fastapi', 'gin', 'echo', 'fiber', 'actix', 'rocket'
+    )),
+    ('databases', (
+        'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra',
+        'dynamodb', 'sqlite', 'oracle', 'sql server', 'neo4j', 'influxdb'
+    )),
+    ('cloud_platforms', (
+        'aws', 'azure', 'gcp', 'digitalocean', 'heroku', 'vercel', 'netlify',
+        'firebase', 'supabase', 'railway', 'render'
+    )),
+    ('devops_tools', (
+        'docker', 'kubernetes', 'jenkins', 'gitlab', 'github actions', 'terraform',
+        'ansible', 'prometheus', 'grafana', 'elk stack', 'splunk'
+    ))
+)
+
+# Each skill paired with its lowercase form, so text scans never re-lowercase the vocabulary
+_SKILL_CATEGORIES_LOWER = tuple(
+    (category, tuple((skill, skill.lower()) for skill in skills))
+    for category, skills in _SKILL_CATEGORIES
+)
+
+
+def _build_skill_matchers() -> Tuple[frozenset, Tuple[Tuple[str, "re.Pattern"], ...]]:
+    """Split the vocabulary into plain-word skills and word-bounded phrase patterns."""
+    # Skills are matched as whole words so e.g. 'r' no longer fires inside 'react':
+    # plain words by set membership against the text's tokens, and the few with
+    # spaces or punctuation ('sql server', 'c++', 'asp.net') by a word-bounded regex
+    skills_lower = {
+        skill_lower
+        for _, skills in _SKILL_CATEGORIES_LOWER
+        for _, skill_lower in skills
+    }
+    word_skills = frozenset(
+        skill_lower for skill_lower in skills_lower if _WORD_RE.fullmatch(skill_lower)
+    )
+    phrase_patterns = tuple(
+        (skill_lower, re.compile(rf'(?<!\w){re.escape(skill_lower)}(?!\w)'))
+        for skill_lower in sorted(skills_lower - word_skills)
+    )
+    return word_skills, phrase_patterns
+
+
+_WORD_SKILLS, _PHRASE_SKILL_PATTERNS = _build_skill_matchers()
+
+# Pattern-extraction results are memoized per agent by content digest, evicting least recently used
+PATTERN_CACHE_SIZE = 2048
+
 
 class SkillAnalyzerAgent(BaseAgent):
     """Agent specialized in skill extraction and analysis."""
     
+    # Skill categories, built once at import and read-only since every instance shares them
+    skill_categories: Mapping[str, Tuple[str, ...]] = MappingProxyType(dict(_SKILL_CATEGORIES))
+    
     def __init__(self, llm_client: BaseLLMClient, **kwargs):
         """
         Initialize the skill analyzer agent.
@@ -27,29 +108,7 @@ class SkillAnalyzerAgent(BaseAgent):
         """
         super().__init__("SkillAnalyzer", llm_client, **kwargs)
         
-        # Skill categories and patterns
-        self.skill_categories = {
-            'programming_languages': [
-                'python', 'javascript', 'java', 'c++', 'c#', 'go', 'rust', 'swift', 'kotlin',
-                'typescript', 'php', 'ruby', 'scala', 'r', 'matlab', 'perl', 'bash', 'shell'
-            ],
-            'frameworks': [
-                'react', 'vue', 'angular', 'django', 'flask', 'express', 'spring', 'laravel',
-                'rails', 'asp.net', 'fastapi', 'gin', 'echo', 'fiber', 'actix', 'rocket'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra',
-                'dynamodb', 'sqlite', 'oracle', 'sql server', 'neo4j', 'influxdb'
-            ],
-            'cloud_platforms': [
-                'aws', 'azure', 'gcp', 'digitalocean', 'heroku', 'vercel', 'netlify',
-                'firebase', 'supabase', 'railway', 'render'
-            ],
-            'devops_tools': [
-                'docker', 'kubernetes', 'jenkins', 'gitlab', 'github actions', 'terraform',
-                'ansible', 'prometheus', 'grafana', 'elk stack', 'splunk'
-            ]
-        }
+        self._pattern_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
     
     def get_capabilities(self) -> List[str]:
         """Get the agent's capabilities."""
@@ -97,14 +156,15 @@ class SkillAnalyzerAgent(BaseAgent):
         if not commits:
             return {"error": "No commits provided"}
         
-        # Combine all commit messages
-        all_messages = " ".join([commit.get('message', '') for commit in commits])
+        # Combine all commit messages for the LLM, which needs them as one text
+        messages = [commit.get('message', '') for commit in commits]
+        all_messages = " ".join(messages)
         
         # Extract skills using LLM
         skills_analysis = await self.analyze_with_llm(all_messages, 'skills')
         
-        # Additional pattern-based extraction
-        pattern_skills = self._extract_skills_by_patterns(all_messages)
+        # Additional pattern-based extraction, scanning one message at a time
+        pattern_skills = self._extract_skills_by_patterns(messages)
         
         # Combine results
         combined_skills = self._combine_skill_results(skills_analysis, pattern_skills)
@@ -148,8 +208,8 @@ class SkillAnalyzerAgent(BaseAgent):
             'topics_analysis': topic_skills,
             'llm_analysis': llm_analysis,
             'combined_skills': self._combine_skill_results(llm_analysis, {
-                'languages': language_skills,
-                'topics': topic_skills
+                'languages': language_skills['languages'],
+                'topics': topic_skills['topics']
             })
         }
     
@@ -168,8 +228,9 @@ class SkillAnalyzerAgent(BaseAgent):
         profile_text = f"{bio} {company} {location}"
         
         # Analyze with LLM
-        skills_analysis = await self.analyze_with_llm(profile_text, 'skills')
-        interests_analysis = await self.analyze_with_llm(profile_text, 'interests')
+        analyses = await self.analyze_with_llm_multi(profile_text, ['skills', 'interests'])
+        skills_analysis = analyses['skills']
+        interests_analysis = analyses['interests']
         
         return {
             'task_type': 'profile_analysis',
@@ -207,10 +268,11 @@ class SkillAnalyzerAgent(BaseAgent):
         """Perform general skill analysis."""
         text = task_data.get('text', '')
         
-        # Multiple analysis types
-        skills_analysis = await self.analyze_with_llm(text, 'skills')
-        career_level = await self.analyze_with_llm(text, 'career_level')
-        interests = await self.analyze_with_llm(text, 'interests')
+        # Multiple analysis types, requested from the LLM in one batched call
+        analyses = await self.analyze_with_llm_multi(text, ['skills', 'career_level', 'interests'])
+        skills_analysis = analyses['skills']
+        career_level = analyses['career_level']
+        interests = analyses['interests']
         
         return {
             'task_type': 'general_analysis',
@@ -224,20 +286,54 @@ class SkillAnalyzerAgent(BaseAgent):
             }
         }
     
-    def _extract_skills_by_patterns(self, text: str) -> Dict[str, List[str]]:
-        """Extract skills using pattern matching."""
-        text_lower = text.lower()
-        found_skills = {}
-        
-        for category, skills in self.skill_categories.items():
-            category_skills = []
-            for skill in skills:
-                if skill.lower() in text_lower:
-                    category_skills.append(skill)
+    def _extract_skills_by_patterns(self, text: Union[str, Iterable[str]]) -> Dict[str, List[str]]:
+        """Extract skills using pattern matching from a text or an iterable of texts."""
+        texts = (text,) if isinstance(text, str) else tuple(text)
+        
+        # Re-scans of the same README/bio/commits are served from the cache
+        digest = hashlib.sha1()
+        for chunk in texts:
+            digest.update(chunk.encode())
+            digest.update(b'\0')
+        key = digest.digest()
+        
+        found = self._pattern_cache.get(key)
+        if found is not None:
+            self._pattern_cache.move_to_end(key)
+        else:
+            found = self._scan_skill_patterns(texts)
+            self._pattern_cache[key] = found
+            if len(self._pattern_cache) > PATTERN_CACHE_SIZE:
+                self._pattern_cache.popitem(last=False)
+        
+        return {category: list(skills) for category, skills in found}
+    
+    def _scan_skill_patterns(self, texts: Tuple[str, ...]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """Find whole-word skill hits, grouped by category in declaration order."""
+        # Lowercase one text at a time so no lowercased copy of the whole input is built
+        tokens = set()
+        matched = set()
+        for chunk in texts:
+            chunk_lower = chunk.lower()
+            tokens.update(_WORD_RE.findall(chunk_lower))
+            matched.update(
+                skill_lower for skill_lower, pattern in _PHRASE_SKILL_PATTERNS
+                if skill_lower in chunk_lower and pattern.search(chunk_lower)
+            )
+        matched.update(_WORD_SKILLS.intersection(tokens))
+        
+        found_skills = []
+        
+        if not matched:
+            return ()
+        
+        # Report hits per category in declaration order
+        for category, skills in _SKILL_CATEGORIES_LOWER:
+            category_skills = tuple(skill for skill, skill_lower in skills if skill_lower in matched)
             if category_skills:
-                found_skills[category] = category_skills
+                found_skills.append((category, category_skills))
         
-        return found_skills
+        return tuple(found_skills)
     
     def _analyze_languages(self, languages: Dict[str, int]) -> Dict[str, Any]:
         """Analyze programming languages from repository data."""
@@ -245,7 +341,7 @@ class SkillAnalyzerAgent(BaseAgent):
             return {"languages": [], "primary_language": None, "language_count": 0}
         
         # Sort by usage
-        sorted_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)
+        sorted_languages = sorted(languages.items(), key=itemgetter(1), reverse=True)
         
         return {
             "languages": [lang for lang, _ in sorted_languages],
@@ -262,10 +358,7 @@ class SkillAnalyzerAgent(BaseAgent):
         # Categorize topics
         categorized_topics = {}
         for topic in topics:
-            category = self._categorize_topic(topic)
-            if category not in categorized_topics:
-                categorized_topics[category] = []
-            categorized_topics[category].append(topic)
+            categorized_topics.setdefault(self._categorize_topic(topic), []).append(topic)
         
         return {
             "topics": topics,
@@ -277,47 +370,44 @@ class SkillAnalyzerAgent(BaseAgent):
         """Categorize a topic based on its content."""
         topic_lower = topic.lower()
         
-        if any(word in topic_lower for word in ['api', 'rest', 'graphql']):
-            return 'api'
-        elif any(word in topic_lower for word in ['web', 'frontend', 'backend']):
-            return 'web_development'
-        elif any(word in topic_lower for word in ['ai', 'ml', 'machine-learning', 'deep-learning']):
-            return 'ai_ml'
-        elif any(word in topic_lower for word in ['mobile', 'ios', 'android']):
-            return 'mobile'
-        elif any(word in topic_lower for word in ['devops', 'ci', 'cd', 'deployment']):
-            return 'devops'
-        elif any(word in topic_lower for word in ['database', 'db', 'sql', 'nosql']):
-            return 'database'
-        else:
-            return 'other'
+        for category, pattern in _TOPIC_CATEGORY_PATTERNS:
+            if pattern.search(topic_lower):
+                return category
+        
+        return 'other'
     
-    def _combine_skill_results(self, llm_results: Dict[str, Any], pattern_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _combine_skill_results(self, llm_results: Dict[str, Any],
+                               pattern_results: Dict[str, Iterable[str]]) -> Dict[str, Any]:
         """Combine LLM and pattern-based skill extraction results."""
-        combined = {
-            'skills': [],
-            'technologies': [],
-            'tools': [],
-            'categories': {}
-        }
+        # Nothing found by either extractor, so skip the merge
+        if not llm_results and not pattern_results:
+            return {'skills': [], 'technologies': [], 'tools': [], 'categories': {}}
+        
+        # Accumulate into insertion-ordered dicts used as ordered sets, so duplicates are
+        # dropped as they arrive and first-seen order keeps the results deterministic
+        skills: Dict[str, None] = {}
+        technologies: Dict[str, None] = {}
+        tools: Dict[str, None] = {}
+        categories: Dict[str, List[str]] = {}
         
         # Add LLM results
         if isinstance(llm_results, dict):
-            combined['skills'].extend(llm_results.get('skills', []))
-            combined['technologies'].extend(llm_results.get('technologies', []))
-            combined['tools'].extend(llm_results.get('tools', []))
+            skills.update(dict.fromkeys(llm_results.get('skills', [])))
+            technologies.update(dict.fromkeys(llm_results.get('technologies', [])))
+            tools.update(dict.fromkeys(llm_results.get('tools', [])))
         
         # Add pattern results
         if isinstance(pattern_results, dict):
-            for category, skills in pattern_results.items():
-                if category not in combined['categories']:
-                    combined['categories'][category] = []
-                combined['categories'][category].extend(skills)
-                combined['skills'].extend(skills)
-        
-        # Remove duplicates
-        combined['skills'] = list(set(combined['skills']))
-        combined['technologies'] = list(set(combined['technologies']))
-        combined['tools'] = list(set(combined['tools']))
+            for category, category_skills in pattern_results.items():
+                category_skills = dict.fromkeys(category_skills)
+                categories[category] = list(category_skills)
+                skills.update(category_skills)
+        
+        combined = {
+            'skills': list(skills),
+            'technologies': list(technologies),
+            'tools': list(tools),
+            'categories': categories
+        }
         
         return combined 
\ No newline at end of file
@@ -2,70 +2,79 @@
 Application settings and configuration management
 """
 import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
     
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        extra="ignore",  # Ignore extra fields in .env file
+        populate_by_name=True
+    )
+    
     # GitHub API Configuration
-    github_token: Optional[str] = Field(None, env="GITHUB_TOKEN")
-    github_api_base_url: str = Field("https://api.github.com", env="GITHUB_API_BASE_URL")
+    github_token: Optional[str] = Field(default=None, validation_alias="GITHUB_TOKEN")
+    github_api_base_url: str = Field(default="https://api.github.com", validation_alias="GITHUB_API_BASE_URL")
     
     # Database Configuration
-    database_url: str = Field("sqlite:///./devcareer_compass.db", env="DATABASE_URL")
+    database_url: str = Field(default="sqlite:///./devcareer_compass.db", validation_alias="DATABASE_URL")
     
     # Qdrant Cloud Vector Database Configuration
-    qdrant_cloud_url: Optional[str] = Field(None, env="QDRANT_CLOUD_URL")
-    qdrant_api_key: Optional[str] = Field(None, env="QDRANT_API_KEY")
+    qdrant_cloud_url: Optional[str] = Field(default=None, validation_alias="QDRANT_CLOUD_URL")
+    qdrant_api_key: Optional[str] = Field(default=None, validation_alias="QDRANT_API_KEY")
     
     # Application Configuration
-    app_env: str = Field("development", env="APP_ENV")
-    log_level: str = Field("INFO", env="LOG_LEVEL")
-    debug: bool = Field(True, env="DEBUG")
+    app_env: str = Field(default="development", validation_alias="APP_ENV")
+    log_level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
+    debug: bool = Field(default=True, validation_alias="DEBUG")
     
     # Data Collection Configuration
-    max_repositories_per_user: int = Field(100, env="MAX_REPOSITORIES_PER_USER")
-    max_commits_per_repository: int = Field(1000, env="MAX_COMMITS_PER_REPOSITORY")
-    rate_limit_delay: float = Field(1.0, env="RATE_LIMIT_DELAY")
-    max_developers_to_collect: int = Field(100, env="MAX_DEVELOPERS_TO_COLLECT")
+    max_repositories_per_user: int = Field(default=100, validation_alias="MAX_REPOSITORIES_PER_USER")
+    max_commits_per_repository: int = Field(default=1000, validation_alias="MAX_COMMITS_PER_REPOSITORY")
+    github_requests_per_hour: int = Field(default=5000, validation_alias="GITHUB_REQUESTS_PER_HOUR")
+    github_search_requests_per_minute: int = Field(default=30, validation_alias="GITHUB_SEARCH_REQUESTS_PER_MINUTE")
+    stack_overflow_requests_per_second: int = Field(default=30, validation_alias="STACK_OVERFLOW_REQUESTS_PER_SECOND")
+    collector_max_workers: int = Field(default=8, validation_alias="COLLECTOR_MAX_WORKERS")
+    api_cache_path: str = Field(default=".cache/api_responses.sqlite", validation_alias="API_CACHE_PATH")
+    api_cache_ttl: int = Field(default=3600, validation_alias="API_CACHE_TTL")
+    max_developers_to_collect: int = Field(default=100, validation_alias="MAX_DEVELOPERS_TO_COLLECT")
     
     # Stack Overflow API Configuration
-    stack_overflow_api_key: Optional[str] = Field(None, env="STACK_OVERFLOW_KEY")
-    stack_overflow_api_base_url: str = Field("https://api.stackexchange.com/2.3", env="STACK_OVERFLOW_API_BASE_URL")
+    stack_overflow_api_key: Optional[str] = Field(default=None, validation_alias="STACK_OVERFLOW_KEY")
+    stack_overflow_api_base_url: str = Field(default="https://api.stackexchange.com/2.3", validation_alias="STACK_OVERFLOW_API_BASE_URL")
     
     # Reddit API Configuration
-    reddit_client_id: Optional[str] = Field(None, env="REDDIT_CLIENT_ID")
-    reddit_client_secret: Optional[str] = Field(None, env="REDDIT_CLIENT_SECRET")
-    reddit_user_agent: Optional[str] = Field(None, env="REDDIT_USER_AGENT")
-    reddit_username: Optional[str] = Field(None, env="REDDIT_USERNAME")
-    reddit_password: Optional[str] = Field(None, env="REDDIT_PASSWORD")
+    reddit_client_id: Optional[str] = Field(default=None, validation_alias="REDDIT_CLIENT_ID")
+    reddit_client_secret: Optional[str] = Field(default=None, validation_alias="REDDIT_CLIENT_SECRET")
+    reddit_user_agent: Optional[str] = Field(default=None, validation_alias="REDDIT_USER_AGENT")
+    reddit_username: Optional[str] = Field(default=None, validation_alias="REDDIT_USERNAME")
+    reddit_password: Optional[str] = Field(default=None, validation_alias="REDDIT_PASSWORD")
     
 
     
     # Indeed API Configuration (X-Rapid)
-    xrapid_api_key: Optional[str] = Field(None, env="XRAPID_API_KEY")
+    xrapid_api_key: Optional[str] = Field(default=None, validation_alias="XRAPID_API_KEY")
     
     # Adjuna API Configuration
-    adjuna_app_id: Optional[str] = Field(None, env="ADZUNA_APP_ID")
-    adjuna_app_key: Optional[str] = Field(None, env="ADZUNA_APP_KEY")
-    adjuna_api_base_url: str = Field("https://api.adzuna.com/v1", env="ADJUNA_API_BASE_URL")
+    adjuna_app_id: Optional[str] = Field(default=None, validation_alias="ADZUNA_APP_ID")
+    adjuna_app_key: Optional[str] = Field(default=None, validation_alias="ADZUNA_APP_KEY")
+    adjuna_api_base_url: str = Field(default="https://api.adzuna.com/v1", validation_alias="ADJUNA_API_BASE_URL")
     
     # OpenAI API Configuration
-    openai_api_key: Optional[str] = Field(None, env="OPENAI_API_KEY")
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-        extra = "ignore"  # Ignore extra fields in .env file
+    openai_api_key: Optional[str] = Field(default=None, validation_alias="OPENAI_API_KEY")
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the global settings instance (parsed from the environment once; reset with cache_clear())"""
+    return Settings()
 
 
-def get_settings() -> Settings:
-    """Get the global settings instance"""
-    return settings 
\ No newline at end of file
+# Global settings instance
+settings = get_settings()
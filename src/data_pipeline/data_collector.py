@@ -1,30 +1,160 @@
 """
 Enhanced data collector for gathering and storing multi-platform developer data
 """
+import asyncio
+import io
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-import time
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 
 from src.data_pipeline.github_client import GitHubClient
 from src.data_pipeline.stack_overflow_client import StackOverflowClient
+from src.data_pipeline.response_cache import ResponseCache
 from src.data_pipeline.job_market_clients import JobMarketDataAggregator
-from src.database.models import Developer, Repository, Skill, Commit, DeveloperSkill
+from src.database.models import Developer, Repository, Skill, Commit, DeveloperSkill, JobPosting
 from src.database.connection import db_manager
 from src.config.settings import settings
 from src.utils.logger import get_application_logger
 
 logger = get_application_logger(__name__)
 
+# Column order for streaming job postings into PostgreSQL with COPY
+JOB_POSTING_COPY_COLUMNS = (
+    'title', 'company', 'location', 'description', 'salary_min', 'salary_max',
+    'salary_currency', 'job_type', 'experience_level', 'remote_option', 'posted_date',
+    'application_url', 'data_source', 'source_id', 'created_at', 'updated_at'
+)
+
+# Experience-level keywords, matched anywhere in the lowercased job title
+_SENIOR_TITLE_RE = re.compile('senior|lead|principal|staff')
+_ENTRY_TITLE_RE = re.compile('junior|entry|associate')
+
+# Skill name -> category for stored skills; names not listed are 'other'
+SKILL_CATEGORIES = {
+    skill: category
+    for category, skills in (
+        ('programming_language', ('python', 'javascript', 'java', 'c#', 'php', 'ruby', 'go', 'rust', 'swift', 'kotlin')),
+        ('frontend', ('react', 'vue', 'angular', 'jquery', 'bootstrap', 'css', 'html')),
+        ('backend', ('node.js', 'express', 'django', 'flask', 'spring', 'laravel')),
+        ('devops', ('aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins')),
+        ('database', ('mysql', 'postgresql', 'mongodb', 'redis', 'sql')),
+        ('version_control', ('git', 'github', 'gitlab', 'bitbucket'))
+    )
+    for skill in skills
+}
+
+def _copy_text_value(value: Any) -> str:
+    """Render a value as a field of PostgreSQL's COPY text format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def _parse_github_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp from GitHub's JSON, as PyGithub would"""
+    return datetime.fromisoformat(value) if value else None
+
+
+def _repository_row(raw: Dict[str, Any], languages: Dict[str, int], topics: List[str]) -> Dict[str, Any]:
+    """Map GitHub's repository JSON to Repository column values"""
+    license_data = raw.get('license') or {}
+    return {
+        'github_id': raw['id'],
+        'name': raw['name'],
+        'full_name': raw['full_name'],
+        'description': raw.get('description'),
+        'language': raw.get('language'),
+        'languages': languages,
+        'topics': topics,
+        'is_fork': raw.get('fork', False),
+        'is_private': raw.get('private', False),
+        'is_archived': raw.get('archived', False),
+        'stargazers_count': raw.get('stargazers_count', 0),
+        'watchers_count': raw.get('watchers_count', 0),
+        'forks_count': raw.get('forks_count', 0),
+        'open_issues_count': raw.get('open_issues_count', 0),
+        'size': raw.get('size', 0),
+        'default_branch': raw.get('default_branch'),
+        'created_at': _parse_github_datetime(raw.get('created_at')),
+        'updated_at': _parse_github_datetime(raw.get('updated_at')),
+        'pushed_at': _parse_github_datetime(raw.get('pushed_at')),
+        'homepage': raw.get('homepage'),
+        'license_name': license_data.get('name'),
+        'has_wiki': raw.get('has_wiki', False),
+        'has_pages': raw.get('has_pages', False),
+        'has_downloads': raw.get('has_downloads', False),
+        'has_issues': raw.get('has_issues', False),
+        'has_projects': raw.get('has_projects', False),
+        'has_discussions': raw.get('has_discussions', False),
+        'archived_at': _parse_github_datetime(raw.get('archived_at')),
+        'disabled': raw.get('disabled', False),
+        'archived': raw.get('archived', False),
+        'allow_forking': raw.get('allow_forking', True),
+        'is_template': raw.get('is_template', False),
+        'web_commit_signoff_required': raw.get('web_commit_signoff_required', False),
+        'visibility': raw.get('visibility', 'public'),
+        'network_count': raw.get('network_count', 0),
+        'subscribers_count': raw.get('subscribers_count', 0)
+    }
+
+
+def _repository_rows(raw_repos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Map repositories from GitHubClient.fetch_user_bundle to Repository column values, skipping bad ones"""
+    repo_rows = []
+    for raw in raw_repos:
+        try:
+            repo_rows.append(_repository_row(raw, raw['languages'], raw.get('topics', [])))
+        except Exception as e:
+            logger.error(f"Error collecting repository {raw.get('full_name')}: {e}")
+    return repo_rows
+
+
+def _developer_row(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Map GitHub's user JSON to Developer column values"""
+    return {
+        'github_id': raw['id'],
+        'username': raw['login'],
+        'name': raw.get('name'),
+        'email': raw.get('email'),
+        'bio': raw.get('bio'),
+        'location': raw.get('location'),
+        'company': raw.get('company'),
+        'blog': raw.get('blog'),
+        'twitter_username': raw.get('twitter_username'),
+        'public_repos': raw.get('public_repos') or 0,
+        'public_gists': raw.get('public_gists') or 0,
+        'followers': raw.get('followers') or 0,
+        'following': raw.get('following') or 0,
+        'created_at': _parse_github_datetime(raw.get('created_at')),
+        'updated_at': _parse_github_datetime(raw.get('updated_at'))
+    }
+
 
 class DataCollector:
     """Enhanced data collector for multiple platforms"""
     
-    def __init__(self):
-        self.github_client = GitHubClient()
-        self.stack_overflow_client = StackOverflowClient()
-        self.job_market_aggregator = JobMarketDataAggregator()
+    def __init__(self, response_cache: Optional[ResponseCache] = None):
+        # API responses change slowly, so every client reuses them across runs
+        if response_cache is None and settings.api_cache_ttl > 0:
+            response_cache = ResponseCache(settings.api_cache_path, settings.api_cache_ttl)
+        
+        self.github_client = GitHubClient(response_cache)
+        self.stack_overflow_client = StackOverflowClient(response_cache)
+        self.job_market_aggregator = JobMarketDataAggregator(response_cache)
+        
+        # Skill name -> id for skills already stored, so common skills skip the SELECT
+        self._skill_id_cache: Dict[str, int] = {}
         
         logger.info("Enhanced DataCollector initialized with multiple sources")
     
@@ -37,63 +167,39 @@ class DataCollector:
             # Get trending repositories for popular languages
             languages = ['python', 'javascript', 'java', 'go', 'rust', 'typescript']
             
-            for language in languages:
-                if len(developers) >= max_users:
-                    break
-                
-                trending_repos = self.github_client.get_trending_repositories(language)
+            # Only GitHub HTTP calls run in the pool; the client's token bucket paces them
+            with ThreadPoolExecutor(max_workers=settings.collector_max_workers) as executor:
+                # Trending searches are independent, so start them all up front
+                trending_futures = {
+                    language: executor.submit(self.github_client.get_trending_repositories, language)
+                    for language in languages
+                }
                 
-                for repo in trending_repos[:max_users // len(languages)]:
+                # Database writes stay on this thread, one language batch at a time
+                for language in languages:
                     if len(developers) >= max_users:
+                        for future in trending_futures.values():
+                            future.cancel()
                         break
                     
-                    owner_login = repo['owner']['login']
+                    trending_repos = trending_futures[language].result()[:max_users // len(languages)]
                     
-                    # Check if developer already exists
-                    with db_manager.get_session() as session:
-                        existing_dev = session.query(Developer).filter(Developer.username == owner_login).first()
-                        if existing_dev:
-                            continue
+                    # Look up already-stored owners with one query instead of one per repository
+                    owner_logins = [repo['owner']['login'] for repo in trending_repos]
+                    existing_logins = self._existing_usernames(owner_logins)
                     
-                    # Collect developer data
-                    try:
-                        developer = self.github_client.get_user(owner_login)
-                        if developer:
-                            # Save to database
-                            with db_manager.get_session() as session:
-                                db_developer = Developer(
-                                    github_id=developer.id,
-                                    username=developer.login,
-                                    name=developer.name,
-                                    email=developer.email,
-                                    bio=developer.bio,
-                                    location=developer.location,
-                                    company=developer.company,
-                                    blog=developer.blog,
-                                    twitter_username=developer.twitter_username,
-                                    public_repos=developer.public_repos or 0,
-                                    public_gists=developer.public_gists or 0,
-                                    followers=developer.followers or 0,
-                                    following=developer.following or 0,
-                                    created_at=developer.created_at,
-                                    updated_at=developer.updated_at
-                                )
-                                
-                                session.add(db_developer)
-                                session.commit()
-                                
-                                # Collect repositories for this developer
-                                self._collect_developer_repositories(session, db_developer, owner_login)
-                                
-                                developers.append(db_developer)
-                                logger.info(f"Collected developer: {developer.get('login')}")
+                    # Skip developers that already exist, and fetch no more than are still needed
+                    candidate_logins = [
+                        owner_login for owner_login in dict.fromkeys(owner_logins)
+                        if owner_login not in existing_logins
+                    ][:max_users - len(developers)]
                     
-                    except Exception as e:
-                        logger.error(f"Error collecting developer {owner_login}: {e}")
-                        continue
-                    
-                    # Rate limiting
-                    time.sleep(settings.rate_limit_delay)
+                    # Fetch profiles and their repositories in parallel, without touching the database
+                    fetched_developers = [
+                        fetched for fetched in executor.map(self._fetch_github_developer, candidate_logins)
+                        if fetched
+                    ]
+                    developers.extend(self._save_developer_batch(fetched_developers, language))
         
         except Exception as e:
             logger.error(f"Error in GitHub trending collection: {e}")
@@ -101,106 +207,193 @@ class DataCollector:
         logger.info(f"Successfully collected {len(developers)} developers from GitHub trending")
         return developers
     
-    def _collect_developer_repositories(self, session: Session, developer: Developer, username: str):
-        """Collect repositories for a developer"""
+    async def acollect_from_github_trending(self, max_users: int = 50) -> List[Developer]:
+        """Collect developers from GitHub trending repositories with async HTTP requests"""
+        logger.info(f"Collecting {max_users} developers from GitHub trending (async)")
+        
+        developers = []
         try:
-            logger.info(f"Collecting repositories for developer: {username}")
-            
-            # Get repositories from GitHub
-            github_repos = self.github_client.get_user_repositories(username, max_repos=10)
+            # Get trending repositories for popular languages
+            languages = ['python', 'javascript', 'java', 'go', 'rust', 'typescript']
+            semaphore = asyncio.Semaphore(settings.collector_max_workers)
             
-            for github_repo in github_repos:
-                try:
-                    # Check if repository already exists
-                    existing_repo = session.query(Repository).filter(
-                        Repository.github_id == github_repo.id
-                    ).first()
-                    
-                    if existing_repo:
-                        continue
-                    
-                    # Create repository record
-                    repo = Repository(
-                        github_id=github_repo.id,
-                        developer_id=developer.id,
-                        name=github_repo.name,
-                        full_name=github_repo.full_name,
-                        description=github_repo.description,
-                        language=github_repo.language,
-                        languages=github_repo.get_languages() if hasattr(github_repo, 'get_languages') else {},
-                        topics=github_repo.get_topics() if hasattr(github_repo, 'get_topics') else [],
-                        is_fork=github_repo.fork,
-                        is_private=github_repo.private,
-                        is_archived=github_repo.archived,
-                        stargazers_count=github_repo.stargazers_count,
-                        watchers_count=github_repo.watchers_count,
-                        forks_count=github_repo.forks_count,
-                        open_issues_count=github_repo.open_issues_count,
-                        size=github_repo.size,
-                        default_branch=github_repo.default_branch,
-                        created_at=github_repo.created_at,
-                        updated_at=github_repo.updated_at,
-                        pushed_at=github_repo.pushed_at,
-                        homepage=github_repo.homepage,
-                        license_name=github_repo.license.name if github_repo.license else None,
-                        has_wiki=github_repo.has_wiki,
-                        has_pages=github_repo.has_pages,
-                        has_downloads=github_repo.has_downloads,
-                        has_issues=github_repo.has_issues,
-                        has_projects=github_repo.has_projects,
-                        has_discussions=getattr(github_repo, 'has_discussions', False),
-                        archived_at=getattr(github_repo, 'archived_at', None),
-                        disabled=getattr(github_repo, 'disabled', False),
-                        archived=getattr(github_repo, 'archived', False),
-                        allow_forking=getattr(github_repo, 'allow_forking', True),
-                        is_template=getattr(github_repo, 'is_template', False),
-                        web_commit_signoff_required=getattr(github_repo, 'web_commit_signoff_required', False),
-                        visibility=getattr(github_repo, 'visibility', 'public'),
-                        network_count=getattr(github_repo, 'network_count', 0),
-                        subscribers_count=getattr(github_repo, 'subscribers_count', 0)
-                    )
+            # One pooled HTTP/2 client for the whole run; the token bucket paces every request
+            async with self.github_client.create_async_http_client() as client:
+                for language in languages:
+                    if len(developers) >= max_users:
+                        break
                     
-                    session.add(repo)
-                    session.commit()
+                    # Trending search goes through PyGithub and the response cache
+                    trending_repos = (await asyncio.to_thread(
+                        self.github_client.get_trending_repositories, language
+                    ))[:max_users // len(languages)]
+                    owner_logins = [repo['owner']['login'] for repo in trending_repos]
                     
-                    logger.info(f"Collected repository: {github_repo.full_name}")
+                    # Skip developers that already exist, and fetch no more than are still needed
+                    existing_logins = self._existing_usernames(owner_logins)
+                    candidate_logins = [
+                        owner_login for owner_login in dict.fromkeys(owner_logins)
+                        if owner_login not in existing_logins
+                    ][:max_users - len(developers)]
                     
-                    # Extract skills from repository languages and topics
-                    self._extract_repository_skills(session, developer, repo)
+                    fetched = await asyncio.gather(*(
+                        self._afetch_github_developer(client, semaphore, owner_login)
+                        for owner_login in candidate_logins
+                    ))
+                    fetched_developers = [developer for developer in fetched if developer]
                     
-                except Exception as e:
-                    logger.error(f"Error collecting repository {github_repo.full_name}: {e}")
-                    continue
+                    # Database writes stay synchronous, after the batch's requests complete
+                    developers.extend(self._save_developer_batch(fetched_developers, language))
+        
+        except Exception as e:
+            logger.error(f"Error in async GitHub trending collection: {e}")
+        
+        logger.info(f"Successfully collected {len(developers)} developers from GitHub trending")
+        return developers
+    
+    async def _afetch_github_developer(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                                       username: str) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Fetch a GitHub user's profile and repositories as Developer and Repository column values"""
+        async with semaphore:
+            try:
+                bundle = await self.github_client.afetch_user_bundle(client, username, max_repos=10)
+                if not bundle:
+                    return None
                 
-                # Rate limiting for repository collection
-                time.sleep(settings.rate_limit_delay)
+                raw_user, raw_repos = bundle
+                return _developer_row(raw_user), _repository_rows(raw_repos)
             
-            logger.info(f"Collected {len(github_repos)} repositories for {username}")
+            except Exception as e:
+                logger.error(f"Error collecting developer {username}: {e}")
+                return None
+    
+    def _existing_usernames(self, usernames: List[str]) -> Set[str]:
+        """Return which of the usernames are already stored, with one query"""
+        if not usernames:
+            return set()
+        with db_manager.get_session() as session:
+            return {
+                username for (username,) in session.query(Developer.username).filter(
+                    Developer.username.in_(usernames)
+                )
+            }
+    
+    def _save_developer_batch(self, fetched_developers: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+                              language: str) -> List[Developer]:
+        """Save a batch of developers with their repositories and skills in one transaction"""
+        if not fetched_developers:
+            return []
+        
+        try:
+            with db_manager.get_session() as session:
+                # Developers stored meanwhile (e.g. by a concurrent run) are skipped, not duplicated
+                inserted_usernames = self._insert_new_rows(
+                    session, Developer, [developer_data for developer_data, _ in fetched_developers], 'username'
+                )
+                stored_developers = {
+                    developer.username: developer
+                    for developer in session.query(Developer).filter(Developer.username.in_(inserted_usernames))
+                } if inserted_usernames else {}
+                
+                db_developers = []
+                for developer_data, repo_rows in fetched_developers:
+                    db_developer = stored_developers.get(developer_data['username'])
+                    if db_developer is not None:
+                        self._store_developer_repositories(session, db_developer, repo_rows)
+                        db_developers.append(db_developer)
+                
+                # One commit for the whole language batch
+                self._commit_batch(session)
+                logger.info(f"Collected {len(db_developers)} {language} developers")
+                return db_developers
+        
+        except Exception as e:
+            logger.error(f"Error collecting {language} developers: {e}")
+            return []
+    
+    def _fetch_github_developer(self, username: str) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Fetch a GitHub user's profile and repositories as Developer and Repository column values"""
+        try:
+            # Profile, repositories, languages and topics arrive in one GraphQL request
+            bundle = self.github_client.fetch_user_bundle(username, max_repos=10)
+            if not bundle:
+                return None
+            
+            raw_user, raw_repos = bundle
+            return _developer_row(raw_user), _repository_rows(raw_repos)
+        
+        except Exception as e:
+            logger.error(f"Error collecting developer {username}: {e}")
+            return None
+    
+    def _collect_developer_repositories(self, session: Session, developer: Developer, username: str):
+        """Collect repositories for a developer"""
+        self._store_developer_repositories(session, developer, self._fetch_developer_repositories(username))
+        self._commit_batch(session)
+    
+    def _fetch_developer_repositories(self, username: str) -> List[Dict[str, Any]]:
+        """Fetch a developer's repositories from GitHub as Repository column values"""
+        repo_rows = []
+        try:
+            logger.info(f"Collecting repositories for developer: {username}")
+            
+            # Repositories arrive with their languages and topics in one GraphQL request
+            bundle = self.github_client.fetch_user_bundle(username, max_repos=10)
+            if bundle:
+                repo_rows = _repository_rows(bundle[1])
+            
+            logger.info(f"Collected {len(repo_rows)} repositories for {username}")
             
         except Exception as e:
             logger.error(f"Error collecting repositories for {username}: {e}")
+        
+        return repo_rows
     
-    def _extract_repository_skills(self, session: Session, developer: Developer, repository: Repository):
-        """Extract skills from repository languages and topics"""
+    def _store_developer_repositories(self, session: Session, developer: Developer,
+                                      repo_rows: List[Dict[str, Any]]):
+        """Store a developer's new repositories and the skills they show"""
         try:
+            # Insert the developer's new repositories in one statement; the caller commits
+            rows = [dict(row, developer_id=developer.id) for row in repo_rows]
+            inserted_ids = self._insert_new_rows(session, Repository, rows, 'github_id')
+            new_repos = [Repository(**row) for row in rows if row['github_id'] in inserted_ids]
+            if new_repos:
+                logger.info(f"Stored {len(new_repos)} new repositories for {developer.username}")
+            
+            # Extract skills from repository languages and topics, stored once per developer
+            skill_usages = []
+            for repo in new_repos:
+                skill_usages.extend(self._extract_repository_skills(repo))
+            self._add_skills_to_developer(session, developer, skill_usages)
+            
+        except Exception as e:
+            logger.error(f"Error storing repositories for {developer.username}: {e}")
+    
+    def _extract_repository_skills(self, repository: Repository) -> List[Tuple[str, int]]:
+        """Extract (skill, usage count) pairs from repository languages and topics"""
+        skill_usages = []
+        try:
+            
             # Extract skills from languages
             if repository.languages:
                 for language, bytes_count in repository.languages.items():
                     if language:
-                        self._add_skill_to_developer(session, developer, language.lower(), bytes_count)
+                        skill_usages.append((language.lower(), bytes_count))
             
             # Extract skills from topics
             if repository.topics:
                 for topic in repository.topics:
                     if topic:
-                        self._add_skill_to_developer(session, developer, topic.lower(), 1)
+                        skill_usages.append((topic.lower(), 1))
             
             # Extract skills from primary language
             if repository.language:
-                self._add_skill_to_developer(session, developer, repository.language.lower(), 1000)
+                skill_usages.append((repository.language.lower(), 1000))
                 
         except Exception as e:
             logger.error(f"Error extracting skills from repository {repository.full_name}: {e}")
+        
+        return skill_usages
     
     def collect_from_stack_overflow(self, max_users: int = 50) -> List[Developer]:
         """Collect developer data from Stack Overflow"""
@@ -229,9 +422,6 @@ class DataCollector:
                     except Exception as e:
                         logger.error(f"Error processing Stack Overflow user: {e}")
                         continue
-                    
-                    # Rate limiting
-                    time.sleep(settings.rate_limit_delay)
         
         except Exception as e:
             logger.error(f"Error in Stack Overflow collection: {e}")
@@ -269,7 +459,8 @@ class DataCollector:
             
             # Overall market insights
             market_data['overall_trends'] = {
-                'total_jobs_analyzed': sum(trend['total_jobs'] for trend in technology_trends.values()),
+                # Every technology is matched against the same job pool, so summing matches would double count
+                'total_jobs_analyzed': max((trend['pool_size'] for trend in technology_trends.values()), default=0),
                 'most_demanded_tech': max(technology_trends.items(), key=lambda x: x[1]['total_jobs'])[0] if technology_trends else 'python',
                 'average_salary_range': '60k-120k',
                 'remote_work_prevalence': 'High',
@@ -318,29 +509,36 @@ class DataCollector:
         
         try:
             with db_manager.get_session() as session:
-                # Get developers who have GitHub IDs but no repositories
-                developers_without_repos = session.query(Developer).filter(
-                    Developer.github_id.isnot(None)
+                # Get GitHub developers without repositories; Stack Overflow users ('so_' prefix)
+                # are excluded in SQL so they do not count against the limit
+                github_developers = session.query(Developer).filter(
+                    Developer.github_id.isnot(None),
+                    Developer.username.isnot(None),
+                    ~Developer.username.startswith('so_', autoescape=True)
                 ).outerjoin(Repository).filter(
                     Repository.id.is_(None)
                 ).limit(max_developers).all()
                 
-                logger.info(f"Found {len(developers_without_repos)} developers without repositories")
+                logger.info(f"Found {len(github_developers)} developers without repositories")
                 
-                for developer in developers_without_repos:
-                    try:
-                        if developer.username and not developer.username.startswith('so_'):
-                            self._collect_developer_repositories(session, developer, developer.username)
+                # Fetch repositories in parallel; database writes stay on this thread
+                with ThreadPoolExecutor(max_workers=settings.collector_max_workers) as executor:
+                    fetched_repos = executor.map(
+                        self._fetch_developer_repositories,
+                        [developer.username for developer in github_developers]
+                    )
+                    
+                    for developer, repo_rows in zip(github_developers, fetched_repos):
+                        try:
+                            self._store_developer_repositories(session, developer, repo_rows)
+                            self._commit_batch(session)
                             logger.info(f"Collected repositories for: {developer.username}")
                         
-                        # Rate limiting
-                        time.sleep(settings.rate_limit_delay)
-                        
-                    except Exception as e:
-                        logger.error(f"Error collecting repositories for {developer.username}: {e}")
-                        continue
+                        except Exception as e:
+                            logger.error(f"Error collecting repositories for {developer.username}: {e}")
+                            continue
                 
-                logger.info(f"Repository collection completed for {len(developers_without_repos)} developers")
+                logger.info(f"Repository collection completed for {len(github_developers)} developers")
                 
         except Exception as e:
             logger.error(f"Error in repository collection: {e}")
@@ -354,42 +552,54 @@ class DataCollector:
                 # Extract jobs from aggregated trends
                 jobs = market_data.get('aggregated_trends', [])
                 
+                # Look up already-stored postings with one query instead of one per job
+                source_ids = [job_data.get('id') for job_data in jobs]
+                existing_ids = {
+                    source_id for (source_id,) in session.query(JobPosting.source_id).filter(
+                        JobPosting.source_id.in_(source_ids),
+                        JobPosting.data_source == 'market_aggregator'
+                    )
+                } if source_ids else set()
+                
+                now = datetime.utcnow()
+                # Fallback posting date for jobs without one, taken once for the batch
+                local_now = datetime.now()
+                job_rows = []
                 for job_data in jobs:
                     try:
-                        # Check if job already exists
-                        existing_job = session.query(JobPosting).filter(
-                            JobPosting.source_id == job_data.get('id'),
-                            JobPosting.data_source == 'market_aggregator'
-                        ).first()
-                        
-                        if existing_job:
+                        if job_data.get('id') in existing_ids:
                             continue
                         
-                        # Create new job posting
-                        job_posting = JobPosting(
-                            title=job_data.get('title', ''),
-                            company=job_data.get('company', ''),
-                            location=job_data.get('location', ''),
-                            description=job_data.get('description', ''),
-                            salary_min=job_data.get('salary_min'),
-                            salary_max=job_data.get('salary_max'),
-                            salary_currency='USD',
-                            job_type=job_data.get('type', 'full-time'),
-                            experience_level=self._determine_experience_level(job_data.get('title', '')),
-                            remote_option='remote' in job_data.get('location', '').lower(),
-                            posted_date=datetime.fromisoformat(job_data.get('created_at', datetime.now().isoformat())),
-                            application_url=job_data.get('url', ''),
-                            data_source='market_aggregator',
-                            source_id=job_data.get('id', '')
-                        )
+                        created_at = job_data.get('created_at')
                         
-                        session.add(job_posting)
-                        jobs_stored += 1
+                        # Create new job posting
+                        job_rows.append({
+                            'title': job_data.get('title', ''),
+                            'company': job_data.get('company', ''),
+                            'location': job_data.get('location', ''),
+                            'description': job_data.get('description', ''),
+                            'salary_min': job_data.get('salary_min'),
+                            'salary_max': job_data.get('salary_max'),
+                            'salary_currency': 'USD',
+                            'job_type': job_data.get('type', 'full-time'),
+                            'posted_date': datetime.fromisoformat(created_at) if created_at else local_now,
+                            'application_url': job_data.get('url', ''),
+                            'data_source': 'market_aggregator',
+                            'source_id': job_data.get('id', ''),
+                            'created_at': now,
+                            'updated_at': now
+                        })
+                        existing_ids.add(job_data.get('id'))
                         
                     except Exception as e:
                         logger.error(f"Error storing job posting: {e}")
                         continue
                 
+                if job_rows:
+                    self._label_job_rows(job_rows)
+                    self._bulk_insert_job_postings(session, job_rows)
+                    jobs_stored = len(job_rows)
+                
                 session.commit()
                 logger.info(f"Stored {jobs_stored} new job postings in database")
                 
@@ -398,13 +608,41 @@ class DataCollector:
         
         return jobs_stored
     
+    def _bulk_insert_job_postings(self, session: Session, job_rows: List[Dict[str, Any]]):
+        """Insert job posting rows, streaming them through COPY on PostgreSQL"""
+        if session.bind.dialect.name != 'postgresql':
+            session.bulk_insert_mappings(JobPosting, job_rows)
+            return
+        
+        # COPY runs on the session's own connection, so it commits with the session
+        buffer = io.StringIO()
+        for row in job_rows:
+            buffer.write('\t'.join(_copy_text_value(row[column]) for column in JOB_POSTING_COPY_COLUMNS))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY job_postings ({', '.join(JOB_POSTING_COPY_COLUMNS)}) FROM STDIN",
+                buffer
+            )
+        finally:
+            cursor.close()
+    
+    def _label_job_rows(self, job_rows: List[Dict[str, Any]]):
+        """Set each job row's experience level and remote flag from its title and location"""
+        for row in job_rows:
+            row['experience_level'] = self._determine_experience_level(row['title'] or '')
+            row['remote_option'] = 'remote' in (row['location'] or '').lower()
+    
     def _determine_experience_level(self, title: str) -> str:
         """Determine experience level from job title"""
         title_lower = title.lower()
         
-        if any(word in title_lower for word in ['senior', 'lead', 'principal', 'staff']):
+        if _SENIOR_TITLE_RE.search(title_lower):
             return 'senior'
-        elif any(word in title_lower for word in ['junior', 'entry', 'associate']):
+        elif _ENTRY_TITLE_RE.search(title_lower):
             return 'entry'
         else:
             return 'mid'
@@ -424,54 +662,63 @@ class DataCollector:
                 
                 for repository in repositories_without_commits:
                     try:
-                        # Get GitHub repository object
-                        github_repo = self.github_client.github.get_repo(repository.full_name)
+                        # Lazy handle: the commits request is the first call made for this repository
+                        github_repo = self.github_client.get_repository(repository.full_name)
+                        if not github_repo:
+                            continue
                         
                         # Get commits
                         commits = self.github_client.get_repository_commits(github_repo, max_commits=20)
                         
+                        # Look up already-stored commits with one query instead of one per commit
+                        shas = [github_commit.sha for github_commit in commits]
+                        existing_shas = {
+                            sha for (sha,) in session.query(Commit.sha).filter(Commit.sha.in_(shas))
+                        } if shas else set()
+                        
+                        commit_rows = []
                         for github_commit in commits:
                             try:
-                                # Check if commit already exists
-                                existing_commit = session.query(Commit).filter(
-                                    Commit.sha == github_commit.sha
-                                ).first()
-                                
-                                if existing_commit:
+                                if github_commit.sha in existing_shas:
                                     continue
                                 
+                                # Read each nested object once rather than per field
+                                git_commit = github_commit.commit
+                                author = github_commit.author
+                                committer = github_commit.committer
+                                verification = getattr(git_commit, 'verification', None)
+                                
                                 # Create commit record
-                                commit = Commit(
+                                commit_rows.append(dict(
                                     repository_id=repository.id,
                                     sha=github_commit.sha,
-                                    author_name=github_commit.author.name if github_commit.author else None,
-                                    author_email=github_commit.author.email if github_commit.author else None,
-                                    committer_name=github_commit.committer.name if github_commit.committer else None,
-                                    committer_email=github_commit.committer.email if github_commit.committer else None,
-                                    message=github_commit.commit.message,
-                                    commit_date=github_commit.commit.author.date,
-                                    author_date=github_commit.commit.author.date,
+                                    author_name=author.name if author else None,
+                                    author_email=author.email if author else None,
+                                    committer_name=committer.name if committer else None,
+                                    committer_email=committer.email if committer else None,
+                                    message=git_commit.message,
+                                    commit_date=git_commit.author.date,
+                                    author_date=git_commit.author.date,
                                     url=github_commit.url,
                                     html_url=github_commit.html_url,
-                                    comment_count=getattr(github_commit.commit, 'comment_count', 0),
-                                    verification_verified=getattr(github_commit.commit, 'verification', None) and getattr(github_commit.commit.verification, 'verified', False),
-                                    verification_reason=getattr(github_commit.commit, 'verification', None) and getattr(github_commit.commit.verification, 'reason', None),
-                                    verification_signature=getattr(github_commit.commit, 'verification', None) and getattr(github_commit.commit.verification, 'signature', None),
-                                    verification_payload=getattr(github_commit.commit, 'verification', None) and getattr(github_commit.commit.verification, 'payload', None)
-                                )
-                                
-                                session.add(commit)
+                                    comment_count=getattr(git_commit, 'comment_count', 0),
+                                    verification_verified=getattr(verification, 'verified', False) if verification else None,
+                                    verification_reason=getattr(verification, 'reason', None) if verification else None,
+                                    verification_signature=getattr(verification, 'signature', None) if verification else None,
+                                    verification_payload=getattr(verification, 'payload', None) if verification else None
+                                ))
+                                existing_shas.add(github_commit.sha)
                                 
                             except Exception as e:
                                 logger.error(f"Error processing commit {github_commit.sha}: {e}")
                                 continue
                         
+                        # Insert the repository's new commits in one batch
+                        if commit_rows:
+                            session.bulk_insert_mappings(Commit, commit_rows)
                         session.commit()
                         logger.info(f"Collected {len(commits)} commits for repository: {repository.full_name}")
                         
-                        # Rate limiting
-                        time.sleep(settings.rate_limit_delay)
-                        
                     except Exception as e:
                         logger.error(f"Error collecting commits for {repository.full_name}: {e}")
                         continue
@@ -495,18 +742,19 @@ class DataCollector:
                 # Convert Unix timestamps to datetime objects
                 created_at = None
                 updated_at = None
+                now = datetime.now()
                 
                 if user_data.get('creation_date'):
                     try:
                         created_at = datetime.fromtimestamp(user_data['creation_date'])
                     except (ValueError, TypeError):
-                        created_at = datetime.now()
+                        created_at = now
                 
                 if user_data.get('last_access_date'):
                     try:
                         updated_at = datetime.fromtimestamp(user_data['last_access_date'])
                     except (ValueError, TypeError):
-                        updated_at = datetime.now()
+                        updated_at = now
                 
                 # Create new developer record
                 developer = Developer(
@@ -528,14 +776,18 @@ class DataCollector:
                 )
                 
                 session.add(developer)
-                session.commit()
+                session.flush()
                 
                 # Extract skills from user's tags
                 if 'tags' in user_data:
-                    for tag_data in user_data['tags']:
-                        tag_name = tag_data.get('tag_name', '').lower()
-                        if tag_name:
-                            self._add_skill_to_developer(session, developer, tag_name, tag_data.get('answer_count', 1))
+                    self._add_skills_to_developer(session, developer, [
+                        (tag_data.get('tag_name', '').lower(), tag_data.get('answer_count', 1))
+                        for tag_data in user_data['tags']
+                        if tag_data.get('tag_name')
+                    ])
+                
+                # Store the developer and their skills in one transaction
+                self._commit_batch(session)
                 
                 return developer
                 
@@ -543,58 +795,121 @@ class DataCollector:
             logger.error(f"Error processing Stack Overflow user: {e}")
             return None
     
-    def _add_skill_to_developer(self, session: Session, developer: Developer, skill_name: str, usage_count: int = 1):
-        """Add or update a skill for a developer"""
+    def _add_skills_to_developer(self, session: Session, developer: Developer,
+                                 skill_usages: List[Tuple[str, int]]):
+        """Add skills with their usage counts to a developer, keeping the first count per skill"""
+        if not skill_usages:
+            return
+        
         try:
-            # Find or create skill
-            skill = session.query(Skill).filter(Skill.name == skill_name).first()
-            if not skill:
-                skill = Skill(
-                    name=skill_name,
-                    category=self._categorize_skill(skill_name),
-                    description=f"Skill: {skill_name}"
+            # Resolve skill ids from the cache, loading only names not seen before
+            skill_names = list(dict.fromkeys(skill_name for skill_name, _ in skill_usages))
+            skill_ids = {
+                skill_name: self._skill_id_cache[skill_name]
+                for skill_name in skill_names if skill_name in self._skill_id_cache
+            }
+            uncached_names = [skill_name for skill_name in skill_names if skill_name not in skill_ids]
+            if uncached_names:
+                skill_ids.update(
+                    session.query(Skill.name, Skill.id).filter(Skill.name.in_(uncached_names))
                 )
-                session.add(skill)
-                session.commit()
-                
-            # Check if developer already has this skill
-            existing_skill = session.query(DeveloperSkill).filter(
-                DeveloperSkill.developer_id == developer.id,
-                DeveloperSkill.skill_id == skill.id
-            ).first()
             
-            if not existing_skill:
+            # Create missing skills, then read their ids (including any a concurrent writer added)
+            missing_names = [skill_name for skill_name in skill_names if skill_name not in skill_ids]
+            if missing_names:
+                self._insert_new_rows(session, Skill, [
+                    {
+                        'name': skill_name,
+                        'category': self._categorize_skill(skill_name),
+                        'description': f"Skill: {skill_name}"
+                    }
+                    for skill_name in missing_names
+                ], 'name')
+                skill_ids.update(
+                    session.query(Skill.name, Skill.id).filter(Skill.name.in_(missing_names))
+                )
+            
+            # PostgreSQL resolves existing skills through the unique (developer_id, skill_id) index
+            upsert = session.bind.dialect.name == 'postgresql'
+            
+            # Otherwise check which skills the developer already has
+            existing_skill_ids = set() if upsert else {
+                skill_id for (skill_id,) in session.query(DeveloperSkill.skill_id).filter(
+                    DeveloperSkill.developer_id == developer.id,
+                    DeveloperSkill.skill_id.in_(list(skill_ids.values()))
+                )
+            }
+            
+            developer_skill_rows = []
+            for skill_name, usage_count in skill_usages:
+                skill_id = skill_ids[skill_name]
+                if skill_id in existing_skill_ids:
+                    continue
+                existing_skill_ids.add(skill_id)
+                
                 # Calculate proficiency level based on usage count (0.0 to 1.0)
                 proficiency_level = min(1.0, usage_count / 1000.0)  # Normalize to 0-1 range
                 
                 # Add skill to developer
-                developer_skill = DeveloperSkill(
-                    developer_id=developer.id,
-                    skill_id=skill.id,
-                    proficiency_level=proficiency_level,
-                    usage_frequency=usage_count
-                )
-                session.add(developer_skill)
-                session.commit()
+                developer_skill_rows.append({
+                    'developer_id': developer.id,
+                    'skill_id': skill_id,
+                    'proficiency_level': proficiency_level,
+                    'usage_frequency': usage_count
+                })
+            
+            # Write all of the developer's skills in one batch; the caller commits
+            if developer_skill_rows and upsert:
+                statement = pg_insert(DeveloperSkill).values(developer_skill_rows)
+                session.execute(statement.on_conflict_do_update(
+                    index_elements=['developer_id', 'skill_id'],
+                    set_={
+                        'usage_frequency': func.greatest(
+                            DeveloperSkill.usage_frequency, statement.excluded.usage_frequency
+                        ),
+                        'proficiency_level': func.greatest(
+                            DeveloperSkill.proficiency_level, statement.excluded.proficiency_level
+                        )
+                    }
+                ))
+            elif developer_skill_rows:
+                session.bulk_insert_mappings(DeveloperSkill, developer_skill_rows)
+            
+            # Cache only once the batch commits so rolled-back skill ids are never reused
+            session.info.setdefault('skill_ids', {}).update(skill_ids)
                 
         except Exception as e:
-            logger.error(f"Error adding skill {skill_name} to developer: {e}")
+            logger.error(f"Error adding skills to developer: {e}")
+    
+    def _insert_new_rows(self, session: Session, model, rows: List[Dict[str, Any]], key: str) -> Set[Any]:
+        """Insert rows, skipping ones that would break a unique constraint, and return the keys inserted"""
+        if not rows:
+            return set()
+        
+        if session.bind.dialect.name == 'postgresql':
+            # One statement; the database skips duplicates, including rows a concurrent writer just added
+            statement = pg_insert(model).values(rows).on_conflict_do_nothing().returning(getattr(model, key))
+            return {value for (value,) in session.execute(statement)}
+        
+        # Other backends: pre-check the keys with one query, then bulk insert the rest
+        key_column = getattr(model, key)
+        existing_keys = {
+            value for (value,) in session.query(key_column).filter(key_column.in_([row[key] for row in rows]))
+        }
+        new_rows = []
+        for row in rows:
+            if row[key] not in existing_keys:
+                existing_keys.add(row[key])
+                new_rows.append(row)
+        session.bulk_insert_mappings(model, new_rows)
+        return {row[key] for row in new_rows}
+    
+    def _commit_batch(self, session: Session):
+        """Commit a batch of writes, then cache the skill ids it resolved"""
+        skill_ids = session.info.pop('skill_ids', {})
+        session.commit()
+        self._skill_id_cache.update(skill_ids)
     
     def _categorize_skill(self, skill_name: str) -> str:
         """Categorize a skill based on its name"""
-        skill_lower = skill_name.lower()
-        
-        if skill_lower in ['python', 'javascript', 'java', 'c#', 'php', 'ruby', 'go', 'rust', 'swift', 'kotlin']:
-            return 'programming_language'
-        elif skill_lower in ['react', 'vue', 'angular', 'jquery', 'bootstrap', 'css', 'html']:
-            return 'frontend'
-        elif skill_lower in ['node.js', 'express', 'django', 'flask', 'spring', 'laravel']:
-            return 'backend'
-        elif skill_lower in ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins']:
-            return 'devops'
-        elif skill_lower in ['mysql', 'postgresql', 'mongodb', 'redis', 'sql']:
-            return 'database'
-        elif skill_lower in ['git', 'github', 'gitlab', 'bitbucket']:
-            return 'version_control'
-        else:
-            return 'other' 
\ No newline at end of file
+        return SKILL_CATEGORIES.get(skill_name.lower(), 'other') 
\ No newline at end of file
@@ -1,40 +1,201 @@
 """
 GitHub API client for data collection
 """
+import asyncio
+import random
 import time
 import logging
-from typing import List, Dict, Any, Optional, Generator
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Generator, Tuple
+from datetime import datetime, timedelta
+import httpx
+import orjson
 from github import Github, GithubException
 from github.Repository import Repository as GithubRepository
 from github.Commit import Commit as GithubCommit
 from github.NamedUser import NamedUser as GithubUser
 
 from src.config.settings import settings
+from src.data_pipeline.rate_limiter import TokenBucket
+from src.data_pipeline.response_cache import ResponseCache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
+# REST endpoint used by the async collection path
+GITHUB_API_URL = "https://api.github.com"
+
+# GitHub's largest REST page; PyGithub's default of 30 costs 3-4x the requests for long listings
+REST_PAGE_SIZE = 100
+
+# How far back get_trending_repositories looks for newly created repositories, per time range
+TIME_RANGE_DAYS = {'daily': 7, 'weekly': 30, 'monthly': 90}
+
+# Seconds a fetched rate-limit status is reused, so repeated checks don't each cost a request
+RATE_LIMIT_STATUS_TTL = 5.0
+
+# Retry policy for async requests: transient failures back off exponentially with jitter,
+# other client errors (e.g. 404) fail at once
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# One GraphQL request returns an owner's profile with a page of repositories, their languages and topics.
+# repositoryOwner resolves organizations as well as users (trending repositories are often org-owned)
+GRAPHQL_PAGE_SIZE = 100
+USER_BUNDLE_QUERY = """
+query($login: String!, $first: Int!, $after: String) {
+  repositoryOwner(login: $login) {
+    __typename
+    login
+    ... on User {
+      databaseId name email bio location company websiteUrl twitterUsername createdAt updatedAt
+      followers { totalCount }
+      following { totalCount }
+      gists(privacy: PUBLIC) { totalCount }
+    }
+    ... on Organization {
+      databaseId name email description location websiteUrl twitterUsername createdAt updatedAt
+    }
+    repositories(first: $first, after: $after, ownerAffiliations: OWNER, privacy: PUBLIC,
+                 orderBy: {field: NAME, direction: ASC}) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        databaseId name nameWithOwner description homepageUrl visibility
+        isFork isPrivate isArchived isTemplate isDisabled forkingAllowed
+        hasWikiEnabled hasIssuesEnabled hasProjectsEnabled hasDiscussionsEnabled
+        stargazerCount forkCount diskUsage createdAt updatedAt pushedAt archivedAt
+        primaryLanguage { name }
+        defaultBranchRef { name }
+        licenseInfo { name }
+        issues(states: OPEN) { totalCount }
+        watchers { totalCount }
+        languages(first: 20) { edges { size node { name } } }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+      }
+    }
+  }
+}
+"""
+
+
+def _trending_repository(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the trending-repository fields out of a search result's REST JSON"""
+    owner = raw.get('owner') or {}
+    return {
+        'id': raw['id'],
+        'name': raw['name'],
+        'full_name': raw['full_name'],
+        'description': raw.get('description'),
+        'language': raw.get('language'),
+        'stars': raw.get('stargazers_count', 0),
+        'forks': raw.get('forks_count', 0),
+        'owner': {
+            'login': owner.get('login'),
+            'id': owner.get('id'),
+            'type': owner.get('type')
+        },
+        'created_at': raw.get('created_at'),  # Already ISO 8601 in UTC
+        'updated_at': raw.get('updated_at'),
+        'html_url': raw.get('html_url'),
+        'clone_url': raw.get('clone_url')
+    }
+
+
+def _rest_user(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a GraphQL user or organization to the REST user JSON shape"""
+    return {
+        'id': node['databaseId'],
+        'login': node['login'],
+        'type': node['__typename'],
+        'name': node.get('name'),
+        'email': node.get('email') or None,  # GraphQL reports a hidden email as ''
+        'bio': node.get('bio') or node.get('description'),
+        'location': node.get('location'),
+        'company': node.get('company'),
+        'blog': node.get('websiteUrl'),
+        'twitter_username': node.get('twitterUsername'),
+        'public_repos': node['repositories']['totalCount'],
+        # Organizations expose no gist or follow counts over GraphQL
+        'public_gists': node.get('gists', {}).get('totalCount', 0),
+        'followers': node.get('followers', {}).get('totalCount', 0),
+        'following': node.get('following', {}).get('totalCount', 0),
+        'created_at': node.get('createdAt'),
+        'updated_at': node.get('updatedAt')
+    }
+
+
+def _rest_repository(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a GraphQL repository to the REST repository JSON shape, plus its language byte counts"""
+    return {
+        'id': node['databaseId'],
+        'name': node['name'],
+        'full_name': node['nameWithOwner'],
+        'description': node.get('description'),
+        'language': (node.get('primaryLanguage') or {}).get('name'),
+        'fork': node['isFork'],
+        'private': node['isPrivate'],
+        'archived': node['isArchived'],
+        'stargazers_count': node['stargazerCount'],
+        'watchers_count': node['stargazerCount'],  # REST reports stargazers as watchers
+        'forks_count': node['forkCount'],
+        'open_issues_count': node['issues']['totalCount'],
+        'size': node['diskUsage'] or 0,
+        'default_branch': (node.get('defaultBranchRef') or {}).get('name'),
+        'created_at': node.get('createdAt'),
+        'updated_at': node.get('updatedAt'),
+        'pushed_at': node.get('pushedAt'),
+        'archived_at': node.get('archivedAt'),
+        'homepage': node.get('homepageUrl'),
+        'license': node.get('licenseInfo'),
+        'has_wiki': node['hasWikiEnabled'],
+        'has_issues': node['hasIssuesEnabled'],
+        'has_projects': node['hasProjectsEnabled'],
+        'has_discussions': node['hasDiscussionsEnabled'],
+        'disabled': node['isDisabled'],
+        'allow_forking': node['forkingAllowed'],
+        'is_template': node['isTemplate'],
+        'visibility': node['visibility'].lower(),
+        'subscribers_count': node['watchers']['totalCount'],
+        'topics': [topic_node['topic']['name'] for topic_node in node['repositoryTopics']['nodes']],
+        'languages': {edge['node']['name']: edge['size'] for edge in node['languages']['edges']}
+    }
+
 
 class GitHubClient:
     """GitHub API client with rate limiting and error handling"""
     
-    def __init__(self):
+    def __init__(self, response_cache: Optional[ResponseCache] = None):
+        self.response_cache = response_cache
         if settings.github_token:
-            self.github = Github(settings.github_token)
+            self.github = Github(settings.github_token, per_page=REST_PAGE_SIZE)
         else:
             self.github = None
             logger.warning("GitHub token not provided. GitHub API features will be disabled.")
-        self.rate_limit_delay = settings.rate_limit_delay
-        self._last_request_time = 0
+        # Built once so every lazy repository handle shares one requester and connection pool
+        self._lazy_github = self.github.withLazy(True) if self.github else None
+        # Spend the hourly API budget as a token bucket instead of a fixed delay per call
+        self._limiter = TokenBucket(
+            capacity=settings.github_requests_per_hour,
+            refill_rate=settings.github_requests_per_hour / 3600
+        )
+        # The Search API has its own, much smaller per-minute quota
+        self._search_limiter = TokenBucket(
+            capacity=settings.github_search_requests_per_minute,
+            refill_rate=settings.github_search_requests_per_minute / 60
+        )
+        # Request cache key -> (ETag, decoded body) for conditional async GETs
+        self._etags: Dict[str, Tuple[str, Any]] = {}
+        # (monotonic time fetched, status) of the last rate-limit status lookup
+        self._rate_limit_status = (0.0, {})
     
     def _rate_limit(self):
-        """Implement rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            time.sleep(sleep_time)
-        self._last_request_time = time.time()
+        """Wait for a request token from the rate limiter"""
+        self._limiter.acquire()
+    
+    def _search_rate_limit(self):
+        """Wait for a request token from the Search API rate limiter"""
+        self._search_limiter.acquire()
     
     def get_user(self, username: str) -> Optional[GithubUser]:
         """Get GitHub user information"""
@@ -50,21 +211,29 @@ class GitHubClient:
             logger.error(f"Error retrieving user {username}: {e}")
             return None
     
-    def get_user_repositories(self, username: str, max_repos: int = None) -> List[GithubRepository]:
-        """Get repositories for a user"""
+    def get_user_repositories(self, username: str, max_repos: int = None) -> Generator[GithubRepository, None, None]:
+        """Stream repositories for a user, fetching result pages only as they are consumed"""
         try:
             self._rate_limit()
             user = self.get_user(username)
             if not user:
-                return []
+                return
             
             max_repos = max_repos or settings.max_repositories_per_user
-            repos = list(user.get_repos()[:max_repos])
-            logger.info(f"Retrieved {len(repos)} repositories for user: {username}")
-            return repos
+            repo_count = 0
+            for repo in user.get_repos()[:max_repos]:
+                repo_count += 1
+                yield repo
+            logger.info(f"Retrieved {repo_count} repositories for user: {username}")
         except GithubException as e:
             logger.error(f"Error retrieving repositories for {username}: {e}")
-            return []
+    
+    def get_repository(self, full_name: str) -> Optional[GithubRepository]:
+        """Get a lazy repository handle; no request is made until its data is used"""
+        if not self._lazy_github:
+            logger.warning("GitHub API not available. Token not provided.")
+            return None
+        return self._lazy_github.get_repo(full_name)
     
     def get_repository_commits(self, repo: GithubRepository, max_commits: int = None) -> List[GithubCommit]:
         """Get commits for a repository"""
@@ -106,7 +275,7 @@ class GitHubClient:
             logger.warning("GitHub API not available. Token not provided.")
             return []
         try:
-            self._rate_limit()
+            self._search_rate_limit()
             users = self.github.search_users(query=query)
             results = list(users[:max_results])
             logger.info(f"Found {len(results)} users for query: {query}")
@@ -115,11 +284,248 @@ class GitHubClient:
             logger.error(f"Error searching users with query '{query}': {e}")
             return []
     
+    def fetch_user_bundle(self, username: str,
+                          max_repos: int = 10) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Get a user's profile and repositories, with languages and topics, in one GraphQL request per page
+        
+        Args:
+            username: GitHub login
+            max_repos: Maximum number of repositories to return
+            
+        Returns:
+            (user, repositories) in the REST JSON shape, each repository carrying a 'languages' dict,
+            or None if the user could not be fetched
+        """
+        if not self.github:
+            logger.warning("GitHub API not available. Token not provided.")
+            return None
+        
+        cache_key = make_cache_key("github", "/graphql/user_bundle", {'login': username, 'max_repos': max_repos})
+        if self.response_cache:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return tuple(cached)
+        
+        try:
+            raw_user, raw_repos, after = None, [], None
+            while True:
+                self._rate_limit()
+                _, data = self.github.requester.graphql_query(
+                    USER_BUNDLE_QUERY,
+                    {'login': username, 'first': min(GRAPHQL_PAGE_SIZE, max_repos - len(raw_repos)), 'after': after}
+                )
+                user = data['data']['repositoryOwner']
+                if user is None:
+                    logger.warning(f"GitHub owner {username} not found")
+                    return None
+                raw_user = raw_user or _rest_user(user)
+                repositories = user['repositories']
+                raw_repos.extend(_rest_repository(node) for node in repositories['nodes'])
+                if not repositories['pageInfo']['hasNextPage'] or len(raw_repos) >= max_repos:
+                    break
+                after = repositories['pageInfo']['endCursor']
+        except GithubException as e:
+            logger.error(f"Error retrieving user {username}: {e}")
+            return None
+        
+        logger.info(f"Retrieved user {username} with {len(raw_repos)} repositories")
+        if self.response_cache:
+            self.response_cache.set(cache_key, [raw_user, raw_repos])
+        return raw_user, raw_repos
+    
+    def create_async_http_client(self, max_connections: int = 16) -> httpx.AsyncClient:
+        """Create a pooled HTTP/2 client for the async GitHub methods"""
+        headers = {"Accept": "application/vnd.github+json"}
+        if settings.github_token:
+            headers["Authorization"] = f"Bearer {settings.github_token}"
+        return httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            headers=headers,
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections),
+            timeout=30.0
+        )
+    
+    def _rate_limit_wait(self, response: httpx.Response) -> Optional[float]:
+        """Seconds GitHub asks us to wait before the next request, if it is rate limiting"""
+        if response.headers.get("Retry-After"):
+            return float(response.headers["Retry-After"])
+        if response.status_code in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0":
+            return max(0.0, float(response.headers.get("X-RateLimit-Reset", 0)) - time.time())
+        return None
+    
+    async def _aget_json(self, client: httpx.AsyncClient, path: str, **params) -> Any:
+        """GET a GitHub REST path as JSON, served from the response cache when a fresh copy exists"""
+        cache_key = make_cache_key("github", path, params)
+        if self.response_cache:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Revalidate with the ETag we last saw: a 304 reply costs no rate-limit quota
+        etag, etag_data = self._etags.get(cache_key, (None, None))
+        response = await self._arequest(
+            client, "GET", path, params=params or None, headers={"If-None-Match": etag} if etag else None
+        )
+        if response.status_code == 304:
+            data = etag_data
+        else:
+            data = orjson.loads(response.content)
+            if response.headers.get("ETag"):
+                self._etags[cache_key] = (response.headers["ETag"], data)
+        
+        if self.response_cache:
+            self.response_cache.set(cache_key, data)
+        return data
+    
+    async def _agraphql(self, client: httpx.AsyncClient, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GraphQL query and return its data, raising if GitHub reports errors"""
+        result = await self._arequest_json(client, "POST", "/graphql", json={'query': query, 'variables': variables})
+        if result.get('errors'):
+            raise httpx.HTTPError(f"GraphQL errors: {result['errors']}")
+        return result['data']
+    
+    async def _arequest_json(self, client: httpx.AsyncClient, method: str, path: str, **request_kwargs) -> Any:
+        """Send a GitHub API request and decode its JSON body"""
+        response = await self._arequest(client, method, path, **request_kwargs)
+        return orjson.loads(response.content)
+    
+    async def _arequest(self, client: httpx.AsyncClient, method: str, path: str, **request_kwargs) -> httpx.Response:
+        """Send a GitHub API request, paced by the shared token bucket and retried on transient errors"""
+        for attempt in range(MAX_RETRIES + 1):
+            await self._limiter.acquire_async()
+            backoff = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * random.uniform(0.5, 1.0)
+            try:
+                response = await client.request(method, path, **request_kwargs)
+            except httpx.TransportError as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                logger.warning(f"Retrying {path} after connection error: {e}")
+                await asyncio.sleep(backoff)
+                continue
+            
+            rate_limit_wait = self._rate_limit_wait(response)
+            if attempt < MAX_RETRIES and (response.status_code in RETRY_STATUS_CODES or rate_limit_wait is not None):
+                if rate_limit_wait is not None:
+                    # Hold back every caller sharing the bucket, not just this request
+                    logger.warning(f"GitHub rate limited {path}; pausing requests for {rate_limit_wait:.0f}s")
+                    self._limiter.pause(rate_limit_wait)
+                else:
+                    logger.warning(f"Retrying {path} after HTTP {response.status_code}")
+                    await asyncio.sleep(backoff)
+                continue
+            
+            # Error statuses raise; 304 Not Modified is returned for the caller to resolve
+            if response.is_error:
+                response.raise_for_status()
+            return response
+    
+    async def afetch_user_bundle(self, client: httpx.AsyncClient, username: str,
+                                 max_repos: int = 10) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Get a user's profile and repositories, with languages and topics, in one GraphQL request per page
+        
+        Args:
+            client: Client from create_async_http_client
+            username: GitHub login
+            max_repos: Maximum number of repositories to return
+            
+        Returns:
+            (user, repositories) in the REST JSON shape, each repository carrying a 'languages' dict,
+            or None if the user could not be fetched
+        """
+        if not settings.github_token:
+            # GraphQL requires authentication; unauthenticated runs fall back to REST
+            return await self._afetch_user_bundle_rest(client, username, max_repos)
+        
+        cache_key = make_cache_key("github", "/graphql/user_bundle", {'login': username, 'max_repos': max_repos})
+        if self.response_cache:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return tuple(cached)
+        
+        try:
+            raw_user, raw_repos, after = None, [], None
+            # Pages follow each other's cursors, so they are fetched in turn
+            while True:
+                data = await self._agraphql(client, USER_BUNDLE_QUERY, {
+                    'login': username, 'first': min(GRAPHQL_PAGE_SIZE, max_repos - len(raw_repos)), 'after': after
+                })
+                user = data['repositoryOwner']
+                if user is None:
+                    logger.warning(f"GitHub owner {username} not found")
+                    return None
+                raw_user = raw_user or _rest_user(user)
+                repositories = user['repositories']
+                raw_repos.extend(_rest_repository(node) for node in repositories['nodes'])
+                if not repositories['pageInfo']['hasNextPage'] or len(raw_repos) >= max_repos:
+                    break
+                after = repositories['pageInfo']['endCursor']
+        except httpx.HTTPError as e:
+            logger.error(f"Error retrieving user {username}: {e}")
+            return None
+        
+        logger.info(f"Retrieved user {username} with {len(raw_repos)} repositories")
+        if self.response_cache:
+            self.response_cache.set(cache_key, [raw_user, raw_repos])
+        return raw_user, raw_repos
+    
+    async def _afetch_user_bundle_rest(self, client: httpx.AsyncClient, username: str,
+                                       max_repos: int) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """REST equivalent of afetch_user_bundle: one request for the user, one for repositories, one per repository"""
+        raw_user = await self.aget_user(client, username)
+        if not raw_user:
+            return None
+        
+        raw_repos = await self.aget_user_repositories(client, username, max_repos=max_repos)
+        languages = await asyncio.gather(*(
+            self.aget_repository_languages(client, raw_repo['full_name']) for raw_repo in raw_repos
+        ))
+        return raw_user, [dict(raw_repo, languages=repo_languages) for raw_repo, repo_languages in zip(raw_repos, languages)]
+    
+    async def aget_user(self, client: httpx.AsyncClient, username: str) -> Optional[Dict[str, Any]]:
+        """Get a GitHub user's raw profile JSON"""
+        try:
+            user = await self._aget_json(client, f"/users/{username}")
+            logger.info(f"Retrieved user: {username}")
+            return user
+        except httpx.HTTPError as e:
+            logger.error(f"Error retrieving user {username}: {e}")
+            return None
+    
+    async def aget_user_repositories(self, client: httpx.AsyncClient, username: str,
+                                     max_repos: int = 10) -> List[Dict[str, Any]]:
+        """Get a user's repositories as raw JSON; each one already lists its topics"""
+        try:
+            # GitHub caps pages at 100 repositories; request every page needed at once
+            per_page = min(max_repos, REST_PAGE_SIZE)
+            pages = await asyncio.gather(*(
+                self._aget_json(client, f"/users/{username}/repos", per_page=per_page, page=page)
+                for page in range(1, -(-max_repos // per_page) + 1)
+            ))
+            repos = [repo for page_repos in pages for repo in page_repos][:max_repos]
+            logger.info(f"Retrieved {len(repos)} repositories for user: {username}")
+            return repos
+        except httpx.HTTPError as e:
+            logger.error(f"Error retrieving repositories for {username}: {e}")
+            return []
+    
+    async def aget_repository_languages(self, client: httpx.AsyncClient, full_name: str) -> Dict[str, int]:
+        """Get language statistics for a repository"""
+        try:
+            return await self._aget_json(client, f"/repos/{full_name}/languages")
+        except httpx.HTTPError as e:
+            logger.error(f"Error retrieving languages for {full_name}: {e}")
+            return {}
+    
     def get_rate_limit_status(self) -> Dict[str, Any]:
-        """Get current rate limit status"""
+        """Get current rate limit status, reusing one fetched in the last few seconds"""
+        fetched_at, status = self._rate_limit_status
+        if status and time.monotonic() - fetched_at < RATE_LIMIT_STATUS_TTL:
+            return status
+        
         try:
             rate_limit = self.github.get_rate_limit()
-            return {
+            status = {
                 "core": {
                     "limit": rate_limit.core.limit,
                     "remaining": rate_limit.core.remaining,
@@ -131,6 +537,8 @@ class GitHubClient:
                     "reset": datetime.fromtimestamp(rate_limit.search.reset.timestamp())
                 }
             }
+            self._rate_limit_status = (time.monotonic(), status)
+            return status
         except GithubException as e:
             logger.error(f"Error getting rate limit status: {e}")
             return {}
@@ -153,29 +561,24 @@ class GitHubClient:
     
     def get_trending_repositories(self, language: str = None, time_range: str = 'daily') -> List[Dict[str, Any]]:
         """Get trending repositories using GitHub Search API"""
+        cache_key = f"github:trending:{language}:{time_range}"
+        if self.response_cache:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            self._rate_limit()
+            self._search_rate_limit()
             
             # Use GitHub Search API to find popular repositories
             # by searching for repositories with high star counts in the specified language
             query = f"language:{language}" if language else "stars:>100"
             
             # Convert time_range to proper date format
-            if time_range == 'daily':
-                # Search for repositories created in the last 7 days
-                from datetime import datetime, timedelta
-                week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-                query += f" created:>={week_ago}"
-            elif time_range == 'weekly':
-                # Search for repositories created in the last 30 days
-                from datetime import datetime, timedelta
-                month_ago = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-                query += f" created:>={month_ago}"
-            elif time_range == 'monthly':
-                # Search for repositories created in the last 90 days
-                from datetime import datetime, timedelta
-                three_months_ago = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
-                query += f" created:>={three_months_ago}"
+            days = TIME_RANGE_DAYS.get(time_range)
+            if days:
+                # Search for repositories created in the time range
+                query += f" created:>={(datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')}"
             
             repos = self.github.search_repositories(
                 query=query,
@@ -183,28 +586,13 @@ class GitHubClient:
                 order="desc"
             )
             
-            trending_repos = []
-            for repo in repos[:20]:  # Get top 20 trending repos
-                trending_repos.append({
-                    'id': repo.id,
-                    'name': repo.name,
-                    'full_name': repo.full_name,
-                    'description': repo.description,
-                    'language': repo.language,
-                    'stars': repo.stargazers_count,
-                    'forks': repo.forks_count,
-                    'owner': {
-                        'login': repo.owner.login,
-                        'id': repo.owner.id,
-                        'type': repo.owner.type
-                    },
-                    'created_at': repo.created_at.isoformat() if repo.created_at else None,
-                    'updated_at': repo.updated_at.isoformat() if repo.updated_at else None,
-                    'html_url': repo.html_url,
-                    'clone_url': repo.clone_url
-                })
+            # Map the JSON each search result was built from: reading it through the
+            # properties (or raw_data) can complete the object with another request per repo
+            trending_repos = [_trending_repository(repo._rawData) for repo in repos[:20]]  # Get top 20 trending repos
             
             logger.info(f"Retrieved {len(trending_repos)} trending repositories for language: {language}")
+            if self.response_cache and trending_repos:
+                self.response_cache.set(cache_key, trending_repos)
             return trending_repos
             
         except GithubException as e:
@@ -0,0 +1,29 @@
+"""
+Shared requests.Session factory for the sync API clients
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config.settings import settings
+
+
+def create_http_session() -> requests.Session:
+    """Create a session that keeps a connection per worker alive and retries transient failures"""
+    session = requests.Session()
+    # Size the pool to the collector's concurrency so parallel requests reuse connections
+    # instead of opening (and TLS-handshaking) new ones past urllib3's default of 10
+    adapter = HTTPAdapter(
+        pool_maxsize=max(10, settings.collector_max_workers),
+        # Retry transient failures with exponential backoff, honouring Retry-After on 429
+        max_retries=Retry(
+            total=3,
+            backoff_factor=1.0,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=True
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -2,43 +2,101 @@
 Alternative Job Market Data Sources for DevCareerCompass
 Replaces Adzuna API with more reliable and accessible data sources
 """
+import asyncio
 import logging
+import re
 import time
-import requests
+import httpx
+import numpy as np
+import orjson
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from lxml import etree
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import json
 
 from src.config.settings import settings
+from src.data_pipeline.http_session import create_http_session
+from src.data_pipeline.response_cache import ResponseCache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
+# Compiled once: the fields read from each Stack Overflow Jobs RSS item
+_FEED_NAMESPACES = {'a10': 'http://www.w3.org/2005/Atom'}
+_FEED_FIELD_XPATHS = {
+    field: etree.XPath(f'string({path})', namespaces=_FEED_NAMESPACES, smart_strings=False)
+    for field, path in [
+        ('title', 'title'),
+        ('company', 'a10:name'),
+        ('location', 'location'),
+        ('description', 'description'),
+        ('link', 'link'),
+        ('published', 'pubDate')
+    ]
+}
+
+# Salary amounts in job text: "$120,000" or "$120k" / "120K" (but not "401k")
+SALARY_RE = re.compile(r'\$\s?(\d{2,3}),(\d{3})\b|(?<![\d$])\$?\s?(?!401[kK])(\d{2,3})\s?[kK]\b')
+# Parsed amounts outside this band are hourly rates, typos or other numbers, not annual salaries
+SALARY_BOUNDS = (20000, 1000000)
+# Reported when no job mentions a salary
+DEFAULT_SALARY_RANGE = (50000, 150000, 95000)
+
+# Technology trends share one broad search per source and are matched to each technology locally
+POOLED_MARKET_QUERY = "developer"
+POOLED_MARKET_LIMIT = 200
+# Demand level from the share of pooled jobs that mention a technology
+DEMAND_SHARE_HIGH = 0.15
+DEMAND_SHARE_MEDIUM = 0.05
+
+
+def _run_sync(coroutine):
+    """Run a coroutine to completion from sync code, even if this thread is already running an event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    
+    # asyncio.run cannot nest inside a running loop, so give the coroutine a thread of its own
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
 
 class GitHubJobsClient:
     """GitHub Jobs API client - Free and reliable job data"""
     
     def __init__(self):
         self.base_url = "https://jobs.github.com/positions.json"
-        self.session = requests.Session()
+        self.session = create_http_session()
         logger.info("GitHub Jobs API client initialized")
     
     def search_jobs(self, query: str = "python developer", location: str = None, 
                    page: int = 1, limit: int = 50) -> List[Dict[str, Any]]:
         """Search for jobs on GitHub Jobs"""
         try:
-            params = {
-                'search': query,
-                'page': page
-            }
+            logger.info(f"Searching GitHub Jobs for: {query}")
+            response = self.session.get(self.base_url, params=self._search_params(query, location, page), timeout=30)
+            response.raise_for_status()
             
-            if location:
-                params['location'] = location
+            jobs = orjson.loads(response.content)
+            logger.info(f"Found {len(jobs)} jobs on GitHub Jobs")
+            return jobs[:limit]
             
+        except Exception as e:
+            logger.error(f"Error searching GitHub Jobs: {e}")
+            return []
+    
+    async def asearch_jobs(self, client: httpx.AsyncClient, query: str = "python developer",
+                           location: str = None, page: int = 1, limit: int = 50) -> List[Dict[str, Any]]:
+        """Search for jobs on GitHub Jobs without blocking the event loop"""
+        try:
             logger.info(f"Searching GitHub Jobs for: {query}")
-            response = self.session.get(self.base_url, params=params, timeout=30)
+            response = await client.get(self.base_url, params=self._search_params(query, location, page), timeout=30)
             response.raise_for_status()
             
-            jobs = response.json()
+            jobs = orjson.loads(response.content)
             logger.info(f"Found {len(jobs)} jobs on GitHub Jobs")
             return jobs[:limit]
             
@@ -46,6 +104,18 @@ class GitHubJobsClient:
             logger.error(f"Error searching GitHub Jobs: {e}")
             return []
     
+    def _search_params(self, query: str, location: Optional[str], page: int) -> Dict[str, Any]:
+        """Build the query string for a job search"""
+        params = {
+            'search': query,
+            'page': page
+        }
+        
+        if location:
+            params['location'] = location
+        
+        return params
+    
     def get_job_details(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed job information"""
         try:
@@ -53,7 +123,7 @@ class GitHubJobsClient:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            return response.json()
+            return orjson.loads(response.content)
             
         except Exception as e:
             logger.error(f"Error fetching GitHub Jobs details: {e}")
@@ -83,46 +153,57 @@ class StackOverflowJobsClient:
     
     def __init__(self):
         self.base_url = "https://stackoverflow.com/jobs/feed"
-        self.session = requests.Session()
+        self.session = create_http_session()
         logger.info("Stack Overflow Jobs client initialized")
     
     def search_jobs(self, query: str = "python", location: str = None, 
                    limit: int = 50) -> List[Dict[str, Any]]:
         """Search for jobs on Stack Overflow Jobs"""
         try:
-            params = {
-                'q': query,
-                'l': location if location else '',
-                'u': 'Miles',  # Distance unit
-                'd': '20'      # Distance in miles
-            }
-            
             logger.info(f"Searching Stack Overflow Jobs for: {query}")
-            response = self.session.get(self.base_url, params=params, timeout=30)
+            response = self.session.get(self.base_url, params=self._search_params(query, location), timeout=30)
             response.raise_for_status()
             
-            # Parse RSS feed
-            import xml.etree.ElementTree as ET
-            root = ET.fromstring(response.content)
-            
-            jobs = []
-            for item in root.findall('.//item')[:limit]:
-                job = {
-                    'title': item.find('title').text if item.find('title') is not None else '',
-                    'company': item.find('a10:name', namespaces={'a10': 'http://www.w3.org/2005/Atom'}).text if item.find('a10:name', namespaces={'a10': 'http://www.w3.org/2005/Atom'}) is not None else '',
-                    'location': item.find('location').text if item.find('location') is not None else '',
-                    'description': item.find('description').text if item.find('description') is not None else '',
-                    'link': item.find('link').text if item.find('link') is not None else '',
-                    'published': item.find('pubDate').text if item.find('pubDate') is not None else ''
-                }
-                jobs.append(job)
+            jobs = self._parse_feed(response.content, limit)
+            logger.info(f"Found {len(jobs)} jobs on Stack Overflow Jobs")
+            return jobs
             
+        except Exception as e:
+            logger.error(f"Error searching Stack Overflow Jobs: {e}")
+            return []
+    
+    async def asearch_jobs(self, client: httpx.AsyncClient, query: str = "python", location: str = None,
+                           limit: int = 50) -> List[Dict[str, Any]]:
+        """Search for jobs on Stack Overflow Jobs without blocking the event loop"""
+        try:
+            logger.info(f"Searching Stack Overflow Jobs for: {query}")
+            response = await client.get(self.base_url, params=self._search_params(query, location), timeout=30)
+            response.raise_for_status()
+            
+            jobs = self._parse_feed(response.content, limit)
             logger.info(f"Found {len(jobs)} jobs on Stack Overflow Jobs")
             return jobs
             
         except Exception as e:
             logger.error(f"Error searching Stack Overflow Jobs: {e}")
             return []
+    
+    def _search_params(self, query: str, location: Optional[str]) -> Dict[str, Any]:
+        """Build the query string for a job search"""
+        return {
+            'q': query,
+            'l': location if location else '',
+            'u': 'Miles',  # Distance unit
+            'd': '20'      # Distance in miles
+        }
+    
+    def _parse_feed(self, content: bytes, limit: int) -> List[Dict[str, Any]]:
+        """Parse the jobs RSS feed into job dicts"""
+        root = etree.fromstring(content)
+        return [
+            {field: xpath(item) for field, xpath in _FEED_FIELD_XPATHS.items()}
+            for item in islice(root.iter('item'), limit)
+        ]
 
 
 
@@ -133,7 +214,7 @@ class IndeedJobsClient:
     
     def __init__(self):
         self.base_url = "https://indeed12.p.rapidapi.com"
-        self.session = requests.Session()
+        self.session = create_http_session()
         self.api_key = settings.xrapid_api_key
         
         if self.api_key:
@@ -154,18 +235,38 @@ class IndeedJobsClient:
             
             logger.info(f"Searching Indeed Jobs for: {query}")
             
-            # Use the correct endpoint from the documentation
-            params = {
-                'query': query,
-                'location': location or 'Remote',
-                'start': 1,  # Starting position
-                'limit': min(limit, 20)  # API limit
-            }
+            response = self.session.get(
+                f"{self.base_url}/jobs/search", params=self._search_params(query, location, limit), timeout=60
+            )
+            response.raise_for_status()
+            
+            data = orjson.loads(response.content)
+            jobs = data.get('data', [])
+            
+            logger.info(f"Found {len(jobs)} jobs on Indeed")
+            return jobs[:limit]
+            
+        except Exception as e:
+            logger.error(f"Error searching Indeed Jobs: {e}")
+            return []
+    
+    async def asearch_jobs(self, client: httpx.AsyncClient, query: str = "python developer",
+                           location: str = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Search for jobs on Indeed without blocking the event loop"""
+        try:
+            if not self.api_key:
+                logger.warning("X-Rapid API key not configured - skipping collection")
+                return []
+            
+            logger.info(f"Searching Indeed Jobs for: {query}")
             
-            response = self.session.get(f"{self.base_url}/jobs/search", params=params, timeout=60)
+            response = await client.get(
+                f"{self.base_url}/jobs/search", params=self._search_params(query, location, limit),
+                headers=dict(self.session.headers), timeout=60
+            )
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             jobs = data.get('data', [])
             
             logger.info(f"Found {len(jobs)} jobs on Indeed")
@@ -175,6 +276,16 @@ class IndeedJobsClient:
             logger.error(f"Error searching Indeed Jobs: {e}")
             return []
     
+    def _search_params(self, query: str, location: Optional[str], limit: int) -> Dict[str, Any]:
+        """Build the query string for a job search"""
+        # Use the correct endpoint from the documentation
+        return {
+            'query': query,
+            'location': location or 'Remote',
+            'start': 1,  # Starting position
+            'limit': min(limit, 20)  # API limit
+        }
+    
     def get_company_jobs(self, company: str, location: str = "us", start: int = 1) -> List[Dict[str, Any]]:
         """Get jobs from a specific company using Indeed API"""
         try:
@@ -192,7 +303,7 @@ class IndeedJobsClient:
             response = self.session.get(f"{self.base_url}/company/{company}/jobs", params=params, timeout=60)
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             jobs = data.get('data', [])
             
             logger.info(f"Found {len(jobs)} jobs for company {company}")
@@ -210,6 +321,7 @@ class AdzunaJobsClient:
         self.base_url = "https://api.adzuna.com/v1"
         self.app_id = settings.adjuna_app_id
         self.app_key = settings.adjuna_app_key
+        self.session = create_http_session()
         
         logger.info("Adzuna Jobs client initialized")
     
@@ -223,18 +335,37 @@ class AdzunaJobsClient:
             
             logger.info(f"Searching Adzuna Jobs for: {query}")
             
-            params = {
-                'app_id': self.app_id,
-                'app_key': self.app_key,
-                'results_per_page': min(limit, 50),
-                'what': query,
-                'where': location
-            }
+            response = self.session.get(
+                f"{self.base_url}/{location}/jobs/search/1", params=self._search_params(query, location, limit), timeout=60
+            )
+            response.raise_for_status()
+            
+            data = orjson.loads(response.content)
+            jobs = data.get('results', [])
+            
+            logger.info(f"Found {len(jobs)} jobs on Adzuna")
+            return jobs[:limit]
             
-            response = requests.get(f"{self.base_url}/{location}/jobs/search/1", params=params, timeout=60)
+        except Exception as e:
+            logger.error(f"Error searching Adzuna Jobs: {e}")
+            return []
+    
+    async def asearch_jobs(self, client: httpx.AsyncClient, query: str = "python developer",
+                           location: str = "gb", limit: int = 50) -> List[Dict[str, Any]]:
+        """Search for jobs on Adzuna without blocking the event loop"""
+        try:
+            if not self.app_id or not self.app_key:
+                logger.warning("Adzuna API credentials not configured - skipping collection")
+                return []
+            
+            logger.info(f"Searching Adzuna Jobs for: {query}")
+            
+            response = await client.get(
+                f"{self.base_url}/{location}/jobs/search/1", params=self._search_params(query, location, limit), timeout=60
+            )
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             jobs = data.get('results', [])
             
             logger.info(f"Found {len(jobs)} jobs on Adzuna")
@@ -243,12 +374,63 @@ class AdzunaJobsClient:
         except Exception as e:
             logger.error(f"Error searching Adzuna Jobs: {e}")
             return []
+    
+    def _search_params(self, query: str, location: str, limit: int) -> Dict[str, Any]:
+        """Build the query string for a job search"""
+        return {
+            'app_id': self.app_id,
+            'app_key': self.app_key,
+            'results_per_page': min(limit, 50),
+            'what': query,
+            'where': location
+        }
+
+
+@dataclass(slots=True)
+class SourceResult:
+    """Jobs collected from one source, or the error that source failed with"""
+    count: int
+    jobs: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flatten into the per-source dict shape of the market data"""
+        if self.error is not None:
+            return {'count': self.count, 'error': self.error}
+        return {'count': self.count, 'jobs': self.jobs}
+
+
+@dataclass(slots=True)
+class MarketData:
+    """Market data for one technology; kept as an object until it is handed to callers"""
+    technology: str
+    location: Optional[str]
+    collection_time: str
+    sources: Dict[str, SourceResult] = field(default_factory=dict)
+    aggregated_trends: List[Dict[str, Any]] = field(default_factory=list)
+    skills_demand: Dict[str, Any] = field(default_factory=dict)
+    salary_ranges: Dict[str, Any] = field(default_factory=dict)
+    total_jobs: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flatten into the market data dict returned by the aggregator"""
+        return {
+            'technology': self.technology,
+            'location': self.location,
+            'sources': {name: source.to_dict() for name, source in self.sources.items()},
+            'aggregated_trends': self.aggregated_trends,
+            'skills_demand': self.skills_demand,
+            'salary_ranges': self.salary_ranges,
+            'total_jobs': self.total_jobs,
+            'collection_time': self.collection_time
+        }
 
 
 class JobMarketDataAggregator:
     """Aggregates job market data from multiple sources"""
     
-    def __init__(self):
+    def __init__(self, response_cache: Optional[ResponseCache] = None):
+        self.response_cache = response_cache
         self.github_jobs = GitHubJobsClient()
         self.stack_overflow_jobs = StackOverflowJobsClient()
         self.indeed_jobs = IndeedJobsClient()
@@ -256,99 +438,105 @@ class JobMarketDataAggregator:
         
         logger.info("Job Market Data Aggregator initialized")
     
+    def create_async_http_client(self, max_connections: int = 16) -> httpx.AsyncClient:
+        """Create a pooled HTTP client shared by the async job searches"""
+        # Retry failed connection attempts; HTTP error statuses are left to each client's error handling
+        transport = httpx.AsyncHTTPTransport(retries=3, limits=httpx.Limits(max_connections=max_connections))
+        return httpx.AsyncClient(transport=transport, timeout=60.0)
+    
     def get_comprehensive_market_data(self, technology: str = "python", 
                                     location: str = None) -> Dict[str, Any]:
         """Get comprehensive job market data from all sources"""
-        logger.info(f"Collecting comprehensive market data for: {technology}")
-        
-        market_data = {
-            'technology': technology,
-            'location': location,
-            'sources': {},
-            'aggregated_trends': [],
-            'skills_demand': {},
-            'salary_ranges': {},
-            'total_jobs': 0,
-            'collection_time': datetime.now().isoformat()
-        }
-        
-        # Collect from GitHub Jobs
-        try:
-            github_jobs = self.github_jobs.search_jobs(f"{technology} developer", location, limit=20)
-            market_data['sources']['github_jobs'] = {
-                'count': len(github_jobs),
-                'jobs': github_jobs[:5]  # Store first 5 for trends
-            }
-            market_data['total_jobs'] += len(github_jobs)
-        except Exception as e:
-            logger.error(f"GitHub Jobs collection failed: {e}")
-            market_data['sources']['github_jobs'] = {'count': 0, 'error': str(e)}
+        return _run_sync(self.aget_comprehensive_market_data(technology, location))
+    
+    async def aget_comprehensive_market_data(self, technology: str = "python", location: str = None,
+                                             client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+        """Get comprehensive job market data, querying every source concurrently"""
+        if client is None:
+            async with self.create_async_http_client() as client:
+                return await self.aget_comprehensive_market_data(technology, location, client)
         
-        # Collect from Stack Overflow Jobs
-        try:
-            so_jobs = self.stack_overflow_jobs.search_jobs(technology, location, limit=20)
-            market_data['sources']['stack_overflow_jobs'] = {
-                'count': len(so_jobs),
-                'jobs': so_jobs[:5]
-            }
-            market_data['total_jobs'] += len(so_jobs)
-        except Exception as e:
-            logger.error(f"Stack Overflow Jobs collection failed: {e}")
-            market_data['sources']['stack_overflow_jobs'] = {'count': 0, 'error': str(e)}
+        market_data = await self._acollect_market_data(technology, location, client)
+        return market_data.to_dict()
+    
+    async def _acollect_market_data(self, technology: str, location: Optional[str],
+                                    client: httpx.AsyncClient) -> MarketData:
+        """Query every source concurrently and analyze the combined jobs"""
+        logger.info(f"Collecting comprehensive market data for: {technology}")
         
-
+        market_data = MarketData(technology, location, datetime.now().isoformat())
         
-        # Collect from Indeed Jobs
-        try:
-            indeed_jobs = self.indeed_jobs.search_jobs(f"{technology} developer", location, limit=20)
-            market_data['sources']['indeed_jobs'] = {
-                'count': len(indeed_jobs),
-                'jobs': indeed_jobs[:5]
-            }
-            market_data['total_jobs'] += len(indeed_jobs)
-        except Exception as e:
-            logger.error(f"Indeed Jobs collection failed: {e}")
-            market_data['sources']['indeed_jobs'] = {'count': 0, 'error': str(e)}
+        # Wall time is the slowest source rather than the sum of all of them
+        source_names = ['github_jobs', 'stack_overflow_jobs', 'indeed_jobs', 'adzuna_jobs']
+        results = await asyncio.gather(
+            self._acached_search(
+                'github_jobs', self.github_jobs.asearch_jobs, client, f"{technology} developer", location
+            ),
+            self._acached_search(
+                'stack_overflow_jobs', self.stack_overflow_jobs.asearch_jobs, client, technology, location
+            ),
+            self._acached_search(
+                'indeed_jobs', self.indeed_jobs.asearch_jobs, client, f"{technology} developer", location
+            ),
+            self._acached_search(
+                'adzuna_jobs', self.adzuna_jobs.asearch_jobs, client, f"{technology} developer", location or "gb"
+            ),
+            return_exceptions=True
+        )
         
-        # Collect from Adzuna Jobs
-        try:
-            adzuna_jobs = self.adzuna_jobs.search_jobs(f"{technology} developer", location or "gb", limit=20)
-            market_data['sources']['adzuna_jobs'] = {
-                'count': len(adzuna_jobs),
-                'jobs': adzuna_jobs[:5]
-            }
-            market_data['total_jobs'] += len(adzuna_jobs)
-        except Exception as e:
-            logger.error(f"Adzuna Jobs collection failed: {e}")
-            market_data['sources']['adzuna_jobs'] = {'count': 0, 'error': str(e)}
+        for source_name, jobs in zip(source_names, results):
+            if isinstance(jobs, Exception):
+                logger.error(f"{source_name} collection failed: {jobs}")
+                market_data.sources[source_name] = SourceResult(0, error=str(jobs))
+                continue
+            
+            market_data.sources[source_name] = SourceResult(len(jobs), jobs[:5])  # Store first 5 for trends
+            market_data.total_jobs += len(jobs)
         
         # Aggregate trends
         all_jobs = []
-        for source_data in market_data['sources'].values():
-            if 'jobs' in source_data:
-                all_jobs.extend(source_data['jobs'])
+        for source_data in market_data.sources.values():
+            all_jobs.extend(source_data.jobs)
         
         # Create aggregated trends
-        market_data['aggregated_trends'] = all_jobs[:10]
+        market_data.aggregated_trends = all_jobs[:10]
         
         # Analyze skills demand
-        market_data['skills_demand'] = self._analyze_skills_demand(all_jobs, technology)
+        market_data.skills_demand = self._analyze_skills_demand(all_jobs, technology)
         
         # Analyze salary ranges
-        market_data['salary_ranges'] = self._analyze_salary_ranges(all_jobs)
+        market_data.salary_ranges = self._analyze_salary_ranges(all_jobs)
         
-        logger.info(f"Comprehensive market data collected: {market_data['total_jobs']} total jobs")
+        logger.info(f"Comprehensive market data collected: {market_data.total_jobs} total jobs")
         return market_data
     
+    async def _acached_search(self, source_name: str, search, client: httpx.AsyncClient,
+                              query: str, location: Optional[str], limit: int = 20) -> List[Dict[str, Any]]:
+        """Run one source's job search, reusing a cached result for the same query, location and limit"""
+        cache_key = make_cache_key("jobs", source_name, {'query': query, 'location': location, 'limit': limit})
+        if self.response_cache:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        jobs = await search(client, query, location, limit=limit)
+        # Sources swallow their errors and return no jobs, so only non-empty results are cached
+        if self.response_cache and jobs:
+            self.response_cache.set(cache_key, jobs)
+        return jobs
+    
     def _analyze_skills_demand(self, jobs: List[Dict[str, Any]], primary_skill: str) -> Dict[str, Any]:
         """Analyze skills demand from job data"""
         skills = [primary_skill, 'JavaScript', 'Java', 'React', 'AWS', 'Docker', 'Kubernetes']
         
+        # Lowercase each job's text once rather than once per skill
+        job_texts = [(job.get('title', '') + job.get('description', '')).lower() for job in jobs]
+        
         demand_analysis = {}
         for skill in skills:
             # Count jobs mentioning this skill
-            count = sum(1 for job in jobs if skill.lower() in 
-                       (job.get('title', '') + job.get('description', '')).lower())
+            skill_lower = skill.lower()
+            count = sum(1 for job_text in job_texts if skill_lower in job_text)
             
             demand_analysis[skill] = {
                 'job_count': count,
@@ -358,42 +546,112 @@ class JobMarketDataAggregator:
         return demand_analysis
     
     def _analyze_salary_ranges(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze salary ranges from job data"""
-        # Extract salary information (this would need more sophisticated parsing)
-        salary_data = {
-            'min_salary': 50000,
-            'max_salary': 150000,
-            'average_salary': 95000,
-            'salary_range': '50k-150k',
-            'currency': 'USD'
-        }
+        """Analyze salary ranges from the salary fields and salary figures mentioned in job data"""
+        salaries = np.fromiter(self._iter_salaries(jobs), dtype=float)
+        salaries = salaries[(salaries >= SALARY_BOUNDS[0]) & (salaries <= SALARY_BOUNDS[1])]
+        
+        if salaries.size:
+            min_salary, max_salary, average_salary = salaries.min(), salaries.max(), salaries.mean()
+            percentiles = dict(zip(('p25', 'p50', 'p75', 'p95'), np.percentile(salaries, [25, 50, 75, 95]).round()))
+        else:
+            min_salary, max_salary, average_salary = DEFAULT_SALARY_RANGE
+            percentiles = {}
         
-        return salary_data
+        return {
+            'min_salary': int(min_salary),
+            'max_salary': int(max_salary),
+            'average_salary': int(round(average_salary)),
+            'salary_range': f"{int(min_salary) // 1000}k-{int(max_salary) // 1000}k",
+            'currency': 'USD',
+            'percentiles': {name: int(value) for name, value in percentiles.items()},
+            'sample_size': int(salaries.size)
+        }
+    
+    def _iter_salaries(self, jobs: List[Dict[str, Any]]):
+        """Yield every salary amount found in the jobs, in one pass"""
+        for job in jobs:
+            for salary_field in ('salary_min', 'salary_max'):
+                if isinstance(job.get(salary_field), (int, float)):
+                    yield job[salary_field]
+            
+            text = f"{job.get('title') or ''} {job.get('description') or ''} {job.get('salary') or ''}"
+            for thousands, units, shorthand in SALARY_RE.findall(text):
+                yield int(thousands + units) if thousands else int(shorthand) * 1000
     
     def get_technology_trends(self, technologies: List[str]) -> Dict[str, Any]:
         """Get trends for multiple technologies"""
-        trends = {}
+        return _run_sync(self.aget_technology_trends(technologies))
+    
+    async def aget_technology_trends(self, technologies: List[str]) -> Dict[str, Any]:
+        """Get trends for multiple technologies from one shared pool of jobs"""
+        logger.info(f"Analyzing trends for: {', '.join(technologies)}")
+        
+        pool = await self.aget_pooled_market()
+        
+        # Build each job's searchable text once rather than once per technology
+        job_texts = [f"{job.get('title') or ''} {job.get('description') or ''}" for job in pool]
         
+        trends = {}
         for tech in technologies:
-            logger.info(f"Analyzing trends for: {tech}")
-            market_data = self.get_comprehensive_market_data(tech)
+            # Whole-word match that still works for names ending in symbols, like "c++"
+            pattern = re.compile(rf'(?<!\w){re.escape(tech)}(?!\w)', re.IGNORECASE)
+            matched = [job for job, job_text in zip(pool, job_texts) if pattern.search(job_text)]
+            
+            # Sources cap their pages, so counts are only meaningful relative to the pool
+            share = len(matched) / len(pool) if pool else 0.0
             trends[tech] = {
-                'total_jobs': market_data['total_jobs'],
-                'demand_level': 'high' if market_data['total_jobs'] > 50 else 'medium' if market_data['total_jobs'] > 20 else 'low',
-                'top_locations': self._extract_top_locations(market_data['aggregated_trends']),
-                'salary_range': market_data['salary_ranges']['salary_range']
+                'total_jobs': len(matched),
+                'pool_size': len(pool),
+                'market_share': round(share, 3),
+                'demand_level': 'high' if share > DEMAND_SHARE_HIGH else 'medium' if share > DEMAND_SHARE_MEDIUM else 'low',
+                'top_locations': self._extract_top_locations(matched),
+                'salary_range': self._analyze_salary_ranges(matched)['salary_range']
             }
         
         return trends
     
+    def get_pooled_market(self) -> List[Dict[str, Any]]:
+        """Get one broad pool of developer jobs from every source"""
+        return _run_sync(self.aget_pooled_market())
+    
+    async def aget_pooled_market(self, client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, Any]]:
+        """Get one broad pool of developer jobs, querying every source once and concurrently"""
+        if client is None:
+            async with self.create_async_http_client() as client:
+                return await self.aget_pooled_market(client)
+        
+        source_names = ['github_jobs', 'stack_overflow_jobs', 'indeed_jobs', 'adzuna_jobs']
+        searches = [
+            self.github_jobs.asearch_jobs, self.stack_overflow_jobs.asearch_jobs,
+            self.indeed_jobs.asearch_jobs, self.adzuna_jobs.asearch_jobs
+        ]
+        results = await asyncio.gather(
+            *(
+                self._acached_search(
+                    source_name, search, client, POOLED_MARKET_QUERY,
+                    "gb" if source_name == 'adzuna_jobs' else None, limit=POOLED_MARKET_LIMIT
+                )
+                for source_name, search in zip(source_names, searches)
+            ),
+            return_exceptions=True
+        )
+        
+        pool = []
+        for source_name, jobs in zip(source_names, results):
+            if isinstance(jobs, Exception):
+                logger.error(f"{source_name} collection failed: {jobs}")
+                continue
+            pool.extend(jobs)
+        
+        logger.info(f"Collected a pool of {len(pool)} jobs")
+        return pool
+    
     def _extract_top_locations(self, jobs: List[Dict[str, Any]]) -> List[str]:
         """Extract top job locations"""
-        locations = {}
-        for job in jobs:
-            location = job.get('location', '') or job.get('formattedLocation', '')
-            if location:
-                locations[location] = locations.get(location, 0) + 1
+        locations = Counter(
+            location for location in (job.get('location', '') or job.get('formattedLocation', '') for job in jobs)
+            if location
+        )
         
         # Return top 5 locations
-        sorted_locations = sorted(locations.items(), key=lambda x: x[1], reverse=True)
-        return [loc[0] for loc in sorted_locations[:5]] 
\ No newline at end of file
+        return [location for location, _ in locations.most_common(5)]
@@ -0,0 +1,53 @@
+"""
+Token-bucket rate limiter shared by the API clients
+"""
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket: allows bursts up to capacity, refilled at a steady rate"""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Args:
+            capacity: Maximum number of tokens (requests) that can be spent in a burst
+            refill_rate: Tokens added back per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """Add the tokens accrued since the last refill"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_rate)
+        self._last_refill = now
+
+    def _try_take(self, tokens: float) -> float:
+        """Take tokens if available; otherwise return the seconds until they will be"""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+            return (tokens - self._tokens) / self.refill_rate
+
+    def acquire(self, tokens: float = 1):
+        """Take tokens from the bucket, sleeping only while it is empty"""
+        while (wait_time := self._try_take(tokens)) > 0:
+            time.sleep(wait_time)
+
+    def pause(self, seconds: float):
+        """Hold back every token for the given time, e.g. when an API answers with Retry-After"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.refill_rate)
+
+    async def acquire_async(self, tokens: float = 1):
+        """Take tokens from the bucket without blocking the event loop while it refills"""
+        while (wait_time := self._try_take(tokens)) > 0:
+            await asyncio.sleep(wait_time)
@@ -0,0 +1,70 @@
+"""
+Disk-backed TTL cache for slow-changing API responses
+"""
+import logging
+import os
+import sqlite3
+import time
+import orjson
+from contextlib import closing
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(namespace: str, path: str, params: Optional[Dict[str, Any]] = None,
+                   exclude: Iterable[str] = ()) -> str:
+    """Build a cache key for a request that ignores parameter order, unset values and excluded names"""
+    items = sorted(
+        (name, value) for name, value in (params or {}).items()
+        if value is not None and name not in exclude
+    )
+    return f"{namespace}:{path}?{urlencode(items)}"
+
+
+class ResponseCache:
+    """SQLite-backed cache of JSON-serializable API responses that survives across runs"""
+
+    def __init__(self, path: str, ttl: int):
+        """
+        Args:
+            path: SQLite file holding the cached responses
+            ttl: Seconds a cached response stays valid
+        """
+        self.path = path
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection; one per call keeps the cache usable from worker threads"""
+        return sqlite3.connect(self.path, timeout=10)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response for key, or None when missing or expired"""
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, time.time())
+                ).fetchone()
+            return orjson.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"Error reading cached response {key}: {e}")
+            return None
+
+    def set(self, key: str, value: Any):
+        """Store a response under key for the cache's TTL"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode(), time.time() + self.ttl)
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.error(f"Error caching response {key}: {e}")
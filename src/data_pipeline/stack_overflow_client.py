@@ -2,12 +2,14 @@
 Stack Overflow API client for collecting developer data
 """
 import logging
-import time
-import requests
+import orjson
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from src.config.settings import settings
+from src.data_pipeline.http_session import create_http_session
+from src.data_pipeline.rate_limiter import TokenBucket
+from src.data_pipeline.response_cache import ResponseCache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -15,10 +17,19 @@ logger = logging.getLogger(__name__)
 class StackOverflowClient:
     """Client for interacting with Stack Overflow API"""
     
-    def __init__(self):
+    def __init__(self, response_cache: Optional[ResponseCache] = None):
+        self.response_cache = response_cache
         self.api_key = settings.stack_overflow_api_key
         self.base_url = settings.stack_overflow_api_base_url
-        self.session = requests.Session()
+        self.session = create_http_session()
+        # Sent with every request; the key is only included when one is configured
+        self.default_params = {'site': 'stackoverflow'}
+        if self.api_key:
+            self.default_params['key'] = self.api_key
+        self._limiter = TokenBucket(
+            capacity=settings.stack_overflow_requests_per_second,
+            refill_rate=settings.stack_overflow_requests_per_second
+        )
         
         if self.api_key:
             self.session.headers.update({
@@ -29,15 +40,7 @@ class StackOverflowClient:
         """Get user profile from Stack Overflow"""
         try:
             url = f"{self.base_url}/users/{user_id}"
-            params = {
-                'site': 'stackoverflow',
-                'key': self.api_key if self.api_key else None
-            }
-            
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json(url)
             if 'items' in data and data['items']:
                 return data['items'][0]
             
@@ -52,19 +55,14 @@ class StackOverflowClient:
         try:
             url = f"{self.base_url}/users"
             params = {
-                'site': 'stackoverflow',
                 'inname': query,
                 'page': page,
                 'pagesize': page_size,
                 'order': 'desc',
-                'sort': 'reputation',
-                'key': self.api_key if self.api_key else None
+                'sort': 'reputation'
             }
             
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json(url, params)
             return data.get('items', [])
             
         except Exception as e:
@@ -76,18 +74,13 @@ class StackOverflowClient:
         try:
             url = f"{self.base_url}/users/{user_id}/answers"
             params = {
-                'site': 'stackoverflow',
                 'page': page,
                 'pagesize': page_size,
                 'order': 'desc',
-                'sort': 'activity',
-                'key': self.api_key if self.api_key else None
+                'sort': 'activity'
             }
             
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json(url, params)
             return data.get('items', [])
             
         except Exception as e:
@@ -99,18 +92,13 @@ class StackOverflowClient:
         try:
             url = f"{self.base_url}/users/{user_id}/questions"
             params = {
-                'site': 'stackoverflow',
                 'page': page,
                 'pagesize': page_size,
                 'order': 'desc',
-                'sort': 'activity',
-                'key': self.api_key if self.api_key else None
+                'sort': 'activity'
             }
             
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json(url, params)
             return data.get('items', [])
             
         except Exception as e:
@@ -121,15 +109,7 @@ class StackOverflowClient:
         """Get user's top tags from Stack Overflow"""
         try:
             url = f"{self.base_url}/users/{user_id}/top-tags"
-            params = {
-                'site': 'stackoverflow',
-                'key': self.api_key if self.api_key else None
-            }
-            
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json(url)
             return data.get('items', [])
             
         except Exception as e:
@@ -141,22 +121,17 @@ class StackOverflowClient:
         try:
             url = f"{self.base_url}/users"
             params = {
-                'site': 'stackoverflow',
                 'page': page,
                 'pagesize': page_size,
                 'order': 'desc',
-                'sort': 'reputation',
-                'key': self.api_key if self.api_key else None
+                'sort': 'reputation'
             }
             
             # Add tag filter if provided
             if tag:
                 params['inname'] = tag
             
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json(url, params)
             return data.get('items', [])
             
         except Exception as e:
@@ -168,23 +143,41 @@ class StackOverflowClient:
         try:
             url = f"{self.base_url}/tags"
             params = {
-                'site': 'stackoverflow',
                 'order': 'desc',
                 'sort': 'popular',
-                'pagesize': 100,
-                'key': self.api_key if self.api_key else None
+                'pagesize': 100
             }
             
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json(url, params)
             return data.get('items', [])
             
         except Exception as e:
             logger.error(f"Error fetching popular tags: {e}")
             return []
     
+    def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """GET an API URL as JSON, served from the response cache when a fresh copy exists"""
+        params = {**self.default_params, **(params or {})}
+        # The API key is left out of the key so cached responses never hold credentials
+        cache_key = make_cache_key("stackoverflow", url, params, exclude=('key',))
+        if self.response_cache:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        self.rate_limit_delay()
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        # The API asks clients to hold off for 'backoff' seconds under load; pause the limiter only then
+        if data.get('backoff'):
+            logger.warning(f"Stack Overflow API requested a {data['backoff']}s backoff")
+            self._limiter.pause(data['backoff'])
+        if self.response_cache:
+            self.response_cache.set(cache_key, data)
+        return data
+    
     def rate_limit_delay(self):
         """Respect rate limits"""
-        time.sleep(settings.rate_limit_delay) 
\ No newline at end of file
+        self._limiter.acquire() 
\ No newline at end of file
@@ -1,14 +1,18 @@
 """
 Database connection and session management
 """
-from sqlalchemy import create_engine
+import logging
+from sqlalchemy import create_engine, func, inspect, select
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
 from typing import Generator
 
 from src.config.settings import settings
-from src.database.models import Base
+from src.database.models import Base, DeveloperSkill
+
+logger = logging.getLogger(__name__)
 
 
 class DatabaseManager:
@@ -47,6 +51,43 @@ class DatabaseManager:
     def create_tables(self):
         """Create all database tables"""
         Base.metadata.create_all(bind=self.engine)
+        # create_all skips tables that already exist, so add indexes introduced since they were made
+        inspector = inspect(self.engine)
+        for table in Base.metadata.sorted_tables:
+            existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    self._create_index(table, index)
+    
+    def _create_index(self, table, index):
+        """Create an index on an existing table, migrating rows the index would reject first"""
+        try:
+            with self.engine.begin() as connection:
+                if index.name == 'uq_developer_skill':
+                    self._merge_duplicate_developer_skills(connection)
+                index.create(bind=connection)
+        except (IntegrityError, OperationalError) as e:
+            logger.error(f"Error creating index {index.name} on {table.name}: {e}")
+    
+    def _merge_duplicate_developer_skills(self, connection):
+        """One-off migration for uq_developer_skill: fold each duplicate (developer, skill) group into its earliest row"""
+        table = DeveloperSkill.__table__
+        duplicate = table.alias('duplicate')
+        same_pair = (duplicate.c.developer_id == table.c.developer_id) & (duplicate.c.skill_id == table.c.skill_id)
+        keep = select(func.min(table.c.id)).group_by(table.c.developer_id, table.c.skill_id)
+        
+        # Merge the same way the PostgreSQL upsert does: the strongest usage and proficiency win
+        connection.execute(table.update().where(table.c.id.in_(
+            keep.having(func.count() > 1)
+        )).values(
+            usage_frequency=select(func.max(duplicate.c.usage_frequency)).where(same_pair).scalar_subquery(),
+            proficiency_level=select(func.max(duplicate.c.proficiency_level)).where(same_pair).scalar_subquery(),
+            first_used_at=select(func.min(duplicate.c.first_used_at)).where(same_pair).scalar_subquery(),
+            last_used_at=select(func.max(duplicate.c.last_used_at)).where(same_pair).scalar_subquery()
+        ))
+        removed = connection.execute(table.delete().where(table.c.id.not_in(keep))).rowcount
+        if removed:
+            logger.warning(f"Merged {removed} duplicate developer skill rows before creating uq_developer_skill")
     
     def drop_tables(self):
         """Drop all database tables (use with caution!)"""
@@ -237,6 +237,7 @@ Index("idx_repository_github_id", Repository.github_id)
 Index("idx_commit_sha", Commit.sha)
 Index("idx_skill_name", Skill.name)
 Index("idx_developer_skill_proficiency", DeveloperSkill.proficiency_level)
+Index("uq_developer_skill", DeveloperSkill.developer_id, DeveloperSkill.skill_id, unique=True)
 Index("idx_job_posting_title", JobPosting.title)
 Index("idx_job_posting_company", JobPosting.company)
 Index("idx_job_posting_data_source", JobPosting.data_source)
@@ -4,10 +4,12 @@ Creates vector embeddings for skills, developers, and repositories using LLM.
 """
 
 import numpy as np
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import hashlib
 import json
+import threading
 
 from src.database.models import Developer, Repository, Skill, Commit
 from src.llm.llm_client import llm_client
@@ -15,6 +17,12 @@ from src.utils.logger import get_application_logger
 
 logger = get_application_logger(__name__)
 
+# Per-thread generators for hash-based embeddings (the global NumPy RNG is shared state)
+_rng_local = threading.local()
+
+# Number of recent query embeddings kept by get_query_embedding
+QUERY_EMBEDDING_CACHE_SIZE = 2048
+
 
 class EmbeddingGenerator:
     """Generates embeddings for various entities in the system."""
@@ -30,6 +38,8 @@ class EmbeddingGenerator:
         self._skill_embeddings_cache = {}
         self._developer_embeddings_cache = {}
         self._repository_embeddings_cache = {}
+        self._query_embeddings_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
     
     async def generate_skill_embedding(self, skill: Skill) -> np.ndarray:
         """
@@ -220,19 +230,48 @@ class EmbeddingGenerator:
         Returns:
             numpy array representing the embedding
         """
-        # Create a hash of the text
-        text_hash = hashlib.md5(text.encode()).hexdigest()
+        # Create a hash of the text and reduce it to a valid seed
+        seed = int.from_bytes(hashlib.md5(text.encode()).digest(), 'big') % (2**32 - 1)
+        
+        # Reseed a per-thread generator rather than NumPy's global one; this yields the
+        # same values as np.random.seed(seed) but is safe to call from worker threads
+        rng = getattr(_rng_local, 'rng', None)
+        if rng is None:
+            rng = _rng_local.rng = np.random.RandomState()
+        rng.seed(seed)
+        embedding = rng.normal(0, 1, dimension)
+        
+        # Normalize the embedding in place
+        embedding /= np.linalg.norm(embedding)
         
-        # Use the hash to seed a random number generator (ensure it's within valid range)
-        seed = int(text_hash, 16) % (2**32 - 1)  # Ensure seed is within valid range
-        np.random.seed(seed)
+        return embedding
+    
+    def get_query_embedding(self, text: str, dimension: int = 384) -> np.ndarray:
+        """
+        Get the hash-based embedding for a search query, memoized per text.
         
-        # Generate a random embedding
-        embedding = np.random.normal(0, 1, dimension)
+        Args:
+            text: Query text to embed
+            dimension: Dimension of the embedding
+            
+        Returns:
+            Read-only float32 numpy array (the precision Qdrant stores)
+        """
+        key = (text, dimension)
+        with self._query_cache_lock:
+            embedding = self._query_embeddings_cache.get(key)
+            if embedding is not None:
+                self._query_embeddings_cache.move_to_end(key)
+                return embedding
         
-        # Normalize the embedding
-        embedding = embedding / np.linalg.norm(embedding)
+        embedding = self._hash_based_embedding(text, dimension).astype(np.float32)
+        # Cached arrays are shared between callers
+        embedding.flags.writeable = False
         
+        with self._query_cache_lock:
+            self._query_embeddings_cache[key] = embedding
+            if len(self._query_embeddings_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embeddings_cache.popitem(last=False)
         return embedding
     
     def get_cached_embedding(self, entity_type: str, entity_id: int) -> Optional[np.ndarray]:
@@ -265,6 +304,8 @@ class EmbeddingGenerator:
             self._skill_embeddings_cache.clear()
             self._developer_embeddings_cache.clear()
             self._repository_embeddings_cache.clear()
+            with self._query_cache_lock:
+                self._query_embeddings_cache.clear()
         else:
             cache_map = {
                 'skill': self._skill_embeddings_cache,
@@ -13,7 +13,7 @@ import json
 from collections import defaultdict, Counter
 
 from src.knowledge_graph.graph_builder import knowledge_graph_builder
-from src.vector_store.qdrant_client import QdrantVectorClient
+from src.vector_store.qdrant_client import qdrant_client
 from src.embeddings.embedding_generator import embedding_generator
 from src.llm.llm_client import llm_client
 from src.database.connection import db_manager
@@ -86,7 +86,7 @@ class GraphRAGService:
             logger.info("Initializing Graph RAG service...")
             
             # Initialize components
-            self.qdrant_client = QdrantVectorClient()
+            self.qdrant_client = qdrant_client
             self.embedding_generator = embedding_generator
             self.llm_client = llm_client
             
@@ -122,7 +122,7 @@ class GraphRAGService:
                 return {"error": "Graph RAG service not initialized"}
             
             # Generate query embedding
-            query_embedding = self.embedding_generator._hash_based_embedding(query, 384).tolist()
+            query_embedding = self.embedding_generator.get_query_embedding(query, 384)
             
             # Step 1: Vector search for relevant entities
             vector_results = await self._perform_vector_search(query_embedding, query_type)
@@ -157,22 +157,22 @@ class GraphRAGService:
             
             # Search skills
             if query_type in ['career_guidance', 'skill_analysis', 'learning_path']:
-                skills = self.qdrant_client.search_similar_skills(query_embedding, top_k=5)
+                skills = await asyncio.to_thread(self.qdrant_client.search_similar_skills, query_embedding, top_k=5)
                 results['skills'] = skills
             
             # Search developers
             if query_type in ['networking', 'mentorship', 'collaboration']:
-                developers = self.qdrant_client.search_similar_developers(query_embedding, top_k=5)
+                developers = await asyncio.to_thread(self.qdrant_client.search_similar_developers, query_embedding, top_k=5)
                 results['developers'] = developers
             
             # Search repositories
             if query_type in ['project_ideas', 'code_examples', 'learning_resources']:
-                repositories = self.qdrant_client.search_similar_repositories(query_embedding, top_k=5)
+                repositories = await asyncio.to_thread(self.qdrant_client.search_similar_repositories, query_embedding, top_k=5)
                 results['repositories'] = repositories
             
             # Search job postings
             if query_type in ['career_guidance', 'job_market', 'salary_info']:
-                jobs = self.qdrant_client.search_similar_job_postings(query_embedding, top_k=5)
+                jobs = await asyncio.to_thread(self.qdrant_client.search_similar_job_postings, query_embedding, top_k=5)
                 results['jobs'] = jobs
             
             return results
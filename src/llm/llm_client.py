@@ -6,7 +6,7 @@ Handles interactions with various LLM providers for advanced AI features.
 import os
 import json
 import asyncio
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, AsyncIterator
 from abc import ABC, abstractmethod
 import openai
 from openai import AsyncOpenAI
@@ -27,6 +27,13 @@ class BaseLLMClient(ABC):
         """Generate text from a prompt."""
         pass
     
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Stream generated text in chunks (defaults to a single chunk); raises instead of yielding errors."""
+        text = await self.generate_text(prompt, **kwargs)
+        if text.startswith("Error:"):
+            raise RuntimeError(text)
+        yield text
+    
     @abstractmethod
     async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for a list of texts."""
@@ -87,6 +94,42 @@ class OpenAILLMClient(BaseLLMClient):
             logger.error(f"Error generating text with OpenAI: {e}")
             return f"Error: {str(e)}"
     
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream text from OpenAI's GPT model as it is generated.
+        
+        Args:
+            prompt: Input prompt
+            **kwargs: Additional parameters (model, temperature, max_tokens, etc.)
+            
+        Yields:
+            Text chunks in generation order
+            
+        Raises:
+            The provider's exception if generation fails, possibly after some chunks
+        """
+        try:
+            model = kwargs.get('model', self.model)
+            temperature = kwargs.get('temperature', 0.7)
+            max_tokens = kwargs.get('max_tokens', 1000)
+            
+            stream = await self.client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+            
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                    
+        except Exception as e:
+            logger.error(f"Error streaming text with OpenAI: {e}")
+            # Text already streamed can't be retracted, so failures surface as errors, not as text
+            raise
+    
     async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings using OpenAI's embedding model.
@@ -228,6 +271,39 @@ class AnthropicLLMClient(BaseLLMClient):
             logger.error(f"Error generating text with Anthropic: {e}")
             return f"Error: {str(e)}"
     
+    async def stream_text(self, prompt: str, **kwargs) -> AsyncIterator[str]:
+        """
+        Stream text from Anthropic's Claude model as it is generated.
+        
+        Args:
+            prompt: Input prompt
+            **kwargs: Additional parameters (model, temperature, max_tokens, etc.)
+            
+        Yields:
+            Text chunks in generation order
+            
+        Raises:
+            The provider's exception if generation fails, possibly after some chunks
+        """
+        try:
+            model = kwargs.get('model', self.model)
+            temperature = kwargs.get('temperature', 0.7)
+            max_tokens = kwargs.get('max_tokens', 1000)
+            
+            async with self.client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                    
+        except Exception as e:
+            logger.error(f"Error streaming text with Anthropic: {e}")
+            # Text already streamed can't be retracted, so failures surface as errors, not as text
+            raise
+    
     async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings using Anthropic's embedding model.
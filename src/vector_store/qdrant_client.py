@@ -4,8 +4,10 @@ High-performance vector search and storage for career insights
 """
 
 import os
+import time
+import uuid
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import Distance, VectorParams, PointStruct
@@ -21,6 +23,24 @@ load_dotenv()
 
 logger = get_logger(__name__)
 
+# INT8 scalar quantization keeps a compact in-RAM copy of every vector for the HNSW
+# search; the full-precision originals stay on disk for rescoring
+INT8_QUANTIZATION = models.ScalarQuantization(
+    scalar=models.ScalarQuantizationConfig(
+        type=models.ScalarType.INT8,
+        quantile=0.99,
+        always_ram=True
+    )
+)
+# Search the int8 copies with 2x oversampling, then rescore the candidates at full precision
+QUANTIZED_SEARCH_PARAMS = models.SearchParams(
+    quantization=models.QuantizationSearchParams(
+        ignore=False,
+        rescore=True,
+        oversampling=2.0
+    )
+)
+
 
 class QdrantVectorClient:
     """
@@ -53,9 +73,12 @@ class QdrantVectorClient:
             self.client = QdrantClient(":memory:")
             self._is_cloud = False
         else:
+            # One client per process: it keeps its HTTP (or gRPC) connections alive
+            # across searches, so callers should share the module-level instance
             self.client = QdrantClient(
                 url=self.cloud_url,
-                api_key=self.api_key
+                api_key=self.api_key,
+                prefer_grpc=os.getenv('QDRANT_PREFER_GRPC', 'false').lower() == 'true'
             )
             self._is_cloud = True
             logger.info("✅ Connected to Qdrant Cloud")
@@ -86,7 +109,8 @@ class QdrantVectorClient:
                 optimizers_config=models.OptimizersConfigDiff(
                     memmap_threshold=20000,
                     indexing_threshold=20000
-                )
+                ),
+                quantization_config=INT8_QUANTIZATION
             )
             
             logger.info(f"✅ Created skills collection: {collection_name}")
@@ -116,7 +140,8 @@ class QdrantVectorClient:
                 optimizers_config=models.OptimizersConfigDiff(
                     memmap_threshold=20000,
                     indexing_threshold=20000
-                )
+                ),
+                quantization_config=INT8_QUANTIZATION
             )
             
             logger.info(f"✅ Created developers collection: {collection_name}")
@@ -146,7 +171,8 @@ class QdrantVectorClient:
                 optimizers_config=models.OptimizersConfigDiff(
                     memmap_threshold=20000,
                     indexing_threshold=20000
-                )
+                ),
+                quantization_config=INT8_QUANTIZATION
             )
             
             logger.info(f"✅ Created repositories collection: {collection_name}")
@@ -176,7 +202,8 @@ class QdrantVectorClient:
                 optimizers_config=models.OptimizersConfigDiff(
                     memmap_threshold=20000,
                     indexing_threshold=20000
-                )
+                ),
+                quantization_config=INT8_QUANTIZATION
             )
             
             logger.info(f"✅ Created career paths collection: {collection_name}")
@@ -206,7 +233,8 @@ class QdrantVectorClient:
                 optimizers_config=models.OptimizersConfigDiff(
                     memmap_threshold=20000,
                     indexing_threshold=20000
-                )
+                ),
+                quantization_config=INT8_QUANTIZATION
             )
             
             logger.info(f"✅ Created job postings collection: {collection_name}")
@@ -216,6 +244,37 @@ class QdrantVectorClient:
             logger.error(f"Failed to create job postings collection: {e}")
             return False
     
+    def create_response_cache_collection(self, dimension: int = 384) -> bool:
+        """Create collection for cached chatbot responses"""
+        collection_name = self._get_collection_name("chatbot_response_cache")
+        
+        try:
+            collections = self.client.get_collections()
+            if any(col.name == collection_name for col in collections.collections):
+                logger.info(f"Collection {collection_name} already exists")
+            else:
+                self.client.create_collection(
+                    collection_name=collection_name,
+                    vectors_config=VectorParams(
+                        size=dimension,
+                        distance=Distance.COSINE
+                    )
+                )
+                logger.info(f"✅ Created response cache collection: {collection_name}")
+            
+            # Every lookup filters on these; also added to collections created before they were indexed
+            self.client.create_payload_index(
+                collection_name=collection_name, field_name='handler', field_schema=models.PayloadSchemaType.KEYWORD
+            )
+            self.client.create_payload_index(
+                collection_name=collection_name, field_name='expires_at', field_schema=models.PayloadSchemaType.FLOAT
+            )
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to create response cache collection: {e}")
+            return False
+    
     def insert_skills(self, skills_data: List[Dict[str, Any]]) -> bool:
         """Insert skill vectors into collection"""
         collection_name = self._get_collection_name("skills")
@@ -388,6 +447,7 @@ class QdrantVectorClient:
                         'experience_level': job.get('experience_level', ''),
                         'remote_option': job.get('remote_option', False),
                         'data_source': job.get('data_source', ''),  # indeed
+                        'data_source_label': (job.get('data_source') or '').title(),  # display form, e.g. Indeed
                         'source_id': job.get('source_id', ''),
                         'posted_date': job.get('posted_date', datetime.now().isoformat()),
                         'created_at': job.get('created_at', datetime.now().isoformat())
@@ -407,7 +467,7 @@ class QdrantVectorClient:
             logger.error(f"Failed to insert job postings: {e}")
             return False
     
-    def search_similar_skills(self, query_vector: List[float], top_k: int = 5, 
+    def search_similar_skills(self, query_vector: Union[List[float], np.ndarray], top_k: int = 5, 
                             filter_conditions: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """Search for similar skills"""
         collection_name = self._get_collection_name("skills")
@@ -418,6 +478,7 @@ class QdrantVectorClient:
                 query_vector=query_vector,
                 limit=top_k,
                 query_filter=self._build_filter(filter_conditions),
+                search_params=QUANTIZED_SEARCH_PARAMS,
                 with_payload=True,
                 with_vectors=False
             )
@@ -440,7 +501,7 @@ class QdrantVectorClient:
             logger.error(f"Failed to search similar skills: {e}")
             return []
     
-    def search_similar_developers(self, query_vector: List[float], top_k: int = 5,
+    def search_similar_developers(self, query_vector: Union[List[float], np.ndarray], top_k: int = 5,
                                 filter_conditions: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """Search for similar developers"""
         collection_name = self._get_collection_name("developers")
@@ -451,6 +512,7 @@ class QdrantVectorClient:
                 query_vector=query_vector,
                 limit=top_k,
                 query_filter=self._build_filter(filter_conditions),
+                search_params=QUANTIZED_SEARCH_PARAMS,
                 with_payload=True,
                 with_vectors=False
             )
@@ -474,7 +536,7 @@ class QdrantVectorClient:
             logger.error(f"Failed to search similar developers: {e}")
             return []
     
-    def search_similar_repositories(self, query_vector: List[float], top_k: int = 5,
+    def search_similar_repositories(self, query_vector: Union[List[float], np.ndarray], top_k: int = 5,
                                   filter_conditions: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """Search for similar repositories"""
         collection_name = self._get_collection_name("repositories")
@@ -485,6 +547,7 @@ class QdrantVectorClient:
                 query_vector=query_vector,
                 limit=top_k,
                 query_filter=self._build_filter(filter_conditions),
+                search_params=QUANTIZED_SEARCH_PARAMS,
                 with_payload=True,
                 with_vectors=False
             )
@@ -508,7 +571,7 @@ class QdrantVectorClient:
             logger.error(f"Failed to search similar repositories: {e}")
             return []
     
-    def search_similar_career_paths(self, query_vector: List[float], top_k: int = 5,
+    def search_similar_career_paths(self, query_vector: Union[List[float], np.ndarray], top_k: int = 5,
                                   filter_conditions: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """Search for similar career paths"""
         collection_name = self._get_collection_name("career_paths")
@@ -519,6 +582,7 @@ class QdrantVectorClient:
                 query_vector=query_vector,
                 limit=top_k,
                 query_filter=self._build_filter(filter_conditions),
+                search_params=QUANTIZED_SEARCH_PARAMS,
                 with_payload=True,
                 with_vectors=False
             )
@@ -542,7 +606,7 @@ class QdrantVectorClient:
             logger.error(f"Failed to search similar career paths: {e}")
             return []
     
-    def search_similar_job_postings(self, query_vector: List[float], top_k: int = 5,
+    def search_similar_job_postings(self, query_vector: Union[List[float], np.ndarray], top_k: int = 5,
                                   filter_conditions: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """Search for similar job postings"""
         collection_name = self._get_collection_name("job_postings")
@@ -553,6 +617,7 @@ class QdrantVectorClient:
                 query_vector=query_vector,
                 limit=top_k,
                 query_filter=self._build_filter(filter_conditions),
+                search_params=QUANTIZED_SEARCH_PARAMS,
                 with_payload=True,
                 with_vectors=False
             )
@@ -572,6 +637,7 @@ class QdrantVectorClient:
                     'experience_level': hit.payload.get('experience_level'),
                     'remote_option': hit.payload.get('remote_option', False),
                     'data_source': hit.payload.get('data_source'),  # indeed
+                    'data_source_label': hit.payload.get('data_source_label'),
                     'posted_date': hit.payload.get('posted_date'),
                     'score': hit.score
                 })
@@ -582,6 +648,74 @@ class QdrantVectorClient:
             logger.error(f"Failed to search similar job postings: {e}")
             return []
     
+    def search_cached_response(self, query_vector: Union[List[float], np.ndarray], handler: str,
+                               score_threshold: float = 0.95) -> Optional[Dict[str, Any]]:
+        """Return an unexpired cached response for a near-identical query, if any"""
+        collection_name = self._get_collection_name("chatbot_response_cache")
+        
+        try:
+            search_result = self.client.search(
+                collection_name=collection_name,
+                query_vector=query_vector,
+                limit=1,
+                score_threshold=score_threshold,
+                query_filter=models.Filter(must=[
+                    models.FieldCondition(key='handler', match=models.MatchValue(value=handler)),
+                    models.FieldCondition(key='expires_at', range=models.Range(gt=time.time()))
+                ]),
+                with_payload=True,
+                with_vectors=False
+            )
+            
+            return search_result[0].payload.get('response') if search_result else None
+            
+        except Exception as e:
+            logger.error(f"Failed to search cached responses: {e}")
+            return None
+    
+    def cache_response(self, query_vector: Union[List[float], np.ndarray], handler: str,
+                       message: str, response: Dict[str, Any], ttl: int = 3600) -> bool:
+        """Store a chatbot response keyed by its query embedding"""
+        collection_name = self._get_collection_name("chatbot_response_cache")
+        
+        try:
+            self.client.upsert(
+                collection_name=collection_name,
+                points=[PointStruct(
+                    # Deterministic id so repeated questions overwrite rather than accumulate
+                    id=str(uuid.uuid5(uuid.NAMESPACE_URL, f"{handler}:{message}")),
+                    vector=query_vector,
+                    payload={
+                        'handler': handler,
+                        'message': message,
+                        'response': response,
+                        'expires_at': time.time() + ttl
+                    }
+                )]
+            )
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to cache response: {e}")
+            return False
+    
+    def purge_expired_responses(self) -> bool:
+        """Delete cached responses whose TTL has elapsed"""
+        collection_name = self._get_collection_name("chatbot_response_cache")
+        
+        try:
+            self.client.delete(
+                collection_name=collection_name,
+                points_selector=models.FilterSelector(filter=models.Filter(must=[
+                    models.FieldCondition(key='expires_at', range=models.Range(lte=time.time()))
+                ]))
+            )
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to purge expired responses: {e}")
+            return False
+    
     def _build_filter(self, filter_conditions: Optional[Dict]) -> Optional[models.Filter]:
         """Build Qdrant filter from conditions"""
         if not filter_conditions: